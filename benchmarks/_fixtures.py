@@ -0,0 +1,70 @@
+"""Sample instances for every public schema class, shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+import sys
+import types
+from dataclasses import fields, is_dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Union, get_args, get_origin, get_type_hints
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import metaspn_schemas  # noqa: E402
+from metaspn_schemas.utils.serde import Serializable  # noqa: E402
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def public_schema_classes() -> list[type]:
+    classes = []
+    for name in metaspn_schemas.__all__:
+        candidate = getattr(metaspn_schemas, name)
+        if isinstance(candidate, type) and is_dataclass(candidate) and issubclass(candidate, Serializable):
+            classes.append(candidate)
+    return sorted(classes, key=lambda cls: cls.__name__)
+
+
+def sample_instance(cls: type) -> Any:
+    """Build an instance of ``cls`` with every field populated, optional ones included."""
+    hints = get_type_hints(cls)
+    kwargs = {f.name: _sample_value(f.name, hints.get(f.name, Any)) for f in fields(cls) if f.init}
+    return cls(**kwargs)
+
+
+def sample_instances() -> dict[type, Any]:
+    return {cls: sample_instance(cls) for cls in public_schema_classes()}
+
+
+def _sample_value(name: str, hint: Any) -> Any:
+    if name == "schema_version":
+        return "0.9"
+    origin = get_origin(hint)
+    args = get_args(hint)
+    if origin in (Union, types.UnionType):
+        return _sample_value(name, next(arg for arg in args if arg is not type(None)))
+    if origin is tuple:
+        item = args[0] if args else str
+        return tuple(_sample_value(f"{name}_{i}", item) for i in (2, 1))
+    if origin is list:
+        return [_sample_value(f"{name}_{i}", args[0] if args else str) for i in (2, 1)]
+    if origin is dict:
+        value_hint = args[1] if len(args) > 1 else Any
+        return {f"{name}_{i}": _sample_value(name, value_hint) for i in (2, 1)}
+    if hint is Any:
+        return {"z": {"b": 2, "a": 1}, "a": [1, 2, 3], "text": "hello"}
+    if hint is datetime:
+        return NOW
+    if hint is bool:
+        return True
+    if hint is int:
+        return 42
+    if hint is float:
+        return 0.75
+    if hint is str:
+        return f"{name}_value"
+    if isinstance(hint, type) and is_dataclass(hint):
+        return sample_instance(hint)
+    raise TypeError(f"no sample for {name}: {hint!r}")
+
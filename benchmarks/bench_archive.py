@@ -0,0 +1,82 @@
+"""``SignalArchive`` id lookups and time-range scans vs rescanning an NDJSON archive.
+
+Run with ``python benchmarks/bench_archive.py [--count N] [--lookups N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from dataclasses import replace
+from datetime import timedelta
+
+from _fixtures import NOW, sample_instance
+
+from metaspn_schemas import SignalArchive, SignalEnvelope
+from metaspn_schemas.io import read_ndjson, write_ndjson
+
+
+def _timed(func):  # type: ignore[no-untyped-def]
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=50_000)
+    parser.add_argument("--lookups", type=int, default=100)
+    args = parser.parse_args()
+
+    template = sample_instance(SignalEnvelope)
+    signals = [
+        replace(template, signal_id=f"s_{index:08d}", timestamp=NOW + timedelta(seconds=index))
+        for index in range(args.count)
+    ]
+    wanted = random.Random(7).sample([signal.signal_id for signal in signals], args.lookups)
+    start = NOW + timedelta(seconds=args.count // 2)
+    end = start + timedelta(seconds=args.count // 100)
+
+    with tempfile.TemporaryDirectory() as directory:
+        ndjson_path = os.path.join(directory, "signals.ndjson")
+        archive_path = os.path.join(directory, "signals.arc")
+        _, ndjson_write = _timed(lambda: write_ndjson(ndjson_path, signals))
+
+        def build() -> None:
+            with SignalArchive(archive_path, writable=True) as archive:
+                archive.extend(signals)
+
+        _, archive_write = _timed(build)
+        print(
+            f"{args.count} envelopes: ndjson {os.path.getsize(ndjson_path) / 2**20:.1f} MiB "
+            f"({ndjson_write:.2f}s), archive {os.path.getsize(archive_path) / 2**20:.1f} MiB "
+            f"+ index {os.path.getsize(archive_path + '.idx') / 2**20:.1f} MiB ({archive_write:.2f}s)"
+        )
+
+        wanted_set = set(wanted)
+        found, scan_lookup = _timed(
+            lambda: [signal for signal in read_ndjson(ndjson_path, SignalEnvelope) if signal.signal_id in wanted_set]
+        )
+        archive, open_time = _timed(lambda: SignalArchive(archive_path))
+        with archive:
+            hits, archive_lookup = _timed(lambda: [archive[signal_id] for signal_id in wanted])
+            assert sorted(hits, key=lambda s: s.signal_id) == sorted(found, key=lambda s: s.signal_id)
+            print(f"open (load index): {open_time * 1e3:.1f} ms")
+            print(f"{args.lookups} id lookups: ndjson scan {scan_lookup:.2f}s, archive {archive_lookup * 1e3:.2f} ms")
+
+            window, scan_range = _timed(
+                lambda: [s for s in read_ndjson(ndjson_path, SignalEnvelope) if start <= s.timestamp < end]
+            )
+            ranged, archive_range = _timed(lambda: list(archive.scan(start, end)))
+            assert ranged == window
+            print(
+                f"1% time window ({len(window)} rows): ndjson scan {scan_range:.2f}s, "
+                f"archive {archive_range * 1e3:.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Compare per-row ``from_dict`` with column-wise ``from_dicts`` on 10k-row pages.
+
+Run with ``python benchmarks/bench_batch_decode.py [--rows N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from _fixtures import sample_instance
+
+from metaspn_schemas import (
+    GateTransitionAttempt,
+    OutcomeWindowEvaluation,
+    SignalEnvelope,
+    StakeAccountView,
+    TokenOutcomeWindow,
+)
+
+CLASSES = (GateTransitionAttempt, OutcomeWindowEvaluation, SignalEnvelope, StakeAccountView, TokenOutcomeWindow)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'class':<28} {'from_dict':>11} {'from_dicts':>11} {'lazy':>11} {'x':>5}")
+    for cls in CLASSES:
+        rows = [sample_instance(cls).to_dict() for _ in range(args.rows)]
+        assert cls.from_dicts(rows) == [cls.from_dict(row) for row in rows]
+
+        per_row = min(timeit.repeat(lambda: [cls.from_dict(row) for row in rows], number=1, repeat=args.repeat))
+        batch = min(timeit.repeat(lambda: cls.from_dicts(rows), number=1, repeat=args.repeat))
+        lazy = min(timeit.repeat(lambda: list(cls.from_dicts(rows, lazy=True)), number=1, repeat=args.repeat))
+        print(f"{cls.__name__:<28} {per_row * 1e3:>9.1f}ms {batch * 1e3:>9.1f}ms {lazy * 1e3:>9.1f}ms {per_row / batch:>4.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Compare per-object ``to_dict`` with batch ``to_dicts`` (dict and tuple rows).
+
+Run with ``python benchmarks/bench_batch_encode.py [--rows N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from _fixtures import sample_instance
+
+from metaspn_schemas import EmissionEnvelope, SignalEnvelope, StakeAccountView
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'class':<20} {'privacy':<8} {'to_dict':>10} {'to_dicts':>10} {'tuples':>10}")
+    for cls in (SignalEnvelope, EmissionEnvelope, StakeAccountView):
+        objs = [sample_instance(cls) for _ in range(args.rows)]
+        for privacy_mode in (False, True):
+            per_obj = min(
+                timeit.repeat(
+                    lambda: [o.to_dict(privacy_mode=privacy_mode) for o in objs], number=1, repeat=args.repeat
+                )
+            )
+            batch = min(
+                timeit.repeat(
+                    lambda: cls.to_dicts(objs, privacy_mode=privacy_mode), number=1, repeat=args.repeat
+                )
+            )
+            tuples = min(
+                timeit.repeat(
+                    lambda: cls.to_dicts(objs, privacy_mode=privacy_mode, as_tuples=True),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            print(
+                f"{cls.__name__:<20} {str(privacy_mode):<8} {per_obj * 1e3:>8.1f}ms"
+                f" {batch * 1e3:>8.1f}ms {tuples * 1e3:>8.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Binary codec vs ``json.dumps(obj.to_dict())``: encoded size and encode/decode time per class.
+
+Run with ``python benchmarks/bench_binary.py [--number N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+
+from _fixtures import sample_instances
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2_000)
+    args = parser.parse_args()
+    number = args.number
+
+    print(f"{'class':<32} {'json B':>7} {'bin B':>6} {'json enc':>9} {'bin enc':>8} {'json dec':>9} {'bin dec':>8}")
+    totals = [0, 0]
+    for cls, obj in sample_instances().items():
+        text = json.dumps(obj.to_dict()).encode("utf-8")
+        blob = obj.to_binary()
+        assert cls.from_binary(blob) == obj
+        totals[0] += len(text)
+        totals[1] += len(blob)
+        timings = [
+            timeit.timeit(lambda: json.dumps(obj.to_dict()).encode("utf-8"), number=number),
+            timeit.timeit(obj.to_binary, number=number),
+            timeit.timeit(lambda: cls.from_dict(json.loads(text)), number=number),
+            timeit.timeit(lambda: cls.from_binary(blob), number=number),
+        ]
+        micros = [seconds / number * 1e6 for seconds in timings]
+        print(
+            f"{cls.__name__:<32} {len(text):>7} {len(blob):>6} "
+            f"{micros[0]:>7.1f}us {micros[1]:>6.1f}us {micros[2]:>7.1f}us {micros[3]:>6.1f}us"
+        )
+    print(f"total size: json {totals[0]} B, binary {totals[1]} B ({totals[1] / totals[0]:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Compare compiled per-class codecs against the reflective serde they replaced.
+
+Run with ``python benchmarks/bench_codecs.py [--number N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+import types
+from dataclasses import MISSING, fields, is_dataclass
+from datetime import datetime
+from typing import Any, Union, get_args, get_origin, get_type_hints
+
+from _fixtures import sample_instances
+
+from metaspn_schemas.utils.serde import dataclass_from_dict, dataclass_to_dict
+from metaspn_schemas.utils.time import datetime_to_str, str_to_datetime
+
+
+def reflective_to_dict(obj: Any, *, privacy_mode: bool = False) -> dict[str, Any]:
+    output: dict[str, Any] = {}
+    for f in fields(obj):
+        if privacy_mode and f.metadata.get("omit_in_privacy_mode"):
+            continue
+        output[f.name] = _reflective_primitive(getattr(obj, f.name), privacy_mode=privacy_mode)
+    return output
+
+
+def _reflective_primitive(value: Any, *, privacy_mode: bool) -> Any:
+    if is_dataclass(value):
+        return reflective_to_dict(value, privacy_mode=privacy_mode)
+    if isinstance(value, datetime):
+        return datetime_to_str(value)
+    if isinstance(value, (tuple, list)):
+        return [_reflective_primitive(v, privacy_mode=privacy_mode) for v in value]
+    if isinstance(value, dict):
+        return {k: _reflective_primitive(v, privacy_mode=privacy_mode) for k, v in sorted(value.items())}
+    return value
+
+
+def reflective_from_dict(cls: type, data: dict[str, Any]) -> Any:
+    hints = get_type_hints(cls)
+    kwargs: dict[str, Any] = {}
+    for f in fields(cls):
+        hint = hints.get(f.name, Any)
+        if f.name in data:
+            kwargs[f.name] = _reflective_coerce(hint, data[f.name])
+        elif f.default is not MISSING:
+            kwargs[f.name] = f.default
+        elif f.default_factory is not MISSING:  # type: ignore[attr-defined]
+            kwargs[f.name] = f.default_factory()  # type: ignore[misc]
+        else:
+            raise ValueError(f"Missing required field: {f.name}")
+    return cls(**kwargs)
+
+
+def _reflective_coerce(hint: Any, value: Any) -> Any:
+    if value is None or hint is Any:
+        return value
+    origin = get_origin(hint)
+    args = get_args(hint)
+    if hint is datetime:
+        return value if isinstance(value, datetime) else str_to_datetime(value)
+    if origin in (Union, types.UnionType):
+        last_error: Exception | None = None
+        for option in args:
+            if option is type(None):
+                continue
+            try:
+                return _reflective_coerce(option, value)
+            except Exception as err:  # noqa: BLE001
+                last_error = err
+        if last_error is not None:
+            raise last_error
+        return value
+    if origin is tuple:
+        return tuple(_reflective_coerce(args[0] if args else Any, item) for item in value)
+    if origin is list:
+        return [_reflective_coerce(args[0] if args else Any, item) for item in value]
+    if origin is dict:
+        return {
+            _reflective_coerce(args[0], k): _reflective_coerce(args[1], v) for k, v in value.items()
+        }
+    if is_dataclass(hint):
+        if isinstance(value, hint):
+            return value
+        if isinstance(value, dict):
+            return reflective_from_dict(hint, value)
+    if hint in (str, int, float, bool):
+        return hint(value)
+    return value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'class':<32} {'enc old':>9} {'enc new':>9} {'x':>5} {'dec old':>9} {'dec new':>9} {'x':>5}")
+    for cls, instance in sample_instances().items():
+        data = dataclass_to_dict(instance)
+        assert data == reflective_to_dict(instance)
+        assert dataclass_from_dict(cls, data) == reflective_from_dict(cls, data)
+
+        enc_old = timeit.timeit(lambda: reflective_to_dict(instance), number=args.number)
+        enc_new = timeit.timeit(lambda: dataclass_to_dict(instance), number=args.number)
+        dec_old = timeit.timeit(lambda: reflective_from_dict(cls, data), number=args.number)
+        dec_new = timeit.timeit(lambda: dataclass_from_dict(cls, data), number=args.number)
+        scale = 1e6 / args.number
+        print(
+            f"{cls.__name__:<32} {enc_old * scale:>7.2f}us {enc_new * scale:>7.2f}us {enc_old / enc_new:>4.1f}x"
+            f" {dec_old * scale:>7.2f}us {dec_new * scale:>7.2f}us {dec_old / dec_new:>4.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Repeated ``parse_state_machine_config`` on the same payload, with and without the cache.
+
+Run with ``python benchmarks/bench_config_cache.py [--states N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from bench_state_engine import build_config
+
+from metaspn_schemas import (
+    clear_state_machine_config_cache,
+    parse_state_machine_config,
+    set_state_machine_config_cache_size,
+    validate_state_machine_config,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--states", type=int, default=200)
+    args = parser.parse_args()
+
+    payload = build_config(args.states).to_dict()
+
+    def pickup() -> None:
+        config = parse_state_machine_config(payload)
+        validate_state_machine_config(config)
+
+    set_state_machine_config_cache_size(0)
+    uncached = min(timeit.repeat(pickup, number=20, repeat=3)) / 20
+    set_state_machine_config_cache_size(128)
+    clear_state_machine_config_cache()
+    cached = min(timeit.repeat(pickup, number=20, repeat=3)) / 20
+    print(f"parse + validate, uncached {uncached * 1000:8.2f} ms")
+    print(f"parse + validate, cached   {cached * 1000:8.2f} ms  ({uncached / cached:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Time-window pruning by ``signal_id`` range vs decoding envelopes to read ``timestamp``.
+
+Builds ``--count`` time-ordered ``signal_id`` values (one per millisecond) and their
+JSON envelopes, then selects a 1% window both ways.
+Run with ``python benchmarks/bench_id_ranges.py [--count N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import replace
+from datetime import timedelta
+
+from _fixtures import NOW, sample_instance
+
+from metaspn_schemas import SignalEnvelope
+from metaspn_schemas.utils.ids import _UUID7_BITS, _millis, max_id_for_time, min_id_for_time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    template = sample_instance(SignalEnvelope)
+    base_ms = _millis(NOW)
+    # One ID per millisecond, laid out as generate_id(time_ordered=True) would at that time.
+    ids = [f"s_{((base_ms + index) << 80) | _UUID7_BITS | index:032x}" for index in range(args.count)]
+    rows = [
+        json.dumps(replace(template, signal_id=signal_id, timestamp=NOW + timedelta(milliseconds=index)).to_dict())
+        for index, signal_id in enumerate(ids)
+    ]
+    start = NOW + timedelta(milliseconds=args.count // 2)
+    end = start + timedelta(milliseconds=args.count // 100 - 1)
+
+    started = time.perf_counter()
+    by_time = [row for row in rows if start <= SignalEnvelope.from_dict(json.loads(row)).timestamp <= end]
+    decode_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    low, high = min_id_for_time("signal", start), max_id_for_time("signal", end)
+    by_id = rows[bisect_left(ids, low) : bisect_right(ids, high)]
+    range_elapsed = time.perf_counter() - started
+
+    assert by_id == by_time
+    print(
+        f"{len(by_id)} of {args.count} rows: decode+filter {decode_elapsed * 1e3:.1f} ms, "
+        f"id key range {range_elapsed * 1e3:.3f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
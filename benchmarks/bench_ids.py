@@ -0,0 +1,47 @@
+"""ID generation: ``uuid.uuid4().hex`` baseline vs pooled random and time-ordered IDs.
+
+Run with ``python benchmarks/bench_ids.py [--number N] [--batch N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+import uuid
+
+import _fixtures  # noqa: F401  (puts src/ on sys.path)
+
+from metaspn_schemas.utils.ids import VALID_PREFIXES, generate_id, generate_ids
+
+
+def _uuid4_id(prefix: str) -> str:
+    # generate_id as it was: one uuid4() (one os.urandom call) and prefix normalization per ID.
+    token = uuid.uuid4().hex
+    normalized = prefix.strip().lower()
+    return f"{VALID_PREFIXES.get(normalized, normalized)}_{token}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=1_000)
+    args = parser.parse_args()
+    number, batch = args.number, args.batch
+    rounds = max(1, number // batch)
+
+    cases = [
+        ("uuid4 per id", lambda: _uuid4_id("signal"), number, 1),
+        ("generate_id", lambda: generate_id("signal"), number, 1),
+        ("generate_id time_ordered", lambda: generate_id("signal", time_ordered=True), number, 1),
+        (f"generate_ids x{batch}", lambda: generate_ids("signal", batch), rounds, batch),
+        (f"generate_ids x{batch} time_ordered", lambda: generate_ids("signal", batch, time_ordered=True), rounds, batch),
+    ]
+    baseline = None
+    for label, func, calls, per_call in cases:
+        micros = timeit.timeit(func, number=calls) / (calls * per_call) * 1e6
+        baseline = baseline or micros
+        print(f"{label:<36} {micros:>6.2f} us/id   {baseline / micros:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
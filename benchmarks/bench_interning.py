@@ -0,0 +1,100 @@
+"""Memory of decoded ``SignalEnvelope`` + ``EntityRef`` objects with and without field interning.
+
+Each row is parsed with ``json.loads`` (so every string starts as a fresh object,
+as when reading an archive) and decoded with ``from_dicts``. The baseline run
+compiles the codecs with interning switched off. Values come from small realistic
+vocabularies: a few sources, payload types, ref types and platforms, one schema version.
+Run with ``python benchmarks/bench_interning.py [--count N]`` (default 1,000,000).
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+import _fixtures  # noqa: F401  (puts src/ on sys.path)
+
+from metaspn_schemas import SignalEnvelope
+from metaspn_schemas.utils import serde
+
+SOURCES = ("linkedin.webhook", "x.firehose", "gmail.sync", "calendar.sync", "crm.import", "scorer.m1")
+PAYLOAD_TYPES = ("SocialPostSeen", "ProfileSnapshotSeen", "MessageSent", "ReplyReceived", "MeetingBooked")
+REF_TYPES = ("entity_id", "email", "handle")
+PLATFORMS = ("linkedin", "x", "email", None)
+
+
+def _rows(count: int) -> list[str]:
+    rows = []
+    for index in range(count):
+        platform = PLATFORMS[index % len(PLATFORMS)]
+        ref = {"ref_type": REF_TYPES[index % len(REF_TYPES)], "value": f"ent_{index}", "schema_version": "0.9"}
+        if platform is not None:
+            ref["platform"] = platform
+        rows.append(
+            json.dumps(
+                {
+                    "signal_id": f"s_{index:032x}",
+                    "timestamp": "2026-01-01T12:00:00Z",
+                    "source": SOURCES[index % len(SOURCES)],
+                    "payload_type": PAYLOAD_TYPES[index % len(PAYLOAD_TYPES)],
+                    "payload": {"n": index},
+                    "schema_version": "0.9",
+                    "entity_refs": [ref],
+                }
+            )
+        )
+    return rows
+
+
+def _decode(rows: list[str], chunk: int = 10_000) -> list[SignalEnvelope]:
+    decoded = []
+    for offset in range(0, len(rows), chunk):
+        decoded.extend(SignalEnvelope.from_dicts([json.loads(row) for row in rows[offset : offset + chunk]]))
+    return decoded
+
+
+def _measure(rows: list[str]) -> tuple[float, float]:
+    """Bytes held by the decoded objects, and decode time (timed on up to 100k rows without tracing)."""
+    sample = rows[:100_000]
+    started = time.perf_counter()
+    _decode(sample)
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    tracemalloc.start()
+    kept = _decode(rows)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return current, elapsed / len(sample) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+    rows = _rows(args.count)
+
+    interning = serde._interning
+    try:
+        serde._interning = lambda decode, hint: decode
+        serde._CODECS.clear()
+        plain_bytes, plain_time = _measure(rows)
+    finally:
+        serde._interning = interning
+        serde._CODECS.clear()
+    interned_bytes, interned_time = _measure(rows)
+
+    print(f"{args.count:,} SignalEnvelope + EntityRef objects")
+    print(f"  without interning: {plain_bytes / 2**20:>8.1f} MiB  ({plain_time:.1f} us/row decode)")
+    print(f"  with interning:    {interned_bytes / 2**20:>8.1f} MiB  ({interned_time:.1f} us/row decode)")
+    print(
+        f"  saved {(plain_bytes - interned_bytes) / 2**20:.1f} MiB "
+        f"({1 - interned_bytes / plain_bytes:.0%}), {(plain_bytes - interned_bytes) / args.count:.0f} B per envelope"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""One-pass ``to_json()`` vs ``json.dumps(to_dict(), sort_keys=True, separators=(",", ":"))``.
+
+Run with ``python benchmarks/bench_json.py [--number N] [--batch N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import timeit
+
+from _fixtures import sample_instance, sample_instances
+
+from metaspn_schemas import SignalEnvelope
+from metaspn_schemas.utils.json_codec import write_json_array
+
+
+def _canonical(value: object) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2_000)
+    parser.add_argument("--batch", type=int, default=20_000)
+    args = parser.parse_args()
+    number = args.number
+
+    print(f"{'class':<32} {'dumps':>8} {'to_json':>8} {'speedup':>8}")
+    totals = [0.0, 0.0]
+    for cls, obj in sample_instances().items():
+        assert obj.to_json() == _canonical(obj.to_dict())
+        baseline = timeit.timeit(lambda: _canonical(obj.to_dict()), number=number)
+        fast = timeit.timeit(obj.to_json, number=number)
+        totals[0] += baseline
+        totals[1] += fast
+        print(f"{cls.__name__:<32} {baseline / number * 1e6:>6.1f}us {fast / number * 1e6:>6.1f}us {baseline / fast:>7.2f}x")
+    print(f"all classes: {totals[0] / totals[1]:.2f}x")
+
+    signals = [sample_instance(SignalEnvelope)] * args.batch
+    baseline = timeit.timeit(lambda: _canonical([signal.to_dict() for signal in signals]), number=1)
+    streamed = timeit.timeit(lambda: write_json_array(io.StringIO(), signals), number=1)
+    print(
+        f"{args.batch} SignalEnvelope array: dumps {baseline * 1e3:.1f} ms, "
+        f"write_json_array {streamed * 1e3:.1f} ms ({baseline / streamed:.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
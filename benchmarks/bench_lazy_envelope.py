@@ -0,0 +1,47 @@
+"""Per-message routing cost: eager ``SignalEnvelope.from_dict`` vs ``LazySignalEnvelope``.
+
+A router reads ``signal_id``, ``timestamp``, ``source`` and ``payload_type`` and
+nothing else. Run with ``python benchmarks/bench_lazy_envelope.py [--rows N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from _fixtures import sample_instance
+
+from metaspn_schemas import EmissionEnvelope, LazyEmissionEnvelope, LazySignalEnvelope, SignalEnvelope
+
+
+def route_signal(envelope):
+    return (envelope.signal_id, envelope.timestamp, envelope.source, envelope.payload_type)
+
+
+def route_emission(envelope):
+    return (envelope.emission_id, envelope.timestamp, envelope.emission_type, envelope.caused_by)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'envelope':<18} {'eager':>10} {'lazy':>10} {'x':>6}")
+    for cls, lazy_cls, route in (
+        (SignalEnvelope, LazySignalEnvelope, route_signal),
+        (EmissionEnvelope, LazyEmissionEnvelope, route_emission),
+    ):
+        rows = [sample_instance(cls).to_dict() for _ in range(args.rows)]
+        assert [route(lazy_cls(r)) for r in rows] == [route(cls.from_dict(r)) for r in rows]
+
+        eager = min(timeit.repeat(lambda: [route(cls.from_dict(r)) for r in rows], number=1, repeat=args.repeat))
+        lazy = min(timeit.repeat(lambda: [route(lazy_cls(r)) for r in rows], number=1, repeat=args.repeat))
+        per_eager = eager / args.rows * 1e6
+        per_lazy = lazy / args.rows * 1e6
+        print(f"{cls.__name__:<18} {per_eager:>8.2f}us {per_lazy:>8.2f}us {eager / lazy:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Bytes per instance for every public schema class, with and without ``__slots__``.
+
+The "dict" column rebuilds each class as an unslotted frozen dataclass (the
+previous layout) and holds the same field values, so the difference is the
+per-object overhead only. Run with ``python benchmarks/bench_memory.py [--count N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from typing import Any
+
+from _fixtures import public_schema_classes, sample_instance
+
+
+def unslotted_twin(cls: type) -> type:
+    return make_dataclass(f"Dict{cls.__name__}", [(f.name, Any) for f in fields(cls)], frozen=True)
+
+
+def bytes_per_instance(factory, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{'class':<32} {'dict':>8} {'slots':>8} {'saved':>7}")
+    for cls in public_schema_classes():
+        sample = sample_instance(cls)
+        values = {f.name: getattr(sample, f.name) for f in fields(cls)}
+        twin = unslotted_twin(cls)
+        # Touch __dict__ so 3.11+ lazily-materialized instance dicts are counted.
+        dict_size = bytes_per_instance(lambda: (lambda obj: (obj.__dict__, obj)[1])(twin(**values)), args.count)
+        slot_size = bytes_per_instance(lambda: cls(**values), args.count)
+        print(f"{cls.__name__:<32} {dict_size:>6.0f}B {slot_size:>6.0f}B {1 - slot_size / dict_size:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
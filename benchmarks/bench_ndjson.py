@@ -0,0 +1,64 @@
+"""Streaming ``read_ndjson`` / ``write_ndjson`` vs an ad hoc whole-file loop.
+
+Reports throughput and the ``tracemalloc`` peak while reading files of
+``--count`` and ``4 * --count`` envelopes; the streaming reader's peak should
+not grow with the file. Run with ``python benchmarks/bench_ndjson.py [--count N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+
+from _fixtures import sample_instance
+
+from metaspn_schemas import SignalEnvelope
+from metaspn_schemas.io import read_ndjson, write_ndjson
+
+
+def _ad_hoc_read(path: str) -> list[SignalEnvelope]:
+    with open(path, encoding="utf-8") as fp:
+        return [SignalEnvelope.from_dict(json.loads(line)) for line in fp.read().splitlines() if line]
+
+
+def _streaming_read(path: str) -> None:
+    # Consume without keeping results, as a replay job would.
+    deque(read_ndjson(path, SignalEnvelope), maxlen=0)
+
+
+def _measure(label: str, func, path: str, count: int) -> None:  # type: ignore[no-untyped-def]
+    started = time.perf_counter()
+    func(path)
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    func(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<14} {count / elapsed:>10,.0f} rows/s   peak {peak / 2**20:>7.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=25_000)
+    args = parser.parse_args()
+    signal = sample_instance(SignalEnvelope)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for count in (args.count, 4 * args.count):
+            path = os.path.join(directory, f"signals_{count}.ndjson")
+            started = time.perf_counter()
+            write_ndjson(path, (signal for _ in range(count)))
+            elapsed = time.perf_counter() - started
+            size = os.path.getsize(path)
+            print(f"{count} envelopes, {size / 2**20:.1f} MiB (write_ndjson {count / elapsed:,.0f} rows/s)")
+            _measure("ad hoc list", _ad_hoc_read, path, count)
+            _measure("read_ndjson", _streaming_read, path, count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Scaling curve of ``decode_parallel`` over 1, 2, 4 and 8 worker processes.
+
+Speedup is bounded by the cores actually available (``os.cpu_count()`` is
+printed); on a single core the extra workers only add pickling overhead.
+Run with ``python benchmarks/bench_parallel.py [--count N] [--chunk-size N] [--workers 1 2 4 8]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+
+from _fixtures import sample_instance
+
+from metaspn_schemas import SignalEnvelope
+from metaspn_schemas.parallel import decode_parallel
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=2048)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    template = sample_instance(SignalEnvelope)
+    lines = [replace(template, signal_id=f"s_{index}").to_json().encode("ascii") for index in range(args.count)]
+    print(f"{args.count} SignalEnvelope lines, chunk_size={args.chunk_size}, cpu_count={os.cpu_count()}")
+
+    baseline = None
+    for workers in args.workers:
+        # Start the pool before timing so process start-up is not counted.
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(abs, range(workers)))
+            started = time.perf_counter()
+            deque(
+                decode_parallel(
+                    SignalEnvelope,
+                    lines,
+                    max_workers=workers,
+                    chunk_size=args.chunk_size,
+                    executor=None if workers == 1 else executor,
+                ),
+                maxlen=0,
+            )
+            elapsed = time.perf_counter() - started
+        baseline = baseline or elapsed
+        print(f"  {workers} worker(s): {args.count / elapsed:>10,.0f} rows/s   speedup {baseline / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Pickle size and round-trip time: ``Serializable.__reduce__`` vs the dataclass default.
+
+The default is what frozen slotted dataclasses pickle as without the override:
+``copyreg.__newobj__`` plus the ``__getstate__`` field list, restored through
+``__setstate__``. Each class is pickled as a batch of ``--batch`` distinct
+instances, the way objects cross a ``multiprocessing`` queue.
+Run with ``python benchmarks/bench_pickle.py [--batch N] [--number N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import copyreg
+import io
+import pickle
+import timeit
+
+from _fixtures import sample_instances
+
+from metaspn_schemas.utils.serde import Serializable
+
+
+class _DefaultPickler(pickle.Pickler):
+    def reducer_override(self, obj):  # type: ignore[no-untyped-def]
+        if isinstance(obj, Serializable):
+            return (copyreg.__newobj__, (type(obj),), obj.__getstate__())  # type: ignore[attr-defined]
+        return NotImplemented
+
+
+def _default_dumps(value: object) -> bytes:
+    buffer = io.BytesIO()
+    _DefaultPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(value)
+    return buffer.getvalue()
+
+
+def _dumps(value: object) -> bytes:
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch", type=int, default=1_000)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+    number = args.number
+
+    print(f"{'class':<32} {'default B':>9} {'reduce B':>8} {'default':>9} {'reduce':>9} {'speedup':>7}")
+    totals = [0, 0, 0.0, 0.0]
+    single = [0, 0]
+    for cls, obj in sample_instances().items():
+        batch = [copy.copy(obj) for _ in range(args.batch)]
+        default_blob = _default_dumps(batch)
+        blob = _dumps(batch)
+        assert pickle.loads(blob) == batch == pickle.loads(default_blob)
+        default_time = timeit.timeit(lambda: pickle.loads(_default_dumps(batch)), number=number)
+        reduce_time = timeit.timeit(lambda: pickle.loads(_dumps(batch)), number=number)
+        single[0] += len(_default_dumps(obj))
+        single[1] += len(_dumps(obj))
+        totals[0] += len(default_blob)
+        totals[1] += len(blob)
+        totals[2] += default_time
+        totals[3] += reduce_time
+        per_object = 1e6 / (number * args.batch)
+        print(
+            f"{cls.__name__:<32} {len(default_blob) / args.batch:>9.1f} {len(blob) / args.batch:>8.1f} "
+            f"{default_time * per_object:>7.2f}us {reduce_time * per_object:>7.2f}us "
+            f"{default_time / reduce_time:>6.2f}x"
+        )
+    print(
+        f"all classes: size {totals[1] / totals[0]:.0%} of default, "
+        f"round trip {totals[2] / totals[3]:.2f}x faster"
+    )
+    # A lone object also pays for the reference to the _reconstruct global.
+    print(f"single objects: size {single[1] / single[0]:.0%} of default")
+
+
+if __name__ == "__main__":
+    main()
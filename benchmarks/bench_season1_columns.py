@@ -0,0 +1,97 @@
+"""Season 1 stake aggregates over a list of views vs ``StakeAccountColumns``.
+
+Run with ``python benchmarks/bench_season1_columns.py [--rows N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import timeit
+import tracemalloc
+
+import _fixtures  # noqa: F401  (puts src/ on sys.path)
+
+from metaspn_schemas import StakeAccountColumns, StakeAccountView
+
+
+def build_views(rows: int) -> list[StakeAccountView]:
+    rng = random.Random(7)
+    owners = [f"owner_{i:06d}" for i in range(max(rows // 20, 1))]
+    return [
+        StakeAccountView(
+            owner=rng.choice(owners),
+            season_id=1,
+            game_id=rng.randrange(1, 65),
+            amount=rng.randrange(1, 1_000_000),
+            active=rng.random() < 0.9,
+        )
+        for _ in range(rows)
+    ]
+
+
+def totals_by_game_loop(views: list[StakeAccountView]) -> dict[int, int]:
+    totals: dict[int, int] = {}
+    for view in views:
+        if view.active:
+            totals[view.game_id] = totals.get(view.game_id, 0) + view.amount
+    return totals
+
+
+def totals_by_owner_loop(views: list[StakeAccountView]) -> dict[str, int]:
+    totals: dict[str, int] = {}
+    for view in views:
+        if view.active:
+            totals[view.owner] = totals.get(view.owner, 0) + view.amount
+    return totals
+
+
+def retained_bytes(factory) -> int:
+    gc.collect()
+    tracemalloc.start()
+    held = factory()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    views = build_views(args.rows)
+    columns = StakeAccountColumns.from_views(views)
+    assert columns.total_staked_by_game() == totals_by_game_loop(views)
+    assert columns.total_staked_by_owner() == totals_by_owner_loop(views)
+
+    def cold(method):
+        # Group indexes are cached per container, so time a fresh copy each call.
+        return lambda: method(StakeAccountColumns.from_views(views))
+
+    build = min(timeit.repeat(lambda: StakeAccountColumns.from_views(views), number=1, repeat=5))
+    cases = [
+        ("by game: view loop", lambda: totals_by_game_loop(views)),
+        ("by game: columns", columns.total_staked_by_game),
+        ("by game: cold", cold(StakeAccountColumns.total_staked_by_game)),
+        ("by owner: view loop", lambda: totals_by_owner_loop(views)),
+        ("by owner: columns", columns.total_staked_by_owner),
+        ("by owner: cold", cold(StakeAccountColumns.total_staked_by_owner)),
+        ("total: view loop", lambda: sum(view.amount for view in views if view.active)),
+        ("total: columns", columns.total_staked),
+    ]
+    print(f"{'from_views':<22} {build * 1000:8.1f} ms  (included in 'cold' rows)")
+    for label, func in cases:
+        seconds = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{label:<22} {seconds * 1000:8.1f} ms")
+
+    view_bytes = retained_bytes(lambda: build_views(args.rows))
+    column_bytes = retained_bytes(lambda: StakeAccountColumns.from_views(build_views(args.rows)))
+    print(f"{'memory: views':<22} {view_bytes / args.rows:8.1f} B/row")
+    print(f"{'memory: columns':<22} {column_bytes / args.rows:8.1f} B/row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Per-row ``validate_season1_payload`` vs ``validate_season1_batch``.
+
+Run with ``python benchmarks/bench_season1_validation.py [--rows N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+import _fixtures  # noqa: F401  (puts src/ on sys.path)
+
+from metaspn_schemas import validate_season1_batch, validate_season1_payload
+
+
+def build_rows(rows: int) -> list[dict[str, object]]:
+    return [
+        {
+            "owner": f"owner_{index % 5000:05d}",
+            "seasonId": 1,
+            "gameId": index % 64 + 1,
+            "amount": -1 if index % 100 == 0 else index,
+            "active": True,
+        }
+        for index in range(rows)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows)
+    result = validate_season1_batch("StakeAccountView", rows)
+    assert [result.verdict(i) for i in range(len(rows))] == [
+        validate_season1_payload("StakeAccountView", row) for row in rows
+    ]
+
+    per_row = min(
+        timeit.repeat(lambda: [validate_season1_payload("StakeAccountView", row) for row in rows], number=1, repeat=3)
+    )
+    batch = min(timeit.repeat(lambda: validate_season1_batch("StakeAccountView", rows), number=1, repeat=3))
+    print(f"rows={args.rows} invalid={len(result.errors)}")
+    print(f"per-row  {per_row * 1000:8.1f} ms")
+    print(f"batch    {batch * 1000:8.1f} ms  ({per_row / batch:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Linear ``config.transitions`` scan vs ``CompiledStateMachine.step`` / ``step_many``.
+
+Run with ``python benchmarks/bench_state_engine.py [--states N] [--entities N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import timeit
+
+import _fixtures  # noqa: F401  (puts src/ on sys.path)
+
+from metaspn_schemas import StateMachineConfig, StateTransitionRule, compile_state_machine
+
+EVENTS = ("advance", "retry", "escalate", "close")
+
+
+def build_config(state_count: int) -> StateMachineConfig:
+    states = tuple(f"s{index:04d}" for index in range(state_count))
+    rules = []
+    for index, state in enumerate(states[:-1]):
+        rules.append(StateTransitionRule(state, states[index + 1], "advance"))
+        rules.append(StateTransitionRule(state, state, "retry"))
+        rules.append(StateTransitionRule(state, states[-1], "close"))
+    return StateMachineConfig(
+        config_id="bench",
+        machine_type="bench",
+        initial_state=states[0],
+        states=states,
+        terminal_states=(states[-1],),
+        transitions=tuple(rules),
+    )
+
+
+def linear_step(config: StateMachineConfig, state: str, event: str) -> str | None:
+    for rule in config.transitions:
+        if rule.from_state == state and rule.event == event:
+            return rule.to_state
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--states", type=int, default=200)
+    parser.add_argument("--entities", type=int, default=10_000)
+    args = parser.parse_args()
+
+    config = build_config(args.states)
+    engine = compile_state_machine(config)
+    rng = random.Random(3)
+    entity_ids = [f"ent_{index}" for index in range(args.entities)]
+    states = [rng.choice(config.states) for _ in entity_ids]
+    events = [rng.choice(EVENTS) for _ in entity_ids]
+    assert [engine.step(s, e) for s, e in zip(states, events)] == [
+        linear_step(config, s, e) for s, e in zip(states, events)
+    ]
+
+    rejected = len(engine.step_many(entity_ids, states, events)[1])
+    print(f"{rejected} of {args.entities} rows rejected (step_many builds a GateTransitionAttempt for each)")
+    cases = [
+        ("linear scan", lambda: [linear_step(config, s, e) for s, e in zip(states, events)]),
+        ("step", lambda: [engine.step(s, e) for s, e in zip(states, events)]),
+        ("step_many", lambda: engine.step_many(entity_ids, states, events)),
+    ]
+    for label, func in cases:
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{label:<12} {seconds * 1000:9.2f} ms / {args.entities} entities")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""State graph analysis on a generated config: repeated O(V*E) scans vs ``analyze_state_machine``.
+
+Run with ``python benchmarks/bench_state_graph.py [--states N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+import _fixtures  # noqa: F401  (puts src/ on sys.path)
+
+from metaspn_schemas import StateMachineConfig, StateTransitionRule, analyze_state_machine, clear_state_graph_cache
+
+
+def build_config(state_count: int) -> StateMachineConfig:
+    # The chain advances towards lower-sorted names, so a scan over the (sorted)
+    # transition list discovers one new state per pass.
+    states = tuple(f"s{index:04d}" for index in range(state_count))
+    rules = []
+    for index in range(state_count - 1, 0, -1):
+        rules.append(StateTransitionRule(states[index], states[index - 1], "advance"))
+        rules.append(StateTransitionRule(states[index], states[index], "retry"))
+    return StateMachineConfig(
+        config_id="bench_graph",
+        machine_type="bench",
+        initial_state=states[-1],
+        states=states,
+        terminal_states=(states[0],),
+        transitions=tuple(rules),
+    )
+
+
+def naive_reachable(config: StateMachineConfig) -> set[str]:
+    # Fixed-point over the full transition list, as the external tooling did.
+    reachable = {config.initial_state}
+    changed = True
+    while changed:
+        changed = False
+        for rule in config.transitions:
+            if rule.from_state in reachable and rule.to_state not in reachable:
+                reachable.add(rule.to_state)
+                changed = True
+    return reachable
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--states", type=int, default=500)
+    args = parser.parse_args()
+
+    config = build_config(args.states)
+    payload = config.to_dict()
+    assert set(analyze_state_machine(config).reachable_states) == naive_reachable(config)
+
+    def cold() -> None:
+        clear_state_graph_cache()
+        analyze_state_machine(config)
+
+    cases = [
+        ("naive reachability", lambda: naive_reachable(config)),
+        ("analyze (cold)", cold),
+        ("analyze (cached)", lambda: analyze_state_machine(config)),
+        ("analyze (same dict)", lambda: analyze_state_machine(payload)),
+    ]
+    for label, func in cases:
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{label:<20} {seconds * 1000:9.2f} ms / {args.states} states")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Rebuilding gate state from attempt dicts: decode-and-fold vs ``EntityStateTracker``.
+
+Run with ``python benchmarks/bench_state_tracker.py [--attempts N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import timeit
+from datetime import timedelta
+
+from _fixtures import NOW
+
+from metaspn_schemas import EntityStateTracker, GateTransitionAttempt, StateMachineConfig, StateTransitionRule
+
+STATES = ("seen", "queued", "sent", "replied")
+CONFIG = StateMachineConfig(
+    config_id="bench",
+    machine_type="bench",
+    initial_state="seen",
+    states=STATES,
+    terminal_states=("replied",),
+    transitions=tuple(StateTransitionRule(a, b, f"to_{b}") for a, b in zip(STATES, STATES[1:])),
+)
+
+
+def build_records(count: int) -> list[dict[str, object]]:
+    rng = random.Random(11)
+    return [
+        GateTransitionAttempt(
+            attempt_id=f"att_{index:08d}",
+            gate_name="outreach",
+            entity_id=f"ent_{rng.randrange(count // 4 or 1)}",
+            from_state="seen",
+            to_state=rng.choice(STATES),
+            attempted_at=NOW + timedelta(seconds=index),
+            allowed=rng.random() < 0.8,
+        ).to_dict()
+        for index in range(count)
+    ]
+
+
+def decode_and_fold(records: list[dict[str, object]]) -> dict[str, str]:
+    states: dict[str, str] = {}
+    for attempt in map(GateTransitionAttempt.from_dict, records):
+        if attempt.allowed:
+            states[attempt.entity_id] = attempt.to_state
+    return states
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--attempts", type=int, default=100_000)
+    args = parser.parse_args()
+
+    records = build_records(args.attempts)
+    tracker = EntityStateTracker(CONFIG)
+    tracker.consume(records)
+    assert dict(tracker.items()) == decode_and_fold(records)
+
+    half = EntityStateTracker(CONFIG)
+    half.consume(records[: len(records) // 2])
+    snapshot = half.snapshot()
+
+    cases = [
+        ("decode + fold", lambda: decode_and_fold(records)),
+        ("tracker.consume", lambda: EntityStateTracker(CONFIG).consume(records)),
+        ("resume from 50%", lambda: EntityStateTracker.restore(CONFIG, snapshot).consume(records)),
+    ]
+    for label, func in cases:
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{label:<16} {seconds * 1000:9.1f} ms / {args.attempts} attempts")
+
+
+if __name__ == "__main__":
+    main()
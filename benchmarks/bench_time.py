@@ -0,0 +1,62 @@
+"""Compare timestamp parse/format against the previous implementation.
+
+Measures unique timestamps (every lookup misses the cache) and a batch-window
+workload where a small set of values repeats. Run with
+``python benchmarks/bench_time.py [--count N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from datetime import datetime, timedelta, timezone
+
+import _fixtures  # noqa: F401  (puts src/ on sys.path)
+
+from metaspn_schemas.utils.time import datetime_to_str, ensure_utc, set_timestamp_cache_size, str_to_datetime
+
+
+def previous_datetime_to_str(value: datetime) -> str:
+    return ensure_utc(value).isoformat().replace("+00:00", "Z")
+
+
+def previous_str_to_datetime(value: str) -> datetime:
+    text = value[:-1] + "+00:00" if value.endswith("Z") else value
+    return ensure_utc(datetime.fromisoformat(text))
+
+
+def _per_item(func, values, repeat: int) -> float:
+    return min(timeit.repeat(lambda: [func(v) for v in values], number=1, repeat=repeat)) / len(values) * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    workloads = {
+        "unique": [base + timedelta(seconds=i, microseconds=i % 7) for i in range(args.count)],
+        "windows": [base + timedelta(hours=i % 24) for i in range(args.count)],
+    }
+
+    print(f"{'workload':<10} {'op':<7} {'previous':>10} {'uncached':>10} {'cached':>10}")
+    for name, values in workloads.items():
+        texts = [previous_datetime_to_str(v) for v in values]
+        assert [datetime_to_str(v) for v in values] == texts
+        assert [str_to_datetime(t) for t in texts] == [previous_str_to_datetime(t) for t in texts]
+        for op, new, old, inputs in (
+            ("format", datetime_to_str, previous_datetime_to_str, values),
+            ("parse", str_to_datetime, previous_str_to_datetime, texts),
+        ):
+            previous = _per_item(old, inputs, args.repeat)
+            set_timestamp_cache_size(0)
+            uncached = _per_item(new, inputs, args.repeat)
+            set_timestamp_cache_size(4096)
+            cached = _per_item(new, inputs, args.repeat)
+            print(f"{name:<10} {op:<7} {previous:>8.0f}ns {uncached:>8.0f}ns {cached:>8.0f}ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""``from_dict`` / ``from_dicts`` time: validated decode vs ``trusted=True``.
+
+Each class decodes ``--batch`` copies of its canonical ``to_dict`` output, row
+by row through ``from_dict`` and as one ``from_dicts`` batch. Every trusted
+result is first checked equal to the validated one.
+Run with ``python benchmarks/bench_trusted.py [--batch N] [--number N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from _fixtures import sample_instances
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch", type=int, default=1_000)
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+    number = args.number
+
+    print(f"{'class':<32} {'from_dict':>9} {'trusted':>9} {'speedup':>7} {'batch':>9} {'trusted':>9} {'speedup':>7}")
+    totals = [0.0, 0.0, 0.0, 0.0]
+    for cls, obj in sample_instances().items():
+        rows = [obj.to_dict() for _ in range(args.batch)]
+        assert cls.from_dicts(rows, trusted=True) == cls.from_dicts(rows) == [obj] * args.batch
+        assert cls.from_dict(rows[0], trusted=True) == obj
+        timings = (
+            timeit.timeit(lambda: [cls.from_dict(row) for row in rows], number=number),
+            timeit.timeit(lambda: [cls.from_dict(row, trusted=True) for row in rows], number=number),
+            timeit.timeit(lambda: cls.from_dicts(rows), number=number),
+            timeit.timeit(lambda: cls.from_dicts(rows, trusted=True), number=number),
+        )
+        for index, value in enumerate(timings):
+            totals[index] += value
+        per_row = 1e6 / (number * args.batch)
+        print(
+            f"{cls.__name__:<32} {timings[0] * per_row:>7.2f}us {timings[1] * per_row:>7.2f}us "
+            f"{timings[0] / timings[1]:>6.2f}x {timings[2] * per_row:>7.2f}us {timings[3] * per_row:>7.2f}us "
+            f"{timings[2] / timings[3]:>6.2f}x"
+        )
+    print(f"all classes: from_dict {totals[0] / totals[1]:.2f}x faster, from_dicts {totals[2] / totals[3]:.2f}x faster")
+
+
+if __name__ == "__main__":
+    main()
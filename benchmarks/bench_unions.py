@@ -0,0 +1,125 @@
+"""Union field decoding: runtime-type dispatch vs trying each option in turn.
+
+The baseline swaps in the previous union decoder, which called each option's
+decoder until one did not raise. Classes with several ``X | None`` fields are
+decoded with the optionals populated and with them all ``None``; the last block
+times single values through unions whose first options reject them.
+Run with ``python benchmarks/bench_unions.py [--batch N] [--number N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import timeit
+import types
+from datetime import datetime
+from typing import Any, Callable, Union, get_args, get_origin, get_type_hints
+
+from _fixtures import sample_instances
+
+from metaspn_schemas.core import TraceContext
+from metaspn_schemas.utils import serde
+
+VALUE_CASES: list[tuple[str, Any, Any]] = [
+    ("float | None <- 1.5", float | None, 1.5),
+    ("datetime | None <- str", datetime | None, "2026-01-01T12:00:00Z"),
+    ("TraceContext | None <- dict", TraceContext | None, {"trace_id": "tr_1"}),
+    ("datetime | int <- 5", datetime | int, 5),
+    ("int | str <- 'abc'", int | str, "abc"),
+    ("TraceContext | dict <- dict", TraceContext | dict[str, int], {"a": 1}),
+]
+
+
+def _legacy_union(hint: Any) -> Callable[[Any], Any]:
+    option_decoders = tuple(serde._decoder_for(option) for option in get_args(hint) if option is not type(None))
+
+    def decode_union(value: Any) -> Any:
+        if value is None:
+            return None
+        last_error: Exception | None = None
+        for decode in option_decoders:
+            try:
+                return decode(value)
+            except Exception as err:  # noqa: BLE001
+                last_error = err
+        if last_error is not None:
+            raise last_error
+        return value
+
+    return decode_union
+
+
+def _union_hints(classes: list[type]) -> set[Any]:
+    hints = {hint for _, hint, _ in VALUE_CASES}
+    for cls in classes:
+        hints.update(h for h in get_type_hints(cls).values() if get_origin(h) in (Union, types.UnionType))
+    return hints
+
+
+def _use_legacy(hints: set[Any], legacy: bool) -> None:
+    serde._CODECS.clear()
+    serde._DECODERS.clear()
+    if legacy:
+        for hint in hints:
+            serde._DECODERS[hint] = _legacy_union(hint)
+
+
+def _all_none(obj: Any) -> Any:
+    hints = get_type_hints(type(obj))
+    return dataclasses.replace(
+        obj,
+        **{
+            f.name: None
+            for f in dataclasses.fields(obj)
+            if get_origin(hints[f.name]) in (Union, types.UnionType) and type(None) in get_args(hints[f.name])
+        },
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch", type=int, default=1_000)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+    number = args.number
+
+    instances = {
+        cls: obj
+        for cls, obj in sample_instances().items()
+        if sum(get_origin(h) in (Union, types.UnionType) for h in get_type_hints(cls).values()) >= 2
+    }
+    hints = _union_hints(list(instances))
+    per_row = 1e6 / (number * args.batch)
+
+    print(f"{'class (from_dict per row)':<44} {'try each':>9} {'dispatch':>9} {'speedup':>7}")
+    for cls, obj in instances.items():
+        for label, sample in (("", obj), (" [None]", _all_none(obj))):
+            rows = [sample.to_dict() for _ in range(args.batch)]
+            timings = []
+            for legacy in (True, False):
+                _use_legacy(hints, legacy)
+                assert [cls.from_dict(row) for row in rows[:1]] == [sample]
+                timings.append(timeit.timeit(lambda: [cls.from_dict(row) for row in rows], number=number))
+            print(
+                f"{cls.__name__ + label:<44} {timings[0] * per_row:>7.2f}us {timings[1] * per_row:>7.2f}us "
+                f"{timings[0] / timings[1]:>6.2f}x"
+            )
+
+    print(f"\n{'single value':<44} {'try each':>9} {'dispatch':>9} {'speedup':>7}")
+    calls = number * args.batch
+    for label, hint, value in VALUE_CASES:
+        timings = []
+        for legacy in (True, False):
+            _use_legacy(hints, legacy)
+            decode = serde._decoder_for(hint)
+            timings.append(timeit.timeit(lambda: decode(value), number=calls))
+        print(
+            f"{label:<44} {timings[0] * 1e9 / calls:>7.0f}ns {timings[1] * 1e9 / calls:>7.0f}ns "
+            f"{timings[0] / timings[1]:>6.2f}x"
+        )
+    _use_legacy(hints, False)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
+from metaspn_schemas.archive import SignalArchive
 from metaspn_schemas.core import (
     EmissionEnvelope,
     EntityRef,
+    LazyEmissionEnvelope,
+    LazySignalEnvelope,
     SchemaVersion,
     SignalEnvelope,
     TraceContext,
@@ -28,6 +31,12 @@ from metaspn_schemas.learning import (
     PolicyOverrideReview,
 )
 from metaspn_schemas.outcomes import MeetingBooked, MessageSent, NoReply, NoReplyObserved, ReplyReceived, RevenueEvent
+from metaspn_schemas.payloads import (
+    decode_payload,
+    decode_typed_envelope,
+    register_payload_type,
+    with_typed_payload,
+)
 from metaspn_schemas.recommendations import (
     ApprovalOverride,
     DailyDigestEntry,
@@ -39,10 +48,13 @@ from metaspn_schemas.season1 import (
     AttentionScoreUpdate,
     FounderStakeView,
     GameAccountView,
+    PlayerAccountColumns,
     PlayerAccountView,
     RewardClaim,
     RewardProjection,
+    Season1BatchValidation,
     SeasonAccountView,
+    StakeAccountColumns,
     StakeAccountView,
     parse_attention_score_update,
     parse_founder_stake_view,
@@ -59,18 +71,31 @@ from metaspn_schemas.season1 import (
     validate_player_account_view,
     validate_reward_claim,
     validate_reward_projection,
+    validate_season1_batch,
     validate_season1_payload,
     validate_season_account_view,
     validate_stake_account_view,
 )
+from metaspn_schemas.state_engine import CompiledStateMachine, compile_state_machine, register_guard
+from metaspn_schemas.state_graph import (
+    StateGraphAnalysis,
+    analyze_state_machine,
+    clear_state_graph_cache,
+    shortest_event_path,
+)
+from metaspn_schemas.state_tracker import EntityStateSnapshot, EntityStateTracker
 from metaspn_schemas.state_machine import (
     CalibrationRecord,
+    ConfigCacheInfo,
     FailureTaxonomyRecord,
     GateTransitionAttempt,
     OutcomeWindowEvaluation,
     StateMachineConfig,
     StateTransitionRule,
+    clear_state_machine_config_cache,
     parse_state_machine_config,
+    set_state_machine_config_cache_size,
+    state_machine_config_cache_info,
     validate_state_machine_config,
 )
 from metaspn_schemas.state_fragments import Attempts, Cooldowns, Evidence, Identity, Scores
@@ -99,6 +124,8 @@ __all__ = [
     "GameClassified",
     "Identity",
     "IngestionParseErrorEvent",
+    "LazyEmissionEnvelope",
+    "LazySignalEnvelope",
     "DraftMessage",
     "DailyDigestEntry",
     "Recommendation",
@@ -122,6 +149,8 @@ __all__ = [
     "GameAccountView",
     "StakeAccountView",
     "PlayerAccountView",
+    "StakeAccountColumns",
+    "PlayerAccountColumns",
     "FounderStakeView",
     "AttentionScoreUpdate",
     "RewardProjection",
@@ -144,6 +173,7 @@ __all__ = [
     "Scores",
     "ScoresComputed",
     "SignalEnvelope",
+    "SignalArchive",
     "SocialPostSeen",
     "RawSocialPostSeenEvent",
     "ResolverHandoff",
@@ -153,6 +183,19 @@ __all__ = [
     "FailureTaxonomyRecord",
     "parse_state_machine_config",
     "validate_state_machine_config",
+    "ConfigCacheInfo",
+    "clear_state_machine_config_cache",
+    "set_state_machine_config_cache_size",
+    "state_machine_config_cache_info",
+    "CompiledStateMachine",
+    "compile_state_machine",
+    "register_guard",
+    "EntityStateSnapshot",
+    "EntityStateTracker",
+    "StateGraphAnalysis",
+    "analyze_state_machine",
+    "clear_state_graph_cache",
+    "shortest_event_path",
     "parse_season_account_view",
     "parse_game_account_view",
     "parse_stake_account_view",
@@ -171,4 +214,10 @@ __all__ = [
     "validate_reward_projection",
     "validate_reward_claim",
     "validate_season1_payload",
+    "validate_season1_batch",
+    "Season1BatchValidation",
+    "decode_payload",
+    "decode_typed_envelope",
+    "register_payload_type",
+    "with_typed_payload",
 ]
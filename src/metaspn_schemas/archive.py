@@ -0,0 +1,271 @@
+"""Append-only ``SignalEnvelope`` archive with a sidecar offset index.
+
+The data file holds a header followed by records of ``u32 length | to_binary()``.
+The index file (``<path>.idx``) holds a header followed by one entry per record:
+``i64 timestamp micros | u64 data offset | u16 id length | signal_id``. Reads go
+through an ``mmap`` of the data file and decode only the records asked for.
+
+The two files are buffered and flushed separately, so after a crash either one
+may hold more than the other. Opening the archive drops index entries that point
+past the end of the data, re-indexes complete records the index is missing, and
+(when writable) truncates a torn final record.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timezone
+from typing import Iterator
+
+from metaspn_schemas.core import SignalEnvelope
+from metaspn_schemas.utils.binary import decode_binary, encode_binary
+from metaspn_schemas.utils.time import ensure_utc
+
+DATA_MAGIC = b"MSPNARC1"
+INDEX_MAGIC = b"MSPNIDX1"
+INDEX_SUFFIX = ".idx"
+
+_LENGTH = struct.Struct("<I")
+_INDEX_ENTRY = struct.Struct("<qQH")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class SignalArchive:
+    """Append-only ``SignalEnvelope`` store with id lookup and timestamp range scans.
+
+    Open read-only (the default) or with ``writable=True`` to ``append``. The
+    index is loaded into memory as arrays plus an ``id -> position`` dict;
+    envelopes are decoded from the mapped data file on access only.
+    """
+
+    __slots__ = (
+        "path",
+        "index_path",
+        "writable",
+        "_data",
+        "_index",
+        "_map",
+        "_size",
+        "_ids",
+        "_positions",
+        "_offsets",
+        "_timestamps",
+        "_in_time_order",
+        "_by_time",
+    )
+
+    def __init__(self, path: str | os.PathLike[str], *, writable: bool = False) -> None:
+        self.path = os.fspath(path)
+        self.index_path = self.path + INDEX_SUFFIX
+        self.writable = writable
+        self._map: mmap.mmap | None = None
+        self._ids: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._offsets = array("Q")
+        self._timestamps = array("q")
+        self._in_time_order = True
+        self._by_time: list[int] | None = None
+
+        if writable:
+            self._data = open(self.path, "a+b")
+            self._index = open(self.index_path, "a+b")
+            for fp, magic in ((self._data, DATA_MAGIC), (self._index, INDEX_MAGIC)):
+                if fp.seek(0, os.SEEK_END) == 0:
+                    fp.write(magic)
+                    fp.flush()
+        else:
+            self._data = open(self.path, "rb")
+            self._index = open(self.index_path, "rb") if os.path.exists(self.index_path) else None
+        self._data.seek(0)
+        if self._data.read(len(DATA_MAGIC)) != DATA_MAGIC:
+            self.close()
+            raise ValueError(f"not a signal archive: {self.path}")
+        self._size = os.fstat(self._data.fileno()).st_size
+        self._load_index()
+        self._recover()
+
+    def __enter__(self) -> SignalArchive:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, signal_id: object) -> bool:
+        return signal_id in self._positions
+
+    def __iter__(self) -> Iterator[SignalEnvelope]:
+        """Envelopes in append order."""
+        for position in range(len(self._ids)):
+            yield self._decode_at(self._offsets[position])
+
+    def __getitem__(self, signal_id: str) -> SignalEnvelope:
+        position = self._positions.get(signal_id)
+        if position is None:
+            raise KeyError(signal_id)
+        return self._decode_at(self._offsets[position])
+
+    def get(self, signal_id: str, default: SignalEnvelope | None = None) -> SignalEnvelope | None:
+        position = self._positions.get(signal_id)
+        return default if position is None else self._decode_at(self._offsets[position])
+
+    def append(self, signal: SignalEnvelope) -> int:
+        """Archive ``signal`` and return its data offset; ids must be unique."""
+        if not self.writable:
+            raise ValueError("archive is opened read-only")
+        if signal.signal_id in self._positions:
+            raise ValueError(f"signal already archived: {signal.signal_id}")
+        blob = encode_binary(signal)
+        offset = self._size
+        self._data.write(_LENGTH.pack(len(blob)))
+        self._data.write(blob)
+        self._size += _LENGTH.size + len(blob)
+        micros = _micros(signal.timestamp)
+        encoded_id = signal.signal_id.encode("utf-8")
+        self._index.write(_INDEX_ENTRY.pack(micros, offset, len(encoded_id)))
+        self._index.write(encoded_id)
+        self._add_entry(signal.signal_id, micros, offset)
+        return offset
+
+    def extend(self, signals: Iterator[SignalEnvelope] | list[SignalEnvelope]) -> int:
+        count = 0
+        for signal in signals:
+            self.append(signal)
+            count += 1
+        return count
+
+    def ids_between(self, start: datetime | None = None, end: datetime | None = None) -> list[str]:
+        """``signal_id`` values with ``start <= timestamp < end``, in timestamp order, without decoding."""
+        ids = self._ids
+        return [ids[position] for position in self._time_slice(start, end)]
+
+    def scan(self, start: datetime | None = None, end: datetime | None = None) -> Iterator[SignalEnvelope]:
+        """Envelopes with ``start <= timestamp < end`` in timestamp order (append order for ties)."""
+        offsets = self._offsets
+        for position in self._time_slice(start, end):
+            yield self._decode_at(offsets[position])
+
+    def flush(self) -> None:
+        if self.writable:
+            # Data before index, so a completed flush never leaves the index pointing past the data.
+            self._data.flush()
+            self._index.flush()
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self.writable:
+            self.flush()
+        for fp in (self._data, self._index):
+            if fp is not None and not fp.closed:
+                fp.close()
+
+    def _add_entry(self, signal_id: str, micros: int, offset: int) -> None:
+        if self._in_time_order and self._timestamps and micros < self._timestamps[-1]:
+            self._in_time_order = False
+        self._by_time = None
+        self._positions[signal_id] = len(self._ids)
+        self._ids.append(signal_id)
+        self._offsets.append(offset)
+        self._timestamps.append(micros)
+
+    def _time_slice(self, start: datetime | None, end: datetime | None) -> range | list[int]:
+        timestamps = self._timestamps
+        low = None if start is None else _micros(start)
+        high = None if end is None else _micros(end)
+        if self._in_time_order:
+            first = 0 if low is None else bisect_left(timestamps, low)
+            last = len(timestamps) if high is None else bisect_left(timestamps, high)
+            return range(first, max(first, last))
+        if self._by_time is None:
+            self._by_time = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+        by_time = self._by_time
+        first = 0 if low is None else bisect_left(by_time, low, key=timestamps.__getitem__)
+        last = len(by_time) if high is None else bisect_left(by_time, high, key=timestamps.__getitem__)
+        return by_time[first:last]
+
+    def _buffer(self, end: int) -> mmap.mmap:
+        buffer = self._map
+        if buffer is None or len(buffer) < end:
+            if self.writable:
+                self._data.flush()
+            if buffer is not None:
+                buffer.close()
+            buffer = self._map = mmap.mmap(self._data.fileno(), 0, access=mmap.ACCESS_READ)
+        return buffer
+
+    def _decode_at(self, offset: int) -> SignalEnvelope:
+        start = offset + _LENGTH.size
+        buffer = self._buffer(start)
+        end = start + _LENGTH.unpack_from(buffer, offset)[0]
+        if len(buffer) < end:
+            buffer = self._buffer(end)
+        with memoryview(buffer) as view:
+            return decode_binary(SignalEnvelope, view[start:end])
+
+    def _load_index(self) -> None:
+        if self._index is None:
+            return
+        self._index.seek(0)
+        raw = self._index.read()
+        if raw[: len(INDEX_MAGIC)] != INDEX_MAGIC:
+            raise ValueError(f"not a signal archive index: {self.index_path}")
+        pos = len(INDEX_MAGIC)
+        entry_size = _INDEX_ENTRY.size
+        while pos + entry_size <= len(raw):
+            micros, offset, id_length = _INDEX_ENTRY.unpack_from(raw, pos)
+            id_end = pos + entry_size + id_length
+            if id_end > len(raw) or offset + _LENGTH.size > self._size:
+                break
+            self._add_entry(raw[pos + entry_size : id_end].decode("utf-8"), micros, offset)
+            pos = id_end
+        # Drop a torn or stale tail: entries must point at complete records.
+        while self._offsets and self._record_end(self._offsets[-1]) > self._size:
+            pos = self._drop_last_entry(pos)
+        if self.writable and pos != len(raw):
+            self._index.truncate(pos)
+
+    def _recover(self) -> None:
+        """Index complete records the index is missing; truncate a torn final record when writable."""
+        pos = self._record_end(self._offsets[-1]) if self._offsets else len(DATA_MAGIC)
+        recovered = 0
+        while pos + _LENGTH.size <= self._size and self._record_end(pos) <= self._size:
+            signal = self._decode_at(pos)
+            if self.writable:
+                encoded_id = signal.signal_id.encode("utf-8")
+                self._index.write(_INDEX_ENTRY.pack(_micros(signal.timestamp), pos, len(encoded_id)))
+                self._index.write(encoded_id)
+            self._add_entry(signal.signal_id, _micros(signal.timestamp), pos)
+            pos = self._record_end(pos)
+            recovered += 1
+        if self.writable and pos != self._size:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._data.truncate(pos)
+            self._size = pos
+        if self.writable and recovered:
+            self._index.flush()
+
+    def _record_end(self, offset: int) -> int:
+        buffer = self._buffer(offset + _LENGTH.size)
+        return offset + _LENGTH.size + _LENGTH.unpack_from(buffer, offset)[0]
+
+    def _drop_last_entry(self, index_end: int) -> int:
+        signal_id = self._ids.pop()
+        del self._positions[signal_id]
+        self._offsets.pop()
+        self._timestamps.pop()
+        return index_end - _INDEX_ENTRY.size - len(signal_id.encode("utf-8"))
+
+
+def _micros(value: datetime) -> int:
+    delta = ensure_utc(value) - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
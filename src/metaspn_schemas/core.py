@@ -2,30 +2,30 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, Mapping
 
-from metaspn_schemas.utils.serde import Serializable
+from metaspn_schemas.utils.serde import INTERNED, LazyDecoded, Serializable, _install_setstate
 from metaspn_schemas.utils.time import ensure_utc
 
 DEFAULT_SCHEMA_VERSION = "0.9"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SchemaVersion(Serializable):
     package: str = "metaspn-schemas"
     version: str = DEFAULT_SCHEMA_VERSION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntityRef(Serializable):
-    ref_type: str
+    ref_type: str = field(metadata=INTERNED)
     value: str
-    platform: str | None = None
+    platform: str | None = field(default=None, metadata=INTERNED)
     label: str | None = None
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TraceContext(Serializable):
     trace_id: str
     caused_by: tuple[str, ...] = field(default_factory=tuple)
@@ -33,17 +33,17 @@ class TraceContext(Serializable):
     redactions: tuple[str, ...] = field(default_factory=tuple)
     metadata: dict[str, str] = field(default_factory=dict)
     privacy_mode: bool = False
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SignalEnvelope(Serializable):
     signal_id: str
     timestamp: datetime
-    source: str
-    payload_type: str
+    source: str = field(metadata=INTERNED)
+    payload_type: str = field(metadata=INTERNED)
     payload: Any
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     entity_refs: tuple[EntityRef, ...] = field(default_factory=tuple)
     trace: TraceContext | None = None
     raw: dict[str, Any] | None = field(default=None, metadata={"omit_in_privacy_mode": True})
@@ -52,16 +52,64 @@ class SignalEnvelope(Serializable):
         object.__setattr__(self, "timestamp", ensure_utc(self.timestamp))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EmissionEnvelope(Serializable):
     emission_id: str
     timestamp: datetime
-    emission_type: str
+    emission_type: str = field(metadata=INTERNED)
     payload: Any
     caused_by: str
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     trace: TraceContext | None = None
     entity_refs: tuple[EntityRef, ...] = field(default_factory=tuple)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "timestamp", ensure_utc(self.timestamp))
+
+
+class _LazyEnvelope(LazyDecoded):
+    __slots__ = ("_typed_payload",)
+
+    payload_type_field: str = "payload_type"
+
+    def __init__(self, data: Mapping[str, Any], *, typed_payload: bool = False) -> None:
+        object.__setattr__(self, "_typed_payload", typed_payload)
+        super().__init__(data)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], *, typed_payload: bool = False) -> Any:
+        return cls(data, typed_payload=typed_payload)
+
+    def _decode_field(self, name: str) -> Any:
+        value = super()._decode_field(name)
+        if name == "payload" and self._typed_payload:
+            from metaspn_schemas.payloads import decode_payload
+
+            value = decode_payload(getattr(self, self.payload_type_field), value)
+            self._values[name] = value
+        return value
+
+
+class LazySignalEnvelope(_LazyEnvelope):
+    """`SignalEnvelope` view for routing: header fields decode up front, and
+    ``payload``/``raw``/``entity_refs``/``trace`` decode on first access.
+    With ``typed_payload=True`` the payload decodes through the payload registry.
+    """
+
+    __slots__ = ("signal_id", "timestamp", "source", "payload_type", "schema_version")
+
+    schema = SignalEnvelope
+    normalizers = {"timestamp": ensure_utc}
+
+
+class LazyEmissionEnvelope(_LazyEnvelope):
+    """`EmissionEnvelope` view with the same lazy split as `LazySignalEnvelope`."""
+
+    __slots__ = ("emission_id", "timestamp", "emission_type", "caused_by", "schema_version")
+
+    schema = EmissionEnvelope
+    normalizers = {"timestamp": ensure_utc}
+    payload_type_field = "emission_type"
+
+
+_install_setstate(globals())
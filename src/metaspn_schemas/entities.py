@@ -1,34 +1,37 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from metaspn_schemas.core import DEFAULT_SCHEMA_VERSION
-from metaspn_schemas.utils.serde import Serializable
+from metaspn_schemas.utils.serde import INTERNED, Serializable, _install_setstate
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntityResolved(Serializable):
     entity_id: str
     resolver: str
     resolved_at: datetime
     confidence: float
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntityMerged(Serializable):
     entity_id: str
     merged_from: tuple[str, ...]
     merged_at: datetime
     reason: str | None = None
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntityAliasAdded(Serializable):
     entity_id: str
     alias: str
     alias_type: str
     added_at: datetime
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
+
+
+_install_setstate(globals())
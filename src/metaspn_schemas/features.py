@@ -4,60 +4,60 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 from metaspn_schemas.core import DEFAULT_SCHEMA_VERSION
-from metaspn_schemas.utils.serde import Serializable
+from metaspn_schemas.utils.serde import INTERNED, Serializable, _install_setstate
 from metaspn_schemas.utils.time import ensure_utc
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProfileEnriched(Serializable):
     entity_id: str
     enriched_at: datetime
     summary: str
     topics: tuple[str, ...] = field(default_factory=tuple)
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "enriched_at", ensure_utc(self.enriched_at))
         object.__setattr__(self, "topics", tuple(sorted(self.topics)))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScoresComputed(Serializable):
     entity_id: str
     computed_at: datetime
     scores: dict[str, float]
-    scorer: str
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    scorer: str = field(metadata=INTERNED)
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "computed_at", ensure_utc(self.computed_at))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlaybookRouted(Serializable):
     task_id: str
     routed_at: datetime
     playbook: str
     rationale: str | None = None
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "routed_at", ensure_utc(self.routed_at))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameClassified(Serializable):
     entity_id: str
     classified_at: datetime
     label: str
     confidence: float
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "classified_at", ensure_utc(self.classified_at))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class M1ProfileEnrichment(Serializable):
     enrichment_id: str
     entity_id: str
@@ -66,7 +66,7 @@ class M1ProfileEnrichment(Serializable):
     organization: str
     topics: tuple[str, ...]
     evidence_summary: str
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     metadata: dict[str, str] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
@@ -74,7 +74,7 @@ class M1ProfileEnrichment(Serializable):
         object.__setattr__(self, "topics", tuple(sorted(self.topics)))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class M1ScoreCard(Serializable):
     score_id: str
     entity_id: str
@@ -82,15 +82,15 @@ class M1ScoreCard(Serializable):
     fit: float
     quality: float
     reply_likelihood: float
-    scorer: str
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    scorer: str = field(metadata=INTERNED)
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     scorer_metadata: dict[str, str] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "computed_at", ensure_utc(self.computed_at))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class M1RoutingRecommendation(Serializable):
     recommendation_id: str
     entity_id: str
@@ -99,8 +99,11 @@ class M1RoutingRecommendation(Serializable):
     rationale: str
     priority: int
     suggested_action: str
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     metadata: dict[str, str] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "recommended_at", ensure_utc(self.recommended_at))
+
+
+_install_setstate(globals())
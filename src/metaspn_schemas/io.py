@@ -0,0 +1,286 @@
+"""Streaming NDJSON readers and writers typed by schema class.
+
+Files are read in ``buffer_size`` blocks and decoded ``chunk_size`` lines at a
+time, so memory stays bounded by those two settings (plus the longest line)
+whatever the file size. Lines are written as canonical ``to_json()`` text.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import is_dataclass
+from typing import IO, Any, Callable, Iterable, Iterator, TypeVar, Union
+
+from metaspn_schemas.ingestion import IngestionParseErrorEvent
+from metaspn_schemas.utils.ids import generate_id
+from metaspn_schemas.utils.json_codec import _json_plan
+from metaspn_schemas.utils.serde import _codec_for
+from metaspn_schemas.utils.time import utc_now
+
+T = TypeVar("T")
+
+PathOrFile = Union[str, "os.PathLike[str]", IO[bytes], IO[str]]
+ParseErrorHandler = Callable[[IngestionParseErrorEvent], None]
+
+DEFAULT_BUFFER_SIZE = 1 << 20
+DEFAULT_CHUNK_SIZE = 1024
+# Malformed lines longer than this are truncated in IngestionParseErrorEvent.raw_payload.
+MAX_ERROR_LINE_LENGTH = 4096
+
+
+def iter_ndjson_lines(
+    fp: IO[bytes] | IO[str],
+    *,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> Iterator[tuple[int, Any]]:
+    """Yield ``(line_number, line)`` for each non-blank line, reading ``buffer_size`` at a time.
+
+    Line numbers are 1-based and count blank lines. Lines keep the file's type
+    (``bytes`` or ``str``) and have the trailing newline (and ``\\r``) stripped.
+    """
+    if buffer_size < 1:
+        raise ValueError("buffer_size must be >= 1")
+    line_number = 0
+    carry: Any = None
+    while True:
+        block = fp.read(buffer_size)
+        if not block:
+            break
+        newline = b"\n" if isinstance(block, bytes) else "\n"
+        lines = block.split(newline)
+        if carry is not None:
+            lines[0] = carry + lines[0]
+        carry = lines.pop()
+        for line in lines:
+            line_number += 1
+            line = line.rstrip()
+            if line:
+                yield line_number, line
+    if carry is not None:
+        carry = carry.rstrip()
+        if carry:
+            yield line_number + 1, carry
+
+
+def read_ndjson(
+    source: PathOrFile,
+    cls: type[T],
+    *,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    skip_malformed: bool = False,
+    on_error: ParseErrorHandler | None = None,
+    error_source: str | None = None,
+) -> Iterator[T]:
+    """Lazily decode an NDJSON file (path or open file) into ``cls`` instances.
+
+    A line that is not valid JSON, not an object, or does not decode into
+    ``cls`` raises ``ValueError`` naming its line number. With
+    ``skip_malformed=True`` it is skipped instead and, when ``on_error`` is
+    given, reported as an ``IngestionParseErrorEvent`` (``source`` is
+    ``error_source``, defaulting to the file name).
+    """
+    if not is_dataclass(cls):
+        raise TypeError("read_ndjson expects a dataclass type")
+    if buffer_size < 1:
+        raise ValueError("buffer_size must be >= 1")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    if error_source is None:
+        if isinstance(source, (str, os.PathLike)):
+            error_source = os.fspath(source)
+        else:
+            error_source = str(getattr(source, "name", "ndjson"))
+    return _read_ndjson(source, cls, buffer_size, chunk_size, skip_malformed, on_error, error_source)
+
+
+def write_ndjson(
+    target: PathOrFile,
+    objs: Iterable[Any],
+    *,
+    privacy_mode: bool = False,
+    append: bool = False,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> int:
+    """Write one canonical JSON line per object; returns the number of lines written."""
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "ab" if append else "wb", buffering=0) as fp:
+            with NdjsonWriter(fp, privacy_mode=privacy_mode, buffer_size=buffer_size) as writer:
+                writer.write_many(objs)
+        return writer.count
+    with NdjsonWriter(target, privacy_mode=privacy_mode, buffer_size=buffer_size) as writer:
+        writer.write_many(objs)
+    return writer.count
+
+
+class NdjsonWriter:
+    """Buffered NDJSON writer over an open binary or text file.
+
+    Lines are flushed to the file whenever about ``buffer_size`` characters are
+    pending and on ``flush()`` / ``close()``; the file itself is left open.
+    """
+
+    __slots__ = ("fp", "privacy_mode", "buffer_size", "count", "_binary", "_pending", "_pending_size")
+
+    def __init__(
+        self,
+        fp: IO[bytes] | IO[str],
+        *,
+        privacy_mode: bool = False,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be >= 1")
+        self.fp = fp
+        self.privacy_mode = privacy_mode
+        self.buffer_size = buffer_size
+        self.count = 0
+        self._binary = not hasattr(fp, "encoding")
+        self._pending: list[str] = []
+        self._pending_size = 0
+
+    def __enter__(self) -> NdjsonWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def write(self, obj: Any) -> None:
+        self.write_many((obj,))
+
+    def write_many(self, objs: Iterable[Any]) -> int:
+        privacy_mode = self.privacy_mode
+        pending = self._pending
+        plan_type: type | None = None
+        plan = None
+        written = 0
+        for obj in objs:
+            cls = type(obj)
+            if cls is not plan_type:
+                if not is_dataclass(cls):
+                    raise TypeError("NdjsonWriter expects dataclass instances")
+                plan, plan_type = _json_plan(cls, privacy_mode), cls
+            line = plan.encode(obj, privacy_mode) + "\n"  # type: ignore[union-attr]
+            pending.append(line)
+            self._pending_size += len(line)
+            written += 1
+            if self._pending_size >= self.buffer_size:
+                self.flush()
+        self.count += written
+        return written
+
+    def flush(self) -> None:
+        if self._pending:
+            text = "".join(self._pending)
+            # Canonical JSON is pure ASCII.
+            self.fp.write(text.encode("ascii") if self._binary else text)  # type: ignore[arg-type]
+            self._pending.clear()
+            self._pending_size = 0
+
+    def close(self) -> None:
+        self.flush()
+
+
+def _read_ndjson(
+    source: PathOrFile,
+    cls: type[T],
+    buffer_size: int,
+    chunk_size: int,
+    skip_malformed: bool,
+    on_error: ParseErrorHandler | None,
+    error_source: str,
+) -> Iterator[T]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb", buffering=0) as fp:
+            yield from _decode_lines(fp, cls, buffer_size, chunk_size, skip_malformed, on_error, error_source)
+    else:
+        yield from _decode_lines(source, cls, buffer_size, chunk_size, skip_malformed, on_error, error_source)
+
+
+def _decode_lines(
+    fp: IO[bytes] | IO[str],
+    cls: type[T],
+    buffer_size: int,
+    chunk_size: int,
+    skip_malformed: bool,
+    on_error: ParseErrorHandler | None,
+    error_source: str,
+) -> Iterator[T]:
+    codec = _codec_for(cls)
+    loads = json.loads
+    numbers: list[int] = []
+    rows: list[Any] = []
+    texts: list[Any] = []
+    for line_number, line in iter_ndjson_lines(fp, buffer_size=buffer_size):
+        try:
+            row = loads(line)
+        except ValueError as err:
+            _malformed(line_number, line, err, skip_malformed, on_error, error_source)
+            continue
+        if type(row) is not dict:
+            _malformed(
+                line_number,
+                line,
+                ValueError(f"expected a JSON object, got {type(row).__name__}"),
+                skip_malformed,
+                on_error,
+                error_source,
+            )
+            continue
+        numbers.append(line_number)
+        rows.append(row)
+        texts.append(line)
+        if len(rows) >= chunk_size:
+            yield from _decode_chunk(codec, numbers, rows, texts, skip_malformed, on_error, error_source)
+            numbers, rows, texts = [], [], []
+    if rows:
+        yield from _decode_chunk(codec, numbers, rows, texts, skip_malformed, on_error, error_source)
+
+
+def _decode_chunk(
+    codec: Any,
+    numbers: list[int],
+    rows: list[dict[str, Any]],
+    texts: list[Any],
+    skip_malformed: bool,
+    on_error: ParseErrorHandler | None,
+    error_source: str,
+) -> list[Any]:
+    # Column-wise first; only a failing chunk is re-decoded row by row to find the bad lines.
+    try:
+        return codec.decode_many(rows)
+    except Exception:  # noqa: BLE001
+        pass
+    decoded = []
+    for line_number, row, text in zip(numbers, rows, texts):
+        try:
+            decoded.append(codec.decode(row))
+        except Exception as err:  # noqa: BLE001
+            _malformed(line_number, text, err, skip_malformed, on_error, error_source)
+    return decoded
+
+
+def _malformed(
+    line_number: int,
+    line: Any,
+    err: Exception,
+    skip_malformed: bool,
+    on_error: ParseErrorHandler | None,
+    error_source: str,
+) -> None:
+    if not skip_malformed:
+        raise ValueError(f"{error_source}:{line_number}: {err}") from err
+    if on_error is None:
+        return
+    text = line.decode("utf-8", "replace") if isinstance(line, bytes) else line
+    on_error(
+        IngestionParseErrorEvent(
+            error_id=generate_id("err"),
+            source=error_source,
+            occurred_at=utc_now(),
+            error_type=type(err).__name__,
+            message=str(err),
+            raw_payload={"line_number": line_number, "line": text[:MAX_ERROR_LINE_LENGTH]},
+        )
+    )
@@ -4,11 +4,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 from metaspn_schemas.core import DEFAULT_SCHEMA_VERSION
-from metaspn_schemas.utils.serde import Serializable
+from metaspn_schemas.utils.serde import INTERNED, Serializable, _install_setstate
 from metaspn_schemas.utils.time import ensure_utc
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LearningOutcomeWindow(Serializable):
     window_id: str
     entity_id: str
@@ -17,7 +17,7 @@ class LearningOutcomeWindow(Serializable):
     window_end: datetime
     outcome: str
     success: bool
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     metrics: dict[str, float] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
@@ -26,7 +26,7 @@ class LearningOutcomeWindow(Serializable):
         object.__setattr__(self, "window_end", ensure_utc(self.window_end))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FailureLabel(Serializable):
     label_id: str
     entity_id: str
@@ -34,14 +34,14 @@ class FailureLabel(Serializable):
     code: str
     evidence: str
     labeled_at: datetime
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     metadata: dict[str, str] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "labeled_at", ensure_utc(self.labeled_at))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GateCalibrationRecommendation(Serializable):
     recommendation_id: str
     gate_name: str
@@ -50,7 +50,7 @@ class GateCalibrationRecommendation(Serializable):
     cooldown_seconds_delta: int
     confidence: float
     rationale: str
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     based_on_windows: tuple[str, ...] = field(default_factory=tuple)
     metadata: dict[str, str] = field(default_factory=dict)
 
@@ -59,7 +59,7 @@ class GateCalibrationRecommendation(Serializable):
         object.__setattr__(self, "based_on_windows", tuple(sorted(self.based_on_windows)))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PolicyOverrideReview(Serializable):
     review_id: str
     recommendation_id: str
@@ -67,10 +67,13 @@ class PolicyOverrideReview(Serializable):
     reviewed_at: datetime
     reviewer: str
     reason: str
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     applied_threshold_delta: float | None = None
     applied_cooldown_seconds_delta: int | None = None
     metadata: dict[str, str] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "reviewed_at", ensure_utc(self.reviewed_at))
+
+
+_install_setstate(globals())
@@ -0,0 +1,162 @@
+"""Process-pool decoding of large JSON line batches.
+
+Lines are sharded into ``chunk_size`` chunks; each worker parses and decodes a
+whole chunk column-wise and sends the schema objects back pickled. Results are
+yielded in input order, with at most ``prefetch`` chunks per worker in flight,
+so an unbounded stream of lines is decoded in bounded memory.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from array import array
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import is_dataclass
+from itertools import islice
+from typing import Any, Iterable, Iterator, TypeVar
+
+from metaspn_schemas.io import DEFAULT_BUFFER_SIZE, PathOrFile, iter_ndjson_lines
+from metaspn_schemas.utils.serde import _codec_for
+
+T = TypeVar("T")
+
+DEFAULT_CHUNK_SIZE = 2048
+DEFAULT_PREFETCH = 2
+
+
+def decode_parallel(
+    cls: type[T],
+    lines: Iterable[str | bytes],
+    *,
+    max_workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    prefetch: int = DEFAULT_PREFETCH,
+    executor: Executor | None = None,
+) -> Iterator[T]:
+    """Decode JSON object lines into ``cls`` across worker processes, preserving order.
+
+    ``max_workers`` defaults to ``os.cpu_count()``; ``max_workers=1`` without an
+    ``executor`` decodes in this process. A caller-owned ``executor`` is reused and
+    left running. A line that fails raises ``ValueError`` naming its 1-based position.
+    """
+    _check_options(cls, max_workers, chunk_size, prefetch)
+    return _decode_numbered(cls, enumerate(lines, 1), max_workers, chunk_size, prefetch, executor)
+
+
+def read_ndjson_parallel(
+    source: PathOrFile,
+    cls: type[T],
+    *,
+    max_workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    prefetch: int = DEFAULT_PREFETCH,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    executor: Executor | None = None,
+) -> Iterator[T]:
+    """``decode_parallel`` over the non-blank lines of an NDJSON path or open file."""
+    _check_options(cls, max_workers, chunk_size, prefetch)
+    if isinstance(source, (str, os.PathLike)):
+        return _read_path(source, cls, max_workers, chunk_size, prefetch, buffer_size, executor)
+    lines = iter_ndjson_lines(source, buffer_size=buffer_size)
+    return _decode_numbered(cls, lines, max_workers, chunk_size, prefetch, executor)
+
+
+def _read_path(
+    path: str | os.PathLike[str],
+    cls: type[T],
+    max_workers: int | None,
+    chunk_size: int,
+    prefetch: int,
+    buffer_size: int,
+    executor: Executor | None,
+) -> Iterator[T]:
+    with open(path, "rb", buffering=0) as fp:
+        lines = iter_ndjson_lines(fp, buffer_size=buffer_size)
+        yield from _decode_numbered(cls, lines, max_workers, chunk_size, prefetch, executor)
+
+
+def _check_options(cls: type, max_workers: int | None, chunk_size: int, prefetch: int) -> None:
+    if not is_dataclass(cls):
+        raise TypeError("decode_parallel expects a dataclass type")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    if prefetch < 1:
+        raise ValueError("prefetch must be >= 1")
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+
+
+def _decode_numbered(
+    cls: type[T],
+    numbered_lines: Iterable[tuple[int, str | bytes]],
+    max_workers: int | None,
+    chunk_size: int,
+    prefetch: int,
+    executor: Executor | None,
+) -> Iterator[T]:
+    return _merge_chunks(cls, _chunks(iter(numbered_lines), chunk_size), max_workers, prefetch, executor)
+
+
+def _merge_chunks(
+    cls: type[T],
+    chunks: Iterator[tuple[array[int], list[str | bytes]]],
+    max_workers: int | None,
+    prefetch: int,
+    executor: Executor | None,
+) -> Iterator[T]:
+    if executor is None and max_workers == 1:
+        for numbers, lines in chunks:
+            yield from _decode_chunk(cls, numbers, lines)
+        return
+
+    workers = max_workers or os.cpu_count() or 1
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    pending: deque[Any] = deque()
+    try:
+        for numbers, lines in chunks:
+            pending.append(pool.submit(_decode_chunk, cls, numbers, lines))
+            if len(pending) >= workers * prefetch:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if executor is None:
+            pool.shutdown(wait=True)
+
+
+def _chunks(
+    numbered_lines: Iterator[tuple[int, str | bytes]],
+    chunk_size: int,
+) -> Iterator[tuple[array[int], list[str | bytes]]]:
+    while True:
+        chunk = list(islice(numbered_lines, chunk_size))
+        if not chunk:
+            return
+        # Line numbers travel as a compact array; they are only read on errors.
+        yield array("Q", [number for number, _ in chunk]), [line for _, line in chunk]
+
+
+def _decode_chunk(cls: type[T], numbers: array[int], lines: list[str | bytes]) -> list[T]:
+    codec = _codec_for(cls)
+    loads = json.loads
+    try:
+        rows = [loads(line) for line in lines]
+        if all(type(row) is dict for row in rows):
+            return codec.decode_many(rows)
+    except Exception:  # noqa: BLE001
+        pass
+    # Re-run row by row so the error names the first failing line.
+    decoded = []
+    for number, line in zip(numbers, lines):
+        try:
+            row = loads(line)
+            if type(row) is not dict:
+                raise ValueError(f"expected a JSON object, got {type(row).__name__}")
+            decoded.append(codec.decode(row))
+        except Exception as err:  # noqa: BLE001
+            raise ValueError(f"line {number}: {err}") from err
+    return decoded
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Any, Callable, Mapping, TypeVar
+
+from metaspn_schemas.core import EmissionEnvelope, SignalEnvelope
+from metaspn_schemas.entities import EntityAliasAdded, EntityMerged, EntityResolved
+from metaspn_schemas.features import (
+    GameClassified,
+    M1ProfileEnrichment,
+    M1RoutingRecommendation,
+    M1ScoreCard,
+    PlaybookRouted,
+    ProfileEnriched,
+    ScoresComputed,
+)
+from metaspn_schemas.ingestion import (
+    IngestionParseErrorEvent,
+    NormalizedSocialPostSeenEvent,
+    RawSocialPostSeenEvent,
+    ResolverHandoff,
+)
+from metaspn_schemas.learning import (
+    FailureLabel,
+    GateCalibrationRecommendation,
+    LearningOutcomeWindow,
+    PolicyOverrideReview,
+)
+from metaspn_schemas.outcomes import MeetingBooked, MessageSent, NoReply, NoReplyObserved, ReplyReceived, RevenueEvent
+from metaspn_schemas.recommendations import ApprovalOverride, DailyDigestEntry, DraftMessage, Recommendation
+from metaspn_schemas.season1 import SEASON1_PAYLOAD_PARSERS
+from metaspn_schemas.social import ProfileSnapshotSeen, SocialPostSeen
+from metaspn_schemas.state_fragments import Attempts, Cooldowns, Evidence, Identity, Scores
+from metaspn_schemas.state_machine import (
+    CalibrationRecord,
+    FailureTaxonomyRecord,
+    GateTransitionAttempt,
+    OutcomeWindowEvaluation,
+    StateTransitionRule,
+    parse_state_machine_config,
+)
+from metaspn_schemas.tasks import Result, Task
+from metaspn_schemas.token_promises import (
+    CreatorBehaviorCorrelation,
+    PromiseEvaluated,
+    PromisePredictiveAccuracy,
+    PromiseRegistered,
+    TokenHealthScoreCard,
+    TokenOutcomeObserved,
+    TokenOutcomeWindow,
+    TokenSignalSeen,
+)
+from metaspn_schemas.utils.serde import Serializable
+
+E = TypeVar("E", SignalEnvelope, EmissionEnvelope)
+
+PayloadDecoder = Callable[[Mapping[str, Any]], Serializable]
+
+_PAYLOAD_CLASSES: tuple[type[Serializable], ...] = (
+    SocialPostSeen,
+    ProfileSnapshotSeen,
+    ProfileEnriched,
+    ScoresComputed,
+    PlaybookRouted,
+    GameClassified,
+    M1ProfileEnrichment,
+    M1ScoreCard,
+    M1RoutingRecommendation,
+    EntityResolved,
+    EntityMerged,
+    EntityAliasAdded,
+    MessageSent,
+    ReplyReceived,
+    MeetingBooked,
+    RevenueEvent,
+    NoReplyObserved,
+    NoReply,
+    RawSocialPostSeenEvent,
+    NormalizedSocialPostSeenEvent,
+    IngestionParseErrorEvent,
+    ResolverHandoff,
+    Recommendation,
+    DailyDigestEntry,
+    DraftMessage,
+    ApprovalOverride,
+    LearningOutcomeWindow,
+    FailureLabel,
+    GateCalibrationRecommendation,
+    PolicyOverrideReview,
+    TokenSignalSeen,
+    PromiseRegistered,
+    PromiseEvaluated,
+    TokenHealthScoreCard,
+    TokenOutcomeObserved,
+    TokenOutcomeWindow,
+    PromisePredictiveAccuracy,
+    CreatorBehaviorCorrelation,
+    StateTransitionRule,
+    GateTransitionAttempt,
+    OutcomeWindowEvaluation,
+    CalibrationRecord,
+    FailureTaxonomyRecord,
+    Task,
+    Result,
+    Identity,
+    Evidence,
+    Scores,
+    Cooldowns,
+    Attempts,
+)
+
+PAYLOAD_DECODERS: dict[str, PayloadDecoder] = {cls.__name__: cls.from_dict for cls in _PAYLOAD_CLASSES}
+PAYLOAD_DECODERS["StateMachineConfig"] = parse_state_machine_config
+PAYLOAD_DECODERS.update(SEASON1_PAYLOAD_PARSERS)
+
+
+def register_payload_type(
+    payload_type: str,
+    decoder: type[Serializable] | PayloadDecoder,
+    *,
+    replace_existing: bool = False,
+) -> None:
+    if payload_type in PAYLOAD_DECODERS and not replace_existing:
+        raise ValueError(f"payload_type already registered: {payload_type}")
+    if isinstance(decoder, type) and issubclass(decoder, Serializable):
+        decoder = decoder.from_dict
+    PAYLOAD_DECODERS[payload_type] = decoder
+
+
+def decode_payload(payload_type: str, payload: Any, *, strict: bool = False) -> Any:
+    """Decode ``payload`` into the schema object registered for ``payload_type``.
+
+    Payloads that are not mappings (already-typed objects, ``None``) are returned
+    unchanged, as are payloads of unregistered types unless ``strict`` is set.
+    """
+    decoder = PAYLOAD_DECODERS.get(payload_type)
+    if decoder is None:
+        if strict:
+            raise ValueError(f"Unknown payload_type: {payload_type}")
+        return payload
+    if not isinstance(payload, Mapping):
+        return payload
+    return decoder(payload)
+
+
+def decode_typed_envelope(cls: type[E], data: Mapping[str, Any], *, strict: bool = False) -> E:
+    """Decode an envelope dict with its payload decoded to the registered schema object."""
+    payload_type = data.get(_payload_type_field(cls))
+    if payload_type is None or "payload" not in data:
+        return cls.from_dict(data)
+    typed = dict(data)
+    typed["payload"] = decode_payload(payload_type, data["payload"], strict=strict)
+    return cls.from_dict(typed)
+
+
+def with_typed_payload(envelope: E, *, strict: bool = False) -> E:
+    payload_type = getattr(envelope, _payload_type_field(type(envelope)))
+    payload = decode_payload(payload_type, envelope.payload, strict=strict)
+    if payload is envelope.payload:
+        return envelope
+    return replace(envelope, payload=payload)
+
+
+def _payload_type_field(cls: type) -> str:
+    if issubclass(cls, SignalEnvelope):
+        return "payload_type"
+    if issubclass(cls, EmissionEnvelope):
+        return "emission_type"
+    raise TypeError(f"expected SignalEnvelope or EmissionEnvelope, got {cls.__name__}")
@@ -4,11 +4,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 from metaspn_schemas.core import DEFAULT_SCHEMA_VERSION
-from metaspn_schemas.utils.serde import Serializable
+from metaspn_schemas.utils.serde import INTERNED, Serializable, _install_setstate
 from metaspn_schemas.utils.time import ensure_utc
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Recommendation(Serializable):
     recommendation_id: str
     entity_id: str
@@ -17,36 +17,36 @@ class Recommendation(Serializable):
     rationale: str
     priority: int
     created_at: datetime
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     metadata: dict[str, str] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "created_at", ensure_utc(self.created_at))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyDigestEntry(Serializable):
     digest_entry_id: str
     entity_id: str
     rank: int
     action_item: str
     created_at: datetime
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     metadata: dict[str, str] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "created_at", ensure_utc(self.created_at))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DraftMessage(Serializable):
     draft_id: str
     entity_id: str
-    channel: str
+    channel: str = field(metadata=INTERNED)
     body: str
     tone: str
     created_at: datetime
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     subject: str | None = None
     constraints: tuple[str, ...] = field(default_factory=tuple)
     metadata: dict[str, str] = field(default_factory=dict)
@@ -56,14 +56,14 @@ class DraftMessage(Serializable):
         object.__setattr__(self, "constraints", tuple(sorted(self.constraints)))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ApprovalOverride(Serializable):
     approval_id: str
     draft_id: str
-    status: str
+    status: str = field(metadata=INTERNED)
     reason: str
     reviewed_at: datetime
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     edited_subject: str | None = None
     edited_body: str | None = None
     reviewer: str | None = None
@@ -71,3 +71,6 @@ class ApprovalOverride(Serializable):
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "reviewed_at", ensure_utc(self.reviewed_at))
+
+
+_install_setstate(globals())
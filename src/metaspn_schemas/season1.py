@@ -1,22 +1,27 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
-from typing import Any, Mapping
+from itertools import compress
+from operator import attrgetter, itemgetter
+from sys import intern
+from typing import Any, Callable, ClassVar, Iterable, Mapping, Sequence, TypeVar
 
 from metaspn_schemas.core import DEFAULT_SCHEMA_VERSION
-from metaspn_schemas.utils.serde import Serializable
+from metaspn_schemas.utils.serde import INTERNED, Serializable, _install_setstate
 from metaspn_schemas.utils.time import ensure_utc
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SeasonAccountView(Serializable):
     season_id: int
     authority: str
     towel_mint: str
     active: bool
     started_at: datetime
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     ended_at: datetime | None = None
     reward_pool_total: int = 0
     reward_pool_remaining: int = 0
@@ -30,27 +35,27 @@ class SeasonAccountView(Serializable):
             object.__setattr__(self, "ended_at", ensure_utc(self.ended_at))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameAccountView(Serializable):
     season_id: int
     game_id: int
     attention_score_bps: int
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     metadata: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StakeAccountView(Serializable):
     owner: str
     season_id: int
     game_id: int
     amount: int
     active: bool
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     metadata: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlayerAccountView(Serializable):
     owner: str
     season_id: int
@@ -58,27 +63,27 @@ class PlayerAccountView(Serializable):
     staked_towel: int
     claimed_rewards: int
     has_claimed: bool
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     metadata: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FounderStakeView(Serializable):
     owner: str
     season_id: int
     amount: int
     active: bool
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     metadata: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AttentionScoreUpdate(Serializable):
     season_id: int
     game_id: int
     attention_score_bps: int
     updated_at: datetime
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     updated_by: str | None = None
     metadata: dict[str, str] = field(default_factory=dict)
 
@@ -86,7 +91,7 @@ class AttentionScoreUpdate(Serializable):
         object.__setattr__(self, "updated_at", ensure_utc(self.updated_at))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RewardProjection(Serializable):
     projection_id: str
     owner: str
@@ -97,22 +102,22 @@ class RewardProjection(Serializable):
     reward_pool_total: int
     reward_pool_remaining: int
     projected_payout: int
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     metadata: dict[str, str] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "projected_at", ensure_utc(self.projected_at))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RewardClaim(Serializable):
     claim_id: str
     owner: str
     season_id: int
     claimed_at: datetime
     amount: int
-    status: str
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    status: str = field(metadata=INTERNED)
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     transaction_signature: str | None = None
     metadata: dict[str, str] = field(default_factory=dict)
 
@@ -120,6 +125,207 @@ class RewardClaim(Serializable):
         object.__setattr__(self, "claimed_at", ensure_utc(self.claimed_at))
 
 
+C = TypeVar("C", bound="_AccountColumns")
+
+
+def _int_column_values(values: list[int]) -> array | list[int]:
+    for typecode in ("q", "Q"):
+        try:
+            return array(typecode, values)
+        except OverflowError:
+            pass
+    return values
+
+
+class _AccountColumns:
+    """Struct-of-arrays storage shared by the Season 1 account column containers.
+
+    Integer columns are ``array("q")`` (signed 64-bit), widened to ``array("Q")``
+    when a column holds u64 values of ``2**63`` or more and to a plain ``list``
+    when it fits neither; boolean columns are ``array("b")``, ``owner`` and ``schema_version`` are lists of interned strings,
+    and ``metadata`` holds only the non-empty metadata dicts keyed by row index.
+    """
+
+    __slots__ = ()
+
+    view_type: ClassVar[type]
+    int_columns: ClassVar[tuple[str, ...]]
+    bool_columns: ClassVar[tuple[str, ...]]
+
+    owner: list[str]
+    schema_version: list[str]
+    metadata: dict[int, dict[str, str]]
+    _group_cache: dict[Any, Any]
+
+    def __post_init__(self) -> None:
+        rows = len(self.owner)
+        for name in (*self.int_columns, *self.bool_columns, "schema_version"):
+            size = len(getattr(self, name))
+            if size != rows:
+                raise ValueError(f"column {name} has {size} rows, expected {rows}")
+        for index in self.metadata:
+            if not 0 <= index < rows:
+                raise ValueError(f"metadata row index out of range: {index}")
+
+    def __len__(self) -> int:
+        return len(self.owner)
+
+    @classmethod
+    def from_views(cls: type[C], views: Iterable[Any]) -> C:
+        views = list(views)
+        for view in views:
+            if not isinstance(view, cls.view_type):
+                raise TypeError(f"expected {cls.view_type.__name__}, got {type(view).__name__}")
+        columns: dict[str, Any] = {
+            "owner": [intern(view.owner) for view in views],
+            "schema_version": [intern(view.schema_version) for view in views],
+            "metadata": {index: dict(view.metadata) for index, view in enumerate(views) if view.metadata},
+        }
+        for name in cls.int_columns:
+            columns[name] = _int_column_values([getattr(view, name) for view in views])
+        for name in cls.bool_columns:
+            columns[name] = array("b", map(attrgetter(name), views))
+        return cls(**columns)
+
+    def to_views(self) -> list[Any]:
+        view_type = self.view_type
+        metadata = self.metadata
+        names = _view_columns(view_type)
+        columns = [map(bool, self._column(name)) if name in self.bool_columns else self._column(name) for name in names]
+        return [
+            view_type(*values, metadata=dict(metadata[index]) if index in metadata else {})
+            for index, values in enumerate(zip(*columns))
+        ]
+
+    def row(self, index: int) -> Any:
+        if index < 0:
+            index += len(self)
+        values = [
+            bool(self._column(name)[index]) if name in self.bool_columns else self._column(name)[index]
+            for name in _view_columns(self.view_type)
+        ]
+        return self.view_type(*values, metadata=dict(self.metadata.get(index, {})))
+
+    def total(self, column: str, *, where: str | None = None) -> int:
+        """Sum an integer column, optionally only over rows where bool column ``where`` is set."""
+        values = self._int_column(column)
+        if where is not None:
+            return sum(compress(values, self._bool_column(where)))
+        return sum(values)
+
+    def sum_by(self, key: str, column: str, *, where: str | None = None) -> dict[Any, int]:
+        """Group integer column ``column`` by ``key`` (``owner`` or an integer column) and sum.
+
+        The first call per ``key`` sorts the row order once and caches the group
+        boundaries plus each column permuted into that order; aggregates then sum
+        contiguous array slices. Result keys are in sorted order.
+        """
+        if key != "owner":
+            self._int_column(key)
+        values = self._int_column(column)
+        mask = self._bool_column(where) if where is not None else None
+        if len(self) < 2:
+            return _group_sum(self._column(key), values, mask)
+        groups = self._group_index(key)[1]
+        ordered = self._grouped_column(key, column)
+        if mask is None:
+            return {group: sum(ordered[start:end]) for group, start, end in groups}
+        selected = self._grouped_column(key, where)
+        return {
+            group: sum(compress(ordered[start:end], selected[start:end]))
+            for group, start, end in groups
+            if any(selected[start:end])
+        }
+
+    def _group_index(self, key: str) -> tuple[Callable[[Sequence[Any]], tuple[Any, ...]], list[tuple[Any, int, int]]]:
+        cached = self._group_cache.get(key)
+        if cached is None:
+            keys = self._column(key)
+            take = itemgetter(*sorted(range(len(keys)), key=keys.__getitem__))
+            ordered_keys = take(keys)
+            groups = []
+            start = 0
+            for group in sorted(set(keys)):
+                end = bisect_right(ordered_keys, group, start)
+                groups.append((group, start, end))
+                start = end
+            cached = self._group_cache[key] = (take, groups)
+        return cached
+
+    def _grouped_column(self, key: str, column: str) -> Sequence[int]:
+        cached = self._group_cache.get((key, column))
+        if cached is None:
+            values = self._column(column)
+            take = self._group_index(key)[0]
+            ordered = take(values)
+            cached = self._group_cache[(key, column)] = (
+                array(values.typecode, ordered) if isinstance(values, array) else list(ordered)
+            )
+        return cached
+
+    def _column(self, name: str) -> Sequence[Any]:
+        return getattr(self, name)
+
+    def _int_column(self, name: str) -> Sequence[int]:
+        if name not in self.int_columns:
+            raise ValueError(f"not an integer column: {name}")
+        return getattr(self, name)
+
+    def _bool_column(self, name: str) -> array:
+        if name not in self.bool_columns:
+            raise ValueError(f"not a boolean column: {name}")
+        return getattr(self, name)
+
+
+@dataclass(frozen=True, slots=True)
+class StakeAccountColumns(_AccountColumns):
+    """Columnar snapshot of many ``StakeAccountView`` rows."""
+
+    view_type: ClassVar[type] = StakeAccountView
+    int_columns: ClassVar[tuple[str, ...]] = ("season_id", "game_id", "amount")
+    bool_columns: ClassVar[tuple[str, ...]] = ("active",)
+
+    owner: list[str]
+    season_id: array | list[int]
+    game_id: array | list[int]
+    amount: array | list[int]
+    active: array
+    schema_version: list[str]
+    metadata: dict[int, dict[str, str]] = field(default_factory=dict)
+    _group_cache: dict[Any, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def total_staked(self, *, active_only: bool = True) -> int:
+        return self.total("amount", where="active" if active_only else None)
+
+    def total_staked_by_game(self, *, active_only: bool = True) -> dict[int, int]:
+        return self.sum_by("game_id", "amount", where="active" if active_only else None)
+
+    def total_staked_by_owner(self, *, active_only: bool = True) -> dict[str, int]:
+        return self.sum_by("owner", "amount", where="active" if active_only else None)
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerAccountColumns(_AccountColumns):
+    """Columnar snapshot of many ``PlayerAccountView`` rows."""
+
+    view_type: ClassVar[type] = PlayerAccountView
+    int_columns: ClassVar[tuple[str, ...]] = ("season_id", "issued_towel_balance", "staked_towel", "claimed_rewards")
+    bool_columns: ClassVar[tuple[str, ...]] = ("has_claimed",)
+
+    owner: list[str]
+    season_id: array | list[int]
+    issued_towel_balance: array | list[int]
+    staked_towel: array | list[int]
+    claimed_rewards: array | list[int]
+    has_claimed: array
+    schema_version: list[str]
+    metadata: dict[int, dict[str, str]] = field(default_factory=dict)
+    _group_cache: dict[Any, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def sum_by_owner(self, column: str) -> dict[str, int]:
+        return self.sum_by("owner", column)
+
+
 SEASON1_PAYLOAD_PARSERS: dict[str, Any] = {
     "SeasonAccountView": lambda data: parse_season_account_view(data),
     "GameAccountView": lambda data: parse_game_account_view(data),
@@ -161,6 +367,77 @@ def validate_season1_payload(
     return validator(payload_or_obj)
 
 
+@dataclass(frozen=True, slots=True)
+class Season1BatchValidation:
+    """Result of ``validate_season1_batch``.
+
+    Bit ``i % 8`` of ``valid_mask[i // 8]`` is set when row ``i`` is valid; ``errors``
+    only has entries for the rows that failed.
+    """
+
+    payload_type: str
+    size: int
+    valid_mask: bytes
+    errors: dict[int, tuple[str, ...]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def all_valid(self) -> bool:
+        return not self.errors
+
+    @property
+    def valid_count(self) -> int:
+        return self.size - len(self.errors)
+
+    def is_valid(self, index: int) -> bool:
+        if not 0 <= index < self.size:
+            raise IndexError(f"row index out of range: {index}")
+        return bool(self.valid_mask[index >> 3] & (1 << (index & 7)))
+
+    def verdict(self, index: int) -> tuple[bool, tuple[str, ...]]:
+        """The ``(is_valid, errors)`` pair the per-row validator returns for row ``index``."""
+        if self.is_valid(index):
+            return (True, ())
+        return (False, self.errors[index])
+
+    def invalid_rows(self) -> list[int]:
+        return sorted(self.errors)
+
+
+def validate_season1_batch(
+    payload_type: str,
+    rows: Iterable[Serializable | Mapping[str, Any]],
+) -> Season1BatchValidation:
+    """Validate many Season 1 payloads at once with the per-row validator rules.
+
+    Mapping rows are normalized and decoded column-wise through ``from_dicts``; each
+    rule then runs over whole columns. Verdicts match ``validate_season1_payload``.
+    """
+    rows = rows if isinstance(rows, list) else list(rows)
+    size = len(rows)
+    contract = _SEASON1_CONTRACTS.get(payload_type)
+    if contract is None:
+        unknown = (f"unknown_payload_type: {payload_type}",)
+        return Season1BatchValidation(payload_type, size, bytes((size + 7) // 8), dict.fromkeys(range(size), unknown))
+
+    cls, normalizer, rules = contract
+    failures: dict[int, list[str]] = {}
+    indices, views = _decode_batch(cls, normalizer, rows, failures)
+    columns: dict[str, list[Any]] = {}
+    for names, violated, message in rules:
+        for name in names:
+            if name not in columns:
+                columns[name] = list(map(attrgetter(name), views))
+        flags = map(violated, *(columns[name] for name in names))
+        for position in compress(range(len(views)), flags):
+            failures.setdefault(indices[position], []).append(message)
+
+    errors = {index: tuple(dict.fromkeys(failures[index])) for index in sorted(failures)}
+    return Season1BatchValidation(payload_type, size, _valid_mask(size, errors), errors)
+
+
 def parse_season_account_view(data: Mapping[str, Any]) -> SeasonAccountView:
     return SeasonAccountView.from_dict(_normalize_season_account_payload(data))
 
@@ -168,11 +445,7 @@ def parse_season_account_view(data: Mapping[str, Any]) -> SeasonAccountView:
 def validate_season_account_view(
     view_or_payload: SeasonAccountView | Mapping[str, Any],
 ) -> tuple[bool, tuple[str, ...]]:
-    return _validate_account_view_common(
-        view_or_payload,
-        parse_season_account_view,
-        min_fields=("season_id", "authority", "towel_mint", "started_at"),
-    )
+    return _validate_view(view_or_payload, SeasonAccountView, parse_season_account_view, _SEASON_ACCOUNT_RULES)
 
 
 def parse_game_account_view(data: Mapping[str, Any]) -> GameAccountView:
@@ -182,21 +455,7 @@ def parse_game_account_view(data: Mapping[str, Any]) -> GameAccountView:
 def validate_game_account_view(
     view_or_payload: GameAccountView | Mapping[str, Any],
 ) -> tuple[bool, tuple[str, ...]]:
-    try:
-        view = view_or_payload if isinstance(view_or_payload, GameAccountView) else parse_game_account_view(view_or_payload)
-    except Exception as err:  # noqa: BLE001
-        return (False, (f"parse_error: {err}",))
-
-    errors: list[str] = []
-    if view.season_id <= 0:
-        errors.append("season_id must be > 0")
-    if view.game_id <= 0:
-        errors.append("game_id must be > 0")
-    if view.attention_score_bps < 0 or view.attention_score_bps > 10_000:
-        errors.append("attention_score_bps must be between 0 and 10000")
-
-    deduped = tuple(dict.fromkeys(errors))
-    return (not deduped, deduped)
+    return _validate_view(view_or_payload, GameAccountView, parse_game_account_view, _GAME_ACCOUNT_RULES)
 
 
 def parse_stake_account_view(data: Mapping[str, Any]) -> StakeAccountView:
@@ -206,23 +465,7 @@ def parse_stake_account_view(data: Mapping[str, Any]) -> StakeAccountView:
 def validate_stake_account_view(
     view_or_payload: StakeAccountView | Mapping[str, Any],
 ) -> tuple[bool, tuple[str, ...]]:
-    try:
-        view = view_or_payload if isinstance(view_or_payload, StakeAccountView) else parse_stake_account_view(view_or_payload)
-    except Exception as err:  # noqa: BLE001
-        return (False, (f"parse_error: {err}",))
-
-    errors: list[str] = []
-    if not view.owner:
-        errors.append("owner must be non-empty")
-    if view.season_id <= 0:
-        errors.append("season_id must be > 0")
-    if view.game_id <= 0:
-        errors.append("game_id must be > 0")
-    if view.amount < 0:
-        errors.append("amount must be >= 0")
-
-    deduped = tuple(dict.fromkeys(errors))
-    return (not deduped, deduped)
+    return _validate_view(view_or_payload, StakeAccountView, parse_stake_account_view, _STAKE_ACCOUNT_RULES)
 
 
 def parse_player_account_view(data: Mapping[str, Any]) -> PlayerAccountView:
@@ -232,25 +475,7 @@ def parse_player_account_view(data: Mapping[str, Any]) -> PlayerAccountView:
 def validate_player_account_view(
     view_or_payload: PlayerAccountView | Mapping[str, Any],
 ) -> tuple[bool, tuple[str, ...]]:
-    try:
-        view = view_or_payload if isinstance(view_or_payload, PlayerAccountView) else parse_player_account_view(view_or_payload)
-    except Exception as err:  # noqa: BLE001
-        return (False, (f"parse_error: {err}",))
-
-    errors: list[str] = []
-    if not view.owner:
-        errors.append("owner must be non-empty")
-    if view.season_id <= 0:
-        errors.append("season_id must be > 0")
-    if view.issued_towel_balance < 0:
-        errors.append("issued_towel_balance must be >= 0")
-    if view.staked_towel < 0:
-        errors.append("staked_towel must be >= 0")
-    if view.claimed_rewards < 0:
-        errors.append("claimed_rewards must be >= 0")
-
-    deduped = tuple(dict.fromkeys(errors))
-    return (not deduped, deduped)
+    return _validate_view(view_or_payload, PlayerAccountView, parse_player_account_view, _PLAYER_ACCOUNT_RULES)
 
 
 def parse_founder_stake_view(data: Mapping[str, Any]) -> FounderStakeView:
@@ -260,21 +485,7 @@ def parse_founder_stake_view(data: Mapping[str, Any]) -> FounderStakeView:
 def validate_founder_stake_view(
     view_or_payload: FounderStakeView | Mapping[str, Any],
 ) -> tuple[bool, tuple[str, ...]]:
-    try:
-        view = view_or_payload if isinstance(view_or_payload, FounderStakeView) else parse_founder_stake_view(view_or_payload)
-    except Exception as err:  # noqa: BLE001
-        return (False, (f"parse_error: {err}",))
-
-    errors: list[str] = []
-    if not view.owner:
-        errors.append("owner must be non-empty")
-    if view.season_id <= 0:
-        errors.append("season_id must be > 0")
-    if view.amount < 0:
-        errors.append("amount must be >= 0")
-
-    deduped = tuple(dict.fromkeys(errors))
-    return (not deduped, deduped)
+    return _validate_view(view_or_payload, FounderStakeView, parse_founder_stake_view, _FOUNDER_STAKE_RULES)
 
 
 def parse_attention_score_update(data: Mapping[str, Any]) -> AttentionScoreUpdate:
@@ -284,27 +495,7 @@ def parse_attention_score_update(data: Mapping[str, Any]) -> AttentionScoreUpdat
 def validate_attention_score_update(
     update_or_payload: AttentionScoreUpdate | Mapping[str, Any],
 ) -> tuple[bool, tuple[str, ...]]:
-    try:
-        update = (
-            update_or_payload
-            if isinstance(update_or_payload, AttentionScoreUpdate)
-            else parse_attention_score_update(update_or_payload)
-        )
-    except Exception as err:  # noqa: BLE001
-        return (False, (f"parse_error: {err}",))
-
-    errors: list[str] = []
-    if update.season_id <= 0:
-        errors.append("season_id must be > 0")
-    if update.game_id <= 0:
-        errors.append("game_id must be > 0")
-    if update.attention_score_bps < 0 or update.attention_score_bps > 10_000:
-        errors.append("attention_score_bps must be between 0 and 10000")
-    if update.updated_by is not None and not update.updated_by:
-        errors.append("updated_by must be non-empty when provided")
-
-    deduped = tuple(dict.fromkeys(errors))
-    return (not deduped, deduped)
+    return _validate_view(update_or_payload, AttentionScoreUpdate, parse_attention_score_update, _ATTENTION_SCORE_RULES)
 
 
 def parse_reward_projection(data: Mapping[str, Any]) -> RewardProjection:
@@ -314,37 +505,7 @@ def parse_reward_projection(data: Mapping[str, Any]) -> RewardProjection:
 def validate_reward_projection(
     projection_or_payload: RewardProjection | Mapping[str, Any],
 ) -> tuple[bool, tuple[str, ...]]:
-    try:
-        projection = (
-            projection_or_payload
-            if isinstance(projection_or_payload, RewardProjection)
-            else parse_reward_projection(projection_or_payload)
-        )
-    except Exception as err:  # noqa: BLE001
-        return (False, (f"parse_error: {err}",))
-
-    errors: list[str] = []
-    if not projection.projection_id:
-        errors.append("projection_id must be non-empty")
-    if not projection.owner:
-        errors.append("owner must be non-empty")
-    if projection.season_id <= 0:
-        errors.append("season_id must be > 0")
-    if projection.staked_towel < 0:
-        errors.append("staked_towel must be >= 0")
-    if projection.total_staked < 0:
-        errors.append("total_staked must be >= 0")
-    if projection.reward_pool_total < 0:
-        errors.append("reward_pool_total must be >= 0")
-    if projection.reward_pool_remaining < 0:
-        errors.append("reward_pool_remaining must be >= 0")
-    if projection.projected_payout < 0:
-        errors.append("projected_payout must be >= 0")
-    if projection.reward_pool_remaining > projection.reward_pool_total:
-        errors.append("reward_pool_remaining must be <= reward_pool_total")
-
-    deduped = tuple(dict.fromkeys(errors))
-    return (not deduped, deduped)
+    return _validate_view(projection_or_payload, RewardProjection, parse_reward_projection, _REWARD_PROJECTION_RULES)
 
 
 def parse_reward_claim(data: Mapping[str, Any]) -> RewardClaim:
@@ -354,162 +515,314 @@ def parse_reward_claim(data: Mapping[str, Any]) -> RewardClaim:
 def validate_reward_claim(
     claim_or_payload: RewardClaim | Mapping[str, Any],
 ) -> tuple[bool, tuple[str, ...]]:
-    try:
-        claim = claim_or_payload if isinstance(claim_or_payload, RewardClaim) else parse_reward_claim(claim_or_payload)
-    except Exception as err:  # noqa: BLE001
-        return (False, (f"parse_error: {err}",))
-
-    errors: list[str] = []
-    if not claim.claim_id:
-        errors.append("claim_id must be non-empty")
-    if not claim.owner:
-        errors.append("owner must be non-empty")
-    if claim.season_id <= 0:
-        errors.append("season_id must be > 0")
-    if claim.amount < 0:
-        errors.append("amount must be >= 0")
-    if claim.status not in {"claimed", "rejected", "pending"}:
-        errors.append("status must be one of: claimed,rejected,pending")
-
-    deduped = tuple(dict.fromkeys(errors))
-    return (not deduped, deduped)
-
-
-def _normalize_base(data: Mapping[str, Any]) -> dict[str, Any]:
-    normalized = dict(data)
-    if "schema_version" not in normalized:
-        normalized["schema_version"] = DEFAULT_SCHEMA_VERSION
-    return normalized
-
-
-def _normalize_season_account_payload(data: Mapping[str, Any]) -> dict[str, Any]:
-    normalized = _normalize_base(data)
-
-    _set_if_missing(normalized, "season_id", _first_of(normalized, "seasonId"))
-    _set_if_missing(normalized, "authority", _first_of(normalized, "authority_pubkey", "authorityPubkey"))
-    _set_if_missing(normalized, "towel_mint", _first_of(normalized, "towelMint"))
-
-    started = _first_of(normalized, "start_ts", "startTs")
-    if started is not None and "started_at" not in normalized:
-        normalized["started_at"] = _epoch_to_iso8601(started)
-
-    ended = _first_of(normalized, "end_ts", "endTs")
-    if ended is not None and "ended_at" not in normalized:
-        normalized["ended_at"] = _epoch_to_iso8601(ended)
-
-    _set_if_missing(normalized, "reward_pool_total", _first_of(normalized, "rewardPoolTotal"))
-    _set_if_missing(normalized, "reward_pool_remaining", _first_of(normalized, "rewardPoolRemaining"))
-    _set_if_missing(normalized, "total_staked", _first_of(normalized, "totalStaked"))
-    _set_if_missing(normalized, "founder_locked_total", _first_of(normalized, "founderLockedTotal"))
-    return normalized
-
-
-def _normalize_game_account_payload(data: Mapping[str, Any]) -> dict[str, Any]:
-    normalized = _normalize_base(data)
-    _set_if_missing(normalized, "season_id", _first_of(normalized, "seasonId"))
-    _set_if_missing(normalized, "game_id", _first_of(normalized, "gameId"))
-    _set_if_missing(normalized, "attention_score_bps", _first_of(normalized, "attentionScoreBps"))
-    return normalized
-
-
-def _normalize_stake_account_payload(data: Mapping[str, Any]) -> dict[str, Any]:
-    normalized = _normalize_base(data)
-    _set_if_missing(normalized, "season_id", _first_of(normalized, "seasonId"))
-    _set_if_missing(normalized, "game_id", _first_of(normalized, "gameId"))
-    return normalized
-
-
-def _normalize_player_account_payload(data: Mapping[str, Any]) -> dict[str, Any]:
-    normalized = _normalize_base(data)
-    _set_if_missing(normalized, "season_id", _first_of(normalized, "seasonId"))
-    _set_if_missing(normalized, "issued_towel_balance", _first_of(normalized, "issuedTowelBalance"))
-    _set_if_missing(normalized, "staked_towel", _first_of(normalized, "stakedTowel"))
-    _set_if_missing(normalized, "claimed_rewards", _first_of(normalized, "claimedRewards"))
-    _set_if_missing(normalized, "has_claimed", _first_of(normalized, "hasClaimed"))
-    return normalized
-
-
-def _normalize_founder_stake_payload(data: Mapping[str, Any]) -> dict[str, Any]:
-    normalized = _normalize_base(data)
-    _set_if_missing(normalized, "season_id", _first_of(normalized, "seasonId"))
-    return normalized
-
-
-def _normalize_attention_score_payload(data: Mapping[str, Any]) -> dict[str, Any]:
-    normalized = _normalize_game_account_payload(data)
-    _set_if_missing(normalized, "updated_at", _first_of(normalized, "updatedAt", "scored_at", "scoredAt"))
-    _set_if_missing(normalized, "updated_by", _first_of(normalized, "updatedBy", "authority"))
-    return normalized
-
-
-def _normalize_reward_projection_payload(data: Mapping[str, Any]) -> dict[str, Any]:
-    normalized = _normalize_base(data)
-    _set_if_missing(normalized, "projection_id", _first_of(normalized, "projectionId"))
-    _set_if_missing(normalized, "season_id", _first_of(normalized, "seasonId"))
-    _set_if_missing(normalized, "projected_at", _first_of(normalized, "projectedAt", "computed_at", "computedAt"))
-    _set_if_missing(normalized, "staked_towel", _first_of(normalized, "stakedTowel", "staked_amount", "stakedAmount"))
-    _set_if_missing(normalized, "total_staked", _first_of(normalized, "totalStaked"))
-    _set_if_missing(normalized, "reward_pool_total", _first_of(normalized, "rewardPoolTotal"))
-    _set_if_missing(normalized, "reward_pool_remaining", _first_of(normalized, "rewardPoolRemaining"))
-    _set_if_missing(normalized, "projected_payout", _first_of(normalized, "projectedPayout"))
-    return normalized
-
-
-def _normalize_reward_claim_payload(data: Mapping[str, Any]) -> dict[str, Any]:
-    normalized = _normalize_base(data)
-    _set_if_missing(normalized, "claim_id", _first_of(normalized, "claimId"))
-    _set_if_missing(normalized, "season_id", _first_of(normalized, "seasonId"))
-    _set_if_missing(normalized, "claimed_at", _first_of(normalized, "claimedAt"))
-    _set_if_missing(normalized, "transaction_signature", _first_of(normalized, "transactionSignature", "tx", "tx_sig"))
-    return normalized
-
+    return _validate_view(claim_or_payload, RewardClaim, parse_reward_claim, _REWARD_CLAIM_RULES)
+
+
+_Normalizer = Callable[[Mapping[str, Any]], dict[str, Any]]
+
+
+def _compile_aliases(
+    aliases: Mapping[str, tuple[str, ...]],
+    converters: Mapping[str, Callable[[Any], Any]] | None = None,
+) -> _Normalizer:
+    """Compile a ``{field: aliases}`` table into a single-pass payload normalizer.
+
+    For each field missing from the payload, the first alias (in table order) that
+    is present supplies the value; a ``None`` value leaves the field unset.
+    ``converters`` transform a field's aliased value, e.g. epoch seconds to datetime.
+    """
+    ranked = {alias: (name, rank) for name, names in aliases.items() for rank, alias in enumerate(names)}
+    # Aliases are visited in table order so converter errors do not depend on the hash seed.
+    ordered = tuple(ranked)
+    alias_keys = frozenset(ranked)
+    converters = dict(converters or {})
+
+    def normalize(data: Mapping[str, Any]) -> dict[str, Any]:
+        normalized = dict(data)
+        if "schema_version" not in normalized:
+            normalized["schema_version"] = DEFAULT_SCHEMA_VERSION
+        if alias_keys.isdisjoint(normalized):
+            return normalized
+        chosen: dict[str, tuple[int, Any]] = {}
+        for alias in ordered:
+            if alias not in normalized:
+                continue
+            name, rank = ranked[alias]
+            if name not in normalized and (name not in chosen or rank < chosen[name][0]):
+                chosen[name] = (rank, normalized[alias])
+        for name, (_, value) in chosen.items():
+            if value is not None:
+                convert = converters.get(name)
+                normalized[name] = value if convert is None else convert(value)
+        return normalized
+
+    return normalize
+
+
+def _epoch_to_datetime(value: int | float | str) -> datetime:
+    return datetime.fromtimestamp(int(value), tz=timezone.utc)
+
+
+_GAME_ACCOUNT_ALIASES: dict[str, tuple[str, ...]] = {
+    "season_id": ("seasonId",),
+    "game_id": ("gameId",),
+    "attention_score_bps": ("attentionScoreBps",),
+}
 
-def _set_if_missing(target: dict[str, Any], key: str, value: Any) -> None:
-    if key not in target and value is not None:
-        target[key] = value
+_normalize_season_account_payload = _compile_aliases(
+    {
+        "season_id": ("seasonId",),
+        "authority": ("authority_pubkey", "authorityPubkey"),
+        "towel_mint": ("towelMint",),
+        "started_at": ("start_ts", "startTs"),
+        "ended_at": ("end_ts", "endTs"),
+        "reward_pool_total": ("rewardPoolTotal",),
+        "reward_pool_remaining": ("rewardPoolRemaining",),
+        "total_staked": ("totalStaked",),
+        "founder_locked_total": ("founderLockedTotal",),
+    },
+    converters={"started_at": _epoch_to_datetime, "ended_at": _epoch_to_datetime},
+)
 
+_normalize_game_account_payload = _compile_aliases(_GAME_ACCOUNT_ALIASES)
 
-def _first_of(mapping: Mapping[str, Any], *keys: str) -> Any:
-    for key in keys:
-        if key in mapping:
-            return mapping[key]
-    return None
+_normalize_stake_account_payload = _compile_aliases({"season_id": ("seasonId",), "game_id": ("gameId",)})
 
+_normalize_player_account_payload = _compile_aliases(
+    {
+        "season_id": ("seasonId",),
+        "issued_towel_balance": ("issuedTowelBalance",),
+        "staked_towel": ("stakedTowel",),
+        "claimed_rewards": ("claimedRewards",),
+        "has_claimed": ("hasClaimed",),
+    }
+)
 
-def _epoch_to_iso8601(value: int | float | str) -> str:
-    epoch = int(value)
-    return datetime.fromtimestamp(epoch, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+_normalize_founder_stake_payload = _compile_aliases({"season_id": ("seasonId",)})
+
+_normalize_attention_score_payload = _compile_aliases(
+    {
+        **_GAME_ACCOUNT_ALIASES,
+        "updated_at": ("updatedAt", "scored_at", "scoredAt"),
+        "updated_by": ("updatedBy", "authority"),
+    }
+)
+
+_normalize_reward_projection_payload = _compile_aliases(
+    {
+        "projection_id": ("projectionId",),
+        "season_id": ("seasonId",),
+        "projected_at": ("projectedAt", "computed_at", "computedAt"),
+        "staked_towel": ("stakedTowel", "staked_amount", "stakedAmount"),
+        "total_staked": ("totalStaked",),
+        "reward_pool_total": ("rewardPoolTotal",),
+        "reward_pool_remaining": ("rewardPoolRemaining",),
+        "projected_payout": ("projectedPayout",),
+    }
+)
+
+_normalize_reward_claim_payload = _compile_aliases(
+    {
+        "claim_id": ("claimId",),
+        "season_id": ("seasonId",),
+        "claimed_at": ("claimedAt",),
+        "transaction_signature": ("transactionSignature", "tx", "tx_sig"),
+    }
+)
+
+
+def _view_columns(view_type: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(view_type) if f.name != "metadata")
+
+
+def _group_sum(keys: Iterable[Any], values: Iterable[int], mask: Iterable[int] | None) -> dict[Any, int]:
+    if mask is not None:
+        keys = compress(keys, mask)
+        values = compress(values, mask)
+    totals: dict[Any, int] = {}
+    get = totals.get
+    for key, value in zip(keys, values):
+        totals[key] = get(key, 0) + value
+    return totals
+
+
+def _is_negative(value: int) -> bool:
+    return value < 0
+
+
+def _is_not_positive(value: int) -> bool:
+    return value <= 0
+
+
+def _is_empty(value: str) -> bool:
+    return not value
+
+
+def _is_missing(value: Any) -> bool:
+    return value in (None, "")
+
+
+def _is_empty_when_provided(value: str | None) -> bool:
+    return value is not None and not value
+
+
+def _is_outside_bps(value: int) -> bool:
+    return value < 0 or value > 10_000
+
+
+def _is_unknown_claim_status(value: str) -> bool:
+    return value not in {"claimed", "rejected", "pending"}
+
+
+def _exceeds(value: int, limit: int) -> bool:
+    return value > limit
+
+
+# Validation rules per contract: (field names, violation predicate, message). The
+# per-row validators and ``validate_season1_batch`` both evaluate these tables in
+# order, so their verdicts and error ordering stay identical.
+_Rule = tuple[tuple[str, ...], Callable[..., bool], str]
+
+_SEASON_ACCOUNT_RULES: tuple[_Rule, ...] = (
+    (("season_id",), _is_not_positive, "season_id must be > 0"),
+    (("authority",), _is_empty, "authority must be non-empty"),
+    (("towel_mint",), _is_empty, "towel_mint must be non-empty"),
+    (("reward_pool_total",), _is_negative, "reward_pool_total must be >= 0"),
+    (("reward_pool_remaining",), _is_negative, "reward_pool_remaining must be >= 0"),
+    (("total_staked",), _is_negative, "total_staked must be >= 0"),
+    (("founder_locked_total",), _is_negative, "founder_locked_total must be >= 0"),
+    (("season_id",), _is_missing, "season_id must be present"),
+    (("authority",), _is_missing, "authority must be present"),
+    (("towel_mint",), _is_missing, "towel_mint must be present"),
+    (("started_at",), _is_missing, "started_at must be present"),
+)
+
+_GAME_ACCOUNT_RULES: tuple[_Rule, ...] = (
+    (("season_id",), _is_not_positive, "season_id must be > 0"),
+    (("game_id",), _is_not_positive, "game_id must be > 0"),
+    (("attention_score_bps",), _is_outside_bps, "attention_score_bps must be between 0 and 10000"),
+)
+
+_STAKE_ACCOUNT_RULES: tuple[_Rule, ...] = (
+    (("owner",), _is_empty, "owner must be non-empty"),
+    (("season_id",), _is_not_positive, "season_id must be > 0"),
+    (("game_id",), _is_not_positive, "game_id must be > 0"),
+    (("amount",), _is_negative, "amount must be >= 0"),
+)
+
+_PLAYER_ACCOUNT_RULES: tuple[_Rule, ...] = (
+    (("owner",), _is_empty, "owner must be non-empty"),
+    (("season_id",), _is_not_positive, "season_id must be > 0"),
+    (("issued_towel_balance",), _is_negative, "issued_towel_balance must be >= 0"),
+    (("staked_towel",), _is_negative, "staked_towel must be >= 0"),
+    (("claimed_rewards",), _is_negative, "claimed_rewards must be >= 0"),
+)
+
+_FOUNDER_STAKE_RULES: tuple[_Rule, ...] = (
+    (("owner",), _is_empty, "owner must be non-empty"),
+    (("season_id",), _is_not_positive, "season_id must be > 0"),
+    (("amount",), _is_negative, "amount must be >= 0"),
+)
+
+_ATTENTION_SCORE_RULES: tuple[_Rule, ...] = (
+    *_GAME_ACCOUNT_RULES,
+    (("updated_by",), _is_empty_when_provided, "updated_by must be non-empty when provided"),
+)
+
+_REWARD_PROJECTION_RULES: tuple[_Rule, ...] = (
+    (("projection_id",), _is_empty, "projection_id must be non-empty"),
+    (("owner",), _is_empty, "owner must be non-empty"),
+    (("season_id",), _is_not_positive, "season_id must be > 0"),
+    (("staked_towel",), _is_negative, "staked_towel must be >= 0"),
+    (("total_staked",), _is_negative, "total_staked must be >= 0"),
+    (("reward_pool_total",), _is_negative, "reward_pool_total must be >= 0"),
+    (("reward_pool_remaining",), _is_negative, "reward_pool_remaining must be >= 0"),
+    (("projected_payout",), _is_negative, "projected_payout must be >= 0"),
+    (
+        ("reward_pool_remaining", "reward_pool_total"),
+        _exceeds,
+        "reward_pool_remaining must be <= reward_pool_total",
+    ),
+)
+
+_REWARD_CLAIM_RULES: tuple[_Rule, ...] = (
+    (("claim_id",), _is_empty, "claim_id must be non-empty"),
+    (("owner",), _is_empty, "owner must be non-empty"),
+    (("season_id",), _is_not_positive, "season_id must be > 0"),
+    (("amount",), _is_negative, "amount must be >= 0"),
+    (("status",), _is_unknown_claim_status, "status must be one of: claimed,rejected,pending"),
+)
+
+_SEASON1_CONTRACTS: dict[str, tuple[type[Serializable], _Normalizer, tuple[_Rule, ...]]] = {
+    "SeasonAccountView": (SeasonAccountView, _normalize_season_account_payload, _SEASON_ACCOUNT_RULES),
+    "GameAccountView": (GameAccountView, _normalize_game_account_payload, _GAME_ACCOUNT_RULES),
+    "StakeAccountView": (StakeAccountView, _normalize_stake_account_payload, _STAKE_ACCOUNT_RULES),
+    "PlayerAccountView": (PlayerAccountView, _normalize_player_account_payload, _PLAYER_ACCOUNT_RULES),
+    "FounderStakeView": (FounderStakeView, _normalize_founder_stake_payload, _FOUNDER_STAKE_RULES),
+    "AttentionScoreUpdate": (AttentionScoreUpdate, _normalize_attention_score_payload, _ATTENTION_SCORE_RULES),
+    "RewardProjection": (RewardProjection, _normalize_reward_projection_payload, _REWARD_PROJECTION_RULES),
+    "RewardClaim": (RewardClaim, _normalize_reward_claim_payload, _REWARD_CLAIM_RULES),
+}
 
 
-def _validate_account_view_common(
-    view_or_payload: SeasonAccountView | Mapping[str, Any],
-    parser: Any,
-    min_fields: tuple[str, ...],
+def _validate_view(
+    view_or_payload: Any,
+    cls: type[Serializable],
+    parser: Callable[[Mapping[str, Any]], Serializable],
+    rules: tuple[_Rule, ...],
 ) -> tuple[bool, tuple[str, ...]]:
     try:
-        view = view_or_payload if isinstance(view_or_payload, SeasonAccountView) else parser(view_or_payload)
+        view = view_or_payload if isinstance(view_or_payload, cls) else parser(view_or_payload)
     except Exception as err:  # noqa: BLE001
         return (False, (f"parse_error: {err}",))
 
-    errors: list[str] = []
-    if view.season_id <= 0:
-        errors.append("season_id must be > 0")
-    if not view.authority:
-        errors.append("authority must be non-empty")
-    if not view.towel_mint:
-        errors.append("towel_mint must be non-empty")
-    if view.reward_pool_total < 0:
-        errors.append("reward_pool_total must be >= 0")
-    if view.reward_pool_remaining < 0:
-        errors.append("reward_pool_remaining must be >= 0")
-    if view.total_staked < 0:
-        errors.append("total_staked must be >= 0")
-    if view.founder_locked_total < 0:
-        errors.append("founder_locked_total must be >= 0")
-
-    for field_name in min_fields:
-        if getattr(view, field_name, None) in (None, ""):
-            errors.append(f"{field_name} must be present")
-
+    errors = [message for names, violated, message in rules if violated(*[getattr(view, name) for name in names])]
     deduped = tuple(dict.fromkeys(errors))
     return (not deduped, deduped)
+
+
+def _decode_batch(
+    cls: type[Serializable],
+    normalizer: _Normalizer,
+    rows: list[Any],
+    failures: dict[int, list[str]],
+) -> tuple[list[int], list[Any]]:
+    """Decode ``rows`` to views, recording parse errors in ``failures``.
+
+    Returns the row index of every decoded view alongside the views. The batch is
+    decoded column-wise; only when that fails are rows re-decoded one at a time
+    to attribute the parse errors exactly as the per-row validators do.
+    """
+    payload_indices = [index for index, row in enumerate(rows) if not isinstance(row, cls)]
+    if not payload_indices:
+        return list(range(len(rows))), rows
+    try:
+        decoded = cls.from_dicts([normalizer(rows[index]) for index in payload_indices])
+    except Exception:  # noqa: BLE001
+        decoded = None
+
+    views = list(rows)
+    if decoded is not None:
+        for index, view in zip(payload_indices, decoded):
+            views[index] = view
+        return list(range(len(rows))), views
+
+    for index in payload_indices:
+        try:
+            views[index] = cls.from_dict(normalizer(rows[index]))
+        except Exception as err:  # noqa: BLE001
+            failures[index] = [f"parse_error: {err}"]
+    indices = [index for index in range(len(rows)) if index not in failures]
+    return indices, [views[index] for index in indices]
+
+
+def _valid_mask(size: int, errors: Mapping[int, Any]) -> bytes:
+    mask = bytearray(b"\xff" * (size >> 3))
+    if size & 7:
+        mask.append((1 << (size & 7)) - 1)
+    for index in errors:
+        mask[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+    return bytes(mask)
+
+
+_install_setstate(globals())
@@ -4,35 +4,38 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 from metaspn_schemas.core import DEFAULT_SCHEMA_VERSION
-from metaspn_schemas.utils.serde import Serializable
+from metaspn_schemas.utils.serde import INTERNED, Serializable, _install_setstate
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SocialPostSeen(Serializable):
     post_id: str
-    platform: str
+    platform: str = field(metadata=INTERNED)
     author_handle: str
     content: str
     seen_at: datetime
     url: str | None = None
     topics: tuple[str, ...] = field(default_factory=tuple)
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "topics", tuple(sorted(self.topics)))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProfileSnapshotSeen(Serializable):
     profile_id: str
-    platform: str
+    platform: str = field(metadata=INTERNED)
     handle: str
     display_name: str | None
     bio: str | None
     seen_at: datetime
     followers_count: int | None = None
     topics: tuple[str, ...] = field(default_factory=tuple)
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "topics", tuple(sorted(self.topics)))
+
+
+_install_setstate(globals())
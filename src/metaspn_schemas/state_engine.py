@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Callable, Iterable, Mapping, Sequence
+
+from metaspn_schemas.state_machine import (
+    GateTransitionAttempt,
+    StateMachineConfig,
+    parse_state_machine_config,
+    validate_state_machine_config,
+)
+from metaspn_schemas.utils.ids import generate_id
+from metaspn_schemas.utils.time import utc_now
+
+Guard = Callable[[Mapping[str, Any]], bool]
+
+GUARDS: dict[str, Guard] = {}
+
+REASON_UNKNOWN_STATE = "unknown_state"
+REASON_NO_TRANSITION = "no_transition"
+REASON_GUARD_REJECTED = "guard_rejected"
+
+_EMPTY_CONTEXT: Mapping[str, Any] = {}
+
+
+def register_guard(name: str, guard: Guard, *, replace_existing: bool = False) -> None:
+    """Register ``guard`` under the name used by ``StateTransitionRule.guard``."""
+    if name in GUARDS and not replace_existing:
+        raise ValueError(f"guard already registered: {name}")
+    GUARDS[name] = guard
+
+
+class CompiledStateMachine:
+    """Transition engine compiled from a validated ``StateMachineConfig``.
+
+    States and events are integer-coded in sorted order. ``step_code`` indexes a
+    dense ``len(states) * len(events)`` table; ``step`` uses a nested
+    ``state -> event -> target`` dict. A target is the destination state when the
+    first matching rule is unguarded, otherwise a tuple of ``(guard_name, guard,
+    to_state)`` candidates tried in the config's (sorted) transition order.
+    """
+
+    __slots__ = ("config", "states", "events", "state_codes", "event_codes", "_edges", "_table")
+
+    def __init__(self, config: StateMachineConfig, guards: Mapping[str, Guard]) -> None:
+        self.config = config
+        self.states: tuple[str, ...] = config.states
+        self.events: tuple[str, ...] = tuple(sorted({rule.event for rule in config.transitions}))
+        self.state_codes: dict[str, int] = {state: code for code, state in enumerate(self.states)}
+        self.event_codes: dict[str, int] = {event: code for code, event in enumerate(self.events)}
+
+        candidates: dict[str, dict[str, list[tuple[str | None, Guard | None, str]]]] = {
+            state: {} for state in self.states
+        }
+        for rule in config.transitions:
+            guard = None if rule.guard is None else guards[rule.guard]
+            candidates[rule.from_state].setdefault(rule.event, []).append((rule.guard, guard, rule.to_state))
+
+        self._edges: dict[str, dict[str, str | tuple[tuple[str | None, Guard | None, str], ...]]] = {
+            state: {event: _edge_target(options) for event, options in by_event.items()}
+            for state, by_event in candidates.items()
+        }
+        event_count = len(self.events)
+        self._table: list[Any] = [None] * (len(self.states) * event_count)
+        for state, by_event in self._edges.items():
+            base = self.state_codes[state] * event_count
+            for event, target in by_event.items():
+                self._table[base + self.event_codes[event]] = (
+                    self.state_codes[target]
+                    if isinstance(target, str)
+                    else tuple((guard, self.state_codes[to_state]) for _, guard, to_state in target)
+                )
+
+    def __repr__(self) -> str:
+        return (
+            f"CompiledStateMachine(config_id={self.config.config_id!r}, "
+            f"states={len(self.states)}, events={len(self.events)})"
+        )
+
+    def step(self, state: str, event: str, context: Mapping[str, Any] | None = None) -> str | None:
+        """Return the state ``event`` moves ``state`` to, or ``None`` if the transition is not allowed."""
+        by_event = self._edges.get(state)
+        if by_event is None:
+            return None
+        target = by_event.get(event)
+        if target.__class__ is str:
+            return target
+        if target is None:
+            return None
+        if context is None:
+            context = _EMPTY_CONTEXT
+        for _, guard, to_state in target:
+            if guard is None or guard(context):
+                return to_state
+        return None
+
+    def step_code(self, state_code: int, event_code: int, context: Mapping[str, Any] | None = None) -> int:
+        """Integer-coded ``step``; returns ``-1`` when the transition is not allowed.
+
+        Raises ``ValueError`` for a code outside ``states`` / ``events``.
+        """
+        event_count = len(self.events)
+        if not 0 <= event_code < event_count:
+            raise ValueError(f"event code out of range for {event_count} events: {event_code}")
+        if not 0 <= state_code < len(self.states):
+            raise ValueError(f"state code out of range for {len(self.states)} states: {state_code}")
+        target = self._table[state_code * event_count + event_code]
+        if target.__class__ is int:
+            return target
+        if target is None:
+            return -1
+        if context is None:
+            context = _EMPTY_CONTEXT
+        for guard, to_code in target:
+            if guard is None or guard(context):
+                return to_code
+        return -1
+
+    def step_many(
+        self,
+        entity_ids: Sequence[str],
+        states: Sequence[str],
+        events: Sequence[str],
+        *,
+        contexts: Sequence[Mapping[str, Any] | None] | None = None,
+        gate_name: str | None = None,
+        attempted_at: datetime | None = None,
+    ) -> tuple[list[str], list[GateTransitionAttempt]]:
+        """Apply one event per entity.
+
+        Returns the new state of every entity (unchanged where the transition was
+        rejected) and a ``GateTransitionAttempt`` with ``allowed=False`` for each
+        rejected row. Allowed rows allocate nothing beyond their slot in the result.
+        """
+        if not len(entity_ids) == len(states) == len(events):
+            raise ValueError("entity_ids, states, and events must have the same length")
+        if contexts is not None and len(contexts) != len(states):
+            raise ValueError("contexts must have the same length as states")
+
+        edges = self._edges
+        new_states = list(states)
+        rejected_rows: list[int] = []
+        for index, (state, event) in enumerate(zip(states, events)):
+            by_event = edges.get(state)
+            target = None if by_event is None else by_event.get(event)
+            if target.__class__ is str:
+                new_states[index] = target
+                continue
+            if target is not None:
+                context = _EMPTY_CONTEXT if contexts is None else contexts[index] or _EMPTY_CONTEXT
+                for _, guard, to_state in target:
+                    if guard is None or guard(context):
+                        new_states[index] = to_state
+                        break
+                else:
+                    rejected_rows.append(index)
+                continue
+            rejected_rows.append(index)
+
+        if not rejected_rows:
+            return new_states, []
+        if attempted_at is None:
+            attempted_at = utc_now()
+        rejected = [
+            self.rejection(
+                entity_ids[index],
+                states[index],
+                events[index],
+                context=None if contexts is None else contexts[index],
+                gate_name=gate_name,
+                attempted_at=attempted_at,
+            )
+            for index in rejected_rows
+        ]
+        return new_states, rejected
+
+    def rejection(
+        self,
+        entity_id: str,
+        state: str,
+        event: str,
+        *,
+        context: Mapping[str, Any] | None = None,
+        gate_name: str | None = None,
+        attempted_at: datetime | None = None,
+        caused_by: Iterable[str] = (),
+    ) -> GateTransitionAttempt:
+        """Build the ``allowed=False`` attempt record explaining why ``event`` was rejected in ``state``."""
+        details = {"event": event}
+        to_state = state
+        by_event = self._edges.get(state)
+        if by_event is None:
+            reason_code = REASON_UNKNOWN_STATE
+        elif event not in by_event:
+            reason_code = REASON_NO_TRANSITION
+        else:
+            reason_code = REASON_GUARD_REJECTED
+            target = by_event[event]
+            if not isinstance(target, str):
+                guard_name, _, to_state = target[0]
+                details["guard"] = guard_name or ""
+        if context:
+            details.update((str(key), str(value)) for key, value in context.items() if key not in details)
+        return GateTransitionAttempt(
+            attempt_id=generate_id("att"),
+            gate_name=gate_name or self.config.config_id,
+            entity_id=entity_id,
+            from_state=state,
+            to_state=to_state,
+            attempted_at=attempted_at or utc_now(),
+            allowed=False,
+            schema_version=self.config.schema_version,
+            reason_code=reason_code,
+            caused_by=tuple(caused_by),
+            context=details,
+        )
+
+
+def compile_state_machine(
+    config: StateMachineConfig | Mapping[str, Any],
+    guards: Mapping[str, Guard] | None = None,
+) -> CompiledStateMachine:
+    """Validate ``config`` and compile it; guard names resolve via ``guards`` first, then ``GUARDS``."""
+    if not isinstance(config, StateMachineConfig):
+        config = parse_state_machine_config(config)
+    ok, errors = validate_state_machine_config(config)
+    if not ok:
+        raise ValueError(f"invalid state machine config {config.config_id}: {'; '.join(errors)}")
+
+    resolved = dict(GUARDS)
+    if guards:
+        resolved.update(guards)
+    missing = sorted({rule.guard for rule in config.transitions if rule.guard is not None} - set(resolved))
+    if missing:
+        raise ValueError(f"unregistered guards: {','.join(missing)}")
+    return CompiledStateMachine(config, resolved)
+
+
+def _edge_target(
+    options: list[tuple[str | None, Guard | None, str]],
+) -> str | tuple[tuple[str | None, Guard | None, str], ...]:
+    # An unguarded first rule always wins, so later candidates are unreachable.
+    if options[0][1] is None:
+        return options[0][2]
+    return tuple(options)
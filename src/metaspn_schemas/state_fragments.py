@@ -4,47 +4,50 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 from metaspn_schemas.core import DEFAULT_SCHEMA_VERSION
-from metaspn_schemas.utils.serde import Serializable
+from metaspn_schemas.utils.serde import INTERNED, Serializable, _install_setstate
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Identity(Serializable):
     entity_id: str
     canonical_name: str | None = None
     aliases: tuple[str, ...] = field(default_factory=tuple)
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Evidence(Serializable):
     evidence_id: str
     entity_id: str
-    source: str
+    source: str = field(metadata=INTERNED)
     collected_at: datetime
     attributes: dict[str, str] = field(default_factory=dict)
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Scores(Serializable):
     entity_id: str
     values: dict[str, float]
     updated_at: datetime
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Cooldowns(Serializable):
     entity_id: str
-    channel: str
+    channel: str = field(metadata=INTERNED)
     until: datetime
     reason: str | None = None
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Attempts(Serializable):
     entity_id: str
     count: int
     last_attempt_at: datetime | None = None
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
+
+
+_install_setstate(globals())
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Mapping
+
+from metaspn_schemas.core import DEFAULT_SCHEMA_VERSION
+from metaspn_schemas.state_machine import StateMachineConfig, parse_state_machine_config
+from metaspn_schemas.utils.hashing import content_hash
+from metaspn_schemas.utils.serde import INTERNED, Serializable, _install_setstate
+
+STATE_GRAPH_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True, slots=True)
+class StateGraphAnalysis(Serializable):
+    config_id: str
+    content_hash: str
+    reachable_states: tuple[str, ...]
+    unreachable_states: tuple[str, ...]
+    dead_end_states: tuple[str, ...]
+    cycles: tuple[tuple[str, ...], ...] = field(default_factory=tuple)
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
+
+    @property
+    def has_cycles(self) -> bool:
+        return bool(self.cycles)
+
+
+class _StateGraph:
+    """Adjacency for one config, built once in O(V + E); analysis is computed on first use."""
+
+    __slots__ = ("config", "key", "adjacency", "_analysis")
+
+    def __init__(self, config: StateMachineConfig, key: tuple[str, str]) -> None:
+        self.config = config
+        self.key = key
+        adjacency: dict[str, list[tuple[str, str]]] = {state: [] for state in config.states}
+        for rule in config.transitions:
+            # Rules pointing at undeclared states are reported by validate_state_machine_config.
+            if rule.from_state in adjacency and rule.to_state in adjacency:
+                adjacency[rule.from_state].append((rule.event, rule.to_state))
+        self.adjacency = adjacency
+        self._analysis: StateGraphAnalysis | None = None
+
+    def analysis(self) -> StateGraphAnalysis:
+        if self._analysis is None:
+            config = self.config
+            reachable = self._reachable(config.initial_state)
+            terminal = set(config.terminal_states)
+            self._analysis = StateGraphAnalysis(
+                config_id=config.config_id,
+                content_hash=self.key[1],
+                reachable_states=tuple(state for state in config.states if state in reachable),
+                unreachable_states=tuple(state for state in config.states if state not in reachable),
+                dead_end_states=tuple(
+                    state for state in config.states if not self.adjacency[state] and state not in terminal
+                ),
+                cycles=self._cycles(),
+                schema_version=config.schema_version,
+            )
+        return self._analysis
+
+    def shortest_event_path(self, from_state: str, to_state: str) -> tuple[str, ...] | None:
+        for state in (from_state, to_state):
+            if state not in self.adjacency:
+                raise ValueError(f"unknown state: {state}")
+        if from_state == to_state:
+            return ()
+        previous: dict[str, tuple[str, str]] = {}
+        queue = deque([from_state])
+        seen = {from_state}
+        while queue:
+            state = queue.popleft()
+            for event, target in self.adjacency[state]:
+                if target in seen:
+                    continue
+                previous[target] = (state, event)
+                if target == to_state:
+                    events = []
+                    while target != from_state:
+                        target, event = previous[target]
+                        events.append(event)
+                    return tuple(reversed(events))
+                seen.add(target)
+                queue.append(target)
+        return None
+
+    def _reachable(self, start: str) -> set[str]:
+        if start not in self.adjacency:
+            return set()
+        seen = {start}
+        stack = [start]
+        while stack:
+            for _, target in self.adjacency[stack.pop()]:
+                if target not in seen:
+                    seen.add(target)
+                    stack.append(target)
+        return seen
+
+    def _cycles(self) -> tuple[tuple[str, ...], ...]:
+        """Strongly connected components that contain a cycle (iterative Tarjan)."""
+        adjacency = self.adjacency
+        index_of: dict[str, int] = {}
+        lowlink: dict[str, int] = {}
+        on_stack: set[str] = set()
+        stack: list[str] = []
+        cycles: list[tuple[str, ...]] = []
+
+        for root in adjacency:
+            if root in index_of:
+                continue
+            work = [(root, iter(adjacency[root]))]
+            index_of[root] = lowlink[root] = len(index_of)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                state, edges = work[-1]
+                advanced = False
+                for _, target in edges:
+                    if target not in index_of:
+                        index_of[target] = lowlink[target] = len(index_of)
+                        stack.append(target)
+                        on_stack.add(target)
+                        work.append((target, iter(adjacency[target])))
+                        advanced = True
+                        break
+                    if target in on_stack:
+                        lowlink[state] = min(lowlink[state], index_of[target])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[state])
+                if lowlink[state] == index_of[state]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == state:
+                            break
+                    if len(component) > 1 or any(target == state for _, target in adjacency[state]):
+                        cycles.append(tuple(sorted(component)))
+        return tuple(sorted(cycles))
+
+
+_GRAPHS: OrderedDict[tuple[str, str], _StateGraph] = OrderedDict()
+# Configs are immutable, so a config object already analyzed skips re-hashing. The
+# entry holds the config itself, which keeps its id() from being reused.
+_GRAPHS_BY_OBJECT: OrderedDict[int, tuple[StateMachineConfig, _StateGraph]] = OrderedDict()
+_graphs_lock = threading.Lock()
+
+
+def analyze_state_machine(config: StateMachineConfig | Mapping[str, Any]) -> StateGraphAnalysis:
+    """Reachability from ``initial_state``, unreachable and dead-end states, and cycles."""
+    return _graph_for(config).analysis()
+
+
+def shortest_event_path(
+    config: StateMachineConfig | Mapping[str, Any],
+    from_state: str,
+    to_state: str,
+) -> tuple[str, ...] | None:
+    """Fewest events leading from ``from_state`` to ``to_state`` (guards ignored), or ``None``."""
+    return _graph_for(config).shortest_event_path(from_state, to_state)
+
+
+def clear_state_graph_cache() -> None:
+    with _graphs_lock:
+        _GRAPHS.clear()
+        _GRAPHS_BY_OBJECT.clear()
+
+
+def _graph_for(config: StateMachineConfig | Mapping[str, Any]) -> _StateGraph:
+    if not isinstance(config, StateMachineConfig):
+        config = parse_state_machine_config(config)
+    with _graphs_lock:
+        entry = _GRAPHS_BY_OBJECT.get(id(config))
+        if entry is not None and entry[0] is config:
+            _GRAPHS_BY_OBJECT.move_to_end(id(config))
+            return entry[1]
+
+    key = (config.config_id, content_hash(config))
+    with _graphs_lock:
+        graph = _GRAPHS.get(key)
+        if graph is None:
+            graph = _GRAPHS[key] = _StateGraph(config, key)
+        else:
+            _GRAPHS.move_to_end(key)
+        _GRAPHS_BY_OBJECT[id(config)] = (config, graph)
+        for cache in (_GRAPHS, _GRAPHS_BY_OBJECT):
+            while len(cache) > STATE_GRAPH_CACHE_SIZE:
+                cache.popitem(last=False)
+    return graph
+
+
+_install_setstate(globals())
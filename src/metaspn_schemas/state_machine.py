@@ -1,31 +1,38 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Mapping
+from typing import Any, Mapping, NamedTuple
 
 from metaspn_schemas.core import DEFAULT_SCHEMA_VERSION
-from metaspn_schemas.utils.serde import Serializable
+from metaspn_schemas.utils.hashing import content_hash
+from metaspn_schemas.utils.serde import INTERNED, Serializable, _install_setstate
 from metaspn_schemas.utils.time import ensure_utc
 
+# Parsed configs are shared process-wide, keyed by the SHA-256 of the canonical
+# payload JSON; the metadata of a cached config is a read-only dict.
+STATE_MACHINE_CONFIG_CACHE_SIZE = 128
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class StateTransitionRule(Serializable):
     from_state: str
     to_state: str
     event: str
     guard: str | None = None
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StateMachineConfig(Serializable):
     config_id: str
     machine_type: str
     initial_state: str
     states: tuple[str, ...]
     transitions: tuple[StateTransitionRule, ...]
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     terminal_states: tuple[str, ...] = field(default_factory=tuple)
     metadata: dict[str, str] = field(default_factory=dict)
 
@@ -41,7 +48,7 @@ class StateMachineConfig(Serializable):
         object.__setattr__(self, "transitions", sorted_transitions)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GateTransitionAttempt(Serializable):
     attempt_id: str
     gate_name: str
@@ -50,7 +57,7 @@ class GateTransitionAttempt(Serializable):
     to_state: str
     attempted_at: datetime
     allowed: bool
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     reason_code: str | None = None
     caused_by: tuple[str, ...] = field(default_factory=tuple)
     context: dict[str, str] = field(default_factory=dict)
@@ -59,7 +66,7 @@ class GateTransitionAttempt(Serializable):
         object.__setattr__(self, "attempted_at", ensure_utc(self.attempted_at))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutcomeWindowEvaluation(Serializable):
     evaluation_id: str
     entity_id: str
@@ -68,7 +75,7 @@ class OutcomeWindowEvaluation(Serializable):
     evaluated_at: datetime
     outcome_type: str
     success: bool
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     metrics: dict[str, float] = field(default_factory=dict)
     caused_by_attempt_id: str | None = None
 
@@ -78,14 +85,14 @@ class OutcomeWindowEvaluation(Serializable):
         object.__setattr__(self, "evaluated_at", ensure_utc(self.evaluated_at))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CalibrationRecord(Serializable):
     calibration_id: str
     model_name: str
     calibrated_at: datetime
     sample_size: int
     threshold: float
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     precision: float | None = None
     recall: float | None = None
     notes: str | None = None
@@ -94,14 +101,14 @@ class CalibrationRecord(Serializable):
         object.__setattr__(self, "calibrated_at", ensure_utc(self.calibrated_at))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FailureTaxonomyRecord(Serializable):
     failure_id: str
     category: str
     code: str
     observed_at: datetime
     severity: str
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     description: str | None = None
     tags: tuple[str, ...] = field(default_factory=tuple)
 
@@ -110,9 +117,97 @@ class FailureTaxonomyRecord(Serializable):
         object.__setattr__(self, "tags", tuple(sorted(self.tags)))
 
 
+class ConfigCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _ReadOnlyDict(dict):  # type: ignore[type-arg]
+    """``dict`` that rejects mutation; encodes, hashes and compares like the plain dict."""
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("metadata of a cached StateMachineConfig is read-only; copy it with dict()")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_ReadOnlyDict, (dict(self),))
+
+
+class _ConfigCacheEntry:
+    __slots__ = ("config", "validation")
+
+    def __init__(self, config: StateMachineConfig) -> None:
+        self.config = config
+        self.validation: tuple[bool, tuple[str, ...]] | None = None
+
+
+_config_cache: OrderedDict[str, _ConfigCacheEntry] = OrderedDict()
+_config_entries_by_object: dict[int, _ConfigCacheEntry] = {}
+_config_cache_lock = threading.Lock()
+_config_cache_maxsize = STATE_MACHINE_CONFIG_CACHE_SIZE
+_config_cache_hits = 0
+_config_cache_misses = 0
+
+
 def parse_state_machine_config(data: Mapping[str, Any]) -> StateMachineConfig:
-    normalized = _normalize_state_machine_payload(data)
-    return StateMachineConfig.from_dict(normalized)
+    """Parse ``data``; identical payloads return the same cached ``StateMachineConfig``."""
+    global _config_cache_hits, _config_cache_misses
+    if not _config_cache_maxsize:
+        return _parse_state_machine_config(data)
+    try:
+        key = content_hash(data)
+    except (TypeError, ValueError):
+        return _parse_state_machine_config(data)
+
+    with _config_cache_lock:
+        entry = _config_cache.get(key)
+        if entry is not None:
+            _config_cache.move_to_end(key)
+            _config_cache_hits += 1
+            return entry.config
+
+    config = _parse_state_machine_config(data)
+    with _config_cache_lock:
+        _config_cache_misses += 1
+        entry = _config_cache.get(key)
+        if entry is not None:
+            # Another thread parsed the same payload first; share its instance.
+            return entry.config
+        # The instance is handed to every later caller; freeze its only mutable field.
+        object.__setattr__(config, "metadata", _ReadOnlyDict(config.metadata))
+        entry = _config_cache[key] = _ConfigCacheEntry(config)
+        _config_entries_by_object[id(config)] = entry
+        _evict_config_cache(_config_cache_maxsize)
+    return config
+
+
+def state_machine_config_cache_info() -> ConfigCacheInfo:
+    with _config_cache_lock:
+        return ConfigCacheInfo(_config_cache_hits, _config_cache_misses, _config_cache_maxsize, len(_config_cache))
+
+
+def clear_state_machine_config_cache() -> None:
+    global _config_cache_hits, _config_cache_misses
+    with _config_cache_lock:
+        _config_cache.clear()
+        _config_entries_by_object.clear()
+        _config_cache_hits = _config_cache_misses = 0
+
+
+def set_state_machine_config_cache_size(maxsize: int) -> None:
+    """Resize the parsed-config cache; ``0`` disables caching."""
+    global _config_cache_maxsize
+    if maxsize < 0:
+        raise ValueError("maxsize must be >= 0")
+    with _config_cache_lock:
+        _config_cache_maxsize = maxsize
+        _evict_config_cache(maxsize)
 
 
 def validate_state_machine_config(
@@ -127,6 +222,15 @@ def validate_state_machine_config(
     except Exception as err:  # noqa: BLE001
         return (False, (f"parse_error: {err}",))
 
+    entry = _config_entries_by_object.get(id(config))
+    if entry is None or entry.config is not config:
+        return _validate_state_machine_config(config)
+    if entry.validation is None:
+        entry.validation = _validate_state_machine_config(config)
+    return entry.validation
+
+
+def _validate_state_machine_config(config: StateMachineConfig) -> tuple[bool, tuple[str, ...]]:
     errors: list[str] = []
 
     if not config.states:
@@ -162,6 +266,17 @@ def validate_state_machine_config(
     return (not deduped, deduped)
 
 
+def _parse_state_machine_config(data: Mapping[str, Any]) -> StateMachineConfig:
+    normalized = _normalize_state_machine_payload(data)
+    return StateMachineConfig.from_dict(normalized)
+
+
+def _evict_config_cache(maxsize: int) -> None:
+    while len(_config_cache) > maxsize:
+        _, evicted = _config_cache.popitem(last=False)
+        _config_entries_by_object.pop(id(evicted.config), None)
+
+
 def _normalize_state_machine_payload(data: Mapping[str, Any]) -> dict[str, Any]:
     normalized = dict(data)
 
@@ -206,3 +321,6 @@ def _normalize_state_machine_payload(data: Mapping[str, Any]) -> dict[str, Any]:
         normalized["schema_version"] = DEFAULT_SCHEMA_VERSION
 
     return normalized
+
+
+_install_setstate(globals())
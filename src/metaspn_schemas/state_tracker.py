@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Iterable, Iterator, Mapping
+
+from metaspn_schemas.core import DEFAULT_SCHEMA_VERSION
+from metaspn_schemas.state_machine import GateTransitionAttempt, StateMachineConfig
+from metaspn_schemas.utils.serde import INTERNED, Serializable, _install_setstate
+from metaspn_schemas.utils.time import datetime_to_str, ensure_utc, str_to_datetime, utc_now
+
+
+@dataclass(frozen=True, slots=True)
+class EntityStateSnapshot(Serializable):
+    config_id: str
+    taken_at: datetime
+    states: dict[str, str]
+    applied_count: int = 0
+    last_attempt_id: str | None = None
+    last_attempted_at: datetime | None = None
+    # Every consumed attempt_id sharing last_attempted_at, so a resume skips exactly these.
+    last_attempt_ids: tuple[str, ...] = field(default_factory=tuple)
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "taken_at", ensure_utc(self.taken_at))
+        if self.last_attempted_at is not None:
+            object.__setattr__(self, "last_attempted_at", ensure_utc(self.last_attempted_at))
+
+
+class EntityStateTracker:
+    """Current gate state per ``entity_id``, folded from ``GateTransitionAttempt`` records.
+
+    Records may be attempt objects or their ``to_dict()`` mappings; mappings are read
+    field by field without being decoded. Only ``allowed`` attempts move an entity;
+    every consumed record advances the resume position. States are stored as integer
+    codes into ``config.states``.
+    """
+
+    __slots__ = (
+        "config",
+        "gate_name",
+        "strict",
+        "applied_count",
+        "last_attempt_id",
+        "_last_attempted_at",
+        "_last_ids",
+        "_codes",
+        "_states",
+        "_resume_from",
+    )
+
+    def __init__(self, config: StateMachineConfig, *, gate_name: str | None = None, strict: bool = False) -> None:
+        self.config = config
+        self.gate_name = gate_name
+        self.strict = strict
+        self.applied_count = 0
+        self.last_attempt_id: str | None = None
+        self._last_attempted_at: datetime | str | None = None
+        self._last_ids: list[str] = []
+        self._codes: dict[str, int] = {state: code for code, state in enumerate(config.states)}
+        self._states: dict[str, int] = {}
+        self._resume_from: tuple[datetime, str, frozenset[str]] | None = None
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, entity_id: object) -> bool:
+        return entity_id in self._states
+
+    @property
+    def last_attempted_at(self) -> datetime | None:
+        """``attempted_at`` of the last consumed record (parsed on access for mapping records)."""
+        value = self._last_attempted_at
+        if isinstance(value, str):
+            value = self._last_attempted_at = str_to_datetime(value)
+        return value
+
+    def state_of(self, entity_id: str) -> str:
+        """Current state of ``entity_id``; entities with no applied attempt are in ``initial_state``."""
+        code = self._states.get(entity_id)
+        return self.config.initial_state if code is None else self.config.states[code]
+
+    def items(self) -> Iterator[tuple[str, str]]:
+        states = self.config.states
+        for entity_id, code in self._states.items():
+            yield entity_id, states[code]
+
+    def counts(self) -> dict[str, int]:
+        """Number of tracked entities per state."""
+        totals = [0] * len(self.config.states)
+        for code in self._states.values():
+            totals[code] += 1
+        return {state: total for state, total in zip(self.config.states, totals) if total}
+
+    def apply(self, attempt: GateTransitionAttempt | Mapping[str, Any]) -> bool:
+        """Fold one attempt record; returns ``True`` when it changed an entity's state."""
+        return self.consume((attempt,)) == 1
+
+    def consume(self, attempts: Iterable[GateTransitionAttempt | Mapping[str, Any]]) -> int:
+        """Fold a stream of attempt records ordered by ``attempted_at``.
+
+        After ``restore``, records before the snapshot's last ``attempted_at`` and
+        the attempts already applied at that instant are skipped, so either the full
+        stream or just its new tail can be passed. Returns the number of state
+        changes applied.
+        """
+        codes = self._codes
+        states = self._states
+        gate_name = self.gate_name
+        applied = 0
+        for attempt in attempts:
+            if isinstance(attempt, GateTransitionAttempt):
+                record_gate = attempt.gate_name
+                attempt_id = attempt.attempt_id
+                attempted_at: datetime | str = attempt.attempted_at
+                allowed = attempt.allowed
+                entity_id = attempt.entity_id
+                from_state = attempt.from_state
+                to_state = attempt.to_state
+            else:
+                record_gate = attempt["gate_name"]
+                attempt_id = attempt["attempt_id"]
+                attempted_at = attempt["attempted_at"]
+                allowed = attempt["allowed"]
+                entity_id = attempt["entity_id"]
+                from_state = attempt["from_state"]
+                to_state = attempt["to_state"]
+
+            if gate_name is not None and record_gate != gate_name:
+                continue
+            if self._resume_from is not None and self._already_applied(attempt_id, attempted_at):
+                continue
+            # Check the record before recording it, so a ValueError leaves the tracker as of the previous record.
+            code = None
+            if allowed:
+                code = codes.get(to_state)
+                if code is None:
+                    raise ValueError(f"attempt {attempt_id} moves to unknown state: {to_state}")
+                if self.strict:
+                    current = self.state_of(entity_id)
+                    if current != from_state:
+                        raise ValueError(f"attempt {attempt_id} expects {entity_id} in {from_state}, found {current}")
+            if _same_instant(attempted_at, self._last_attempted_at):
+                self._last_ids.append(attempt_id)
+            else:
+                self._last_ids = [attempt_id]
+            self.last_attempt_id = attempt_id
+            self._last_attempted_at = attempted_at
+            if code is None:
+                continue
+
+            states[entity_id] = code
+            self.applied_count += 1
+            applied += 1
+        return applied
+
+    def snapshot(self, taken_at: datetime | None = None) -> EntityStateSnapshot:
+        return EntityStateSnapshot(
+            config_id=self.config.config_id,
+            taken_at=taken_at or utc_now(),
+            states=dict(self.items()),
+            applied_count=self.applied_count,
+            last_attempt_id=self.last_attempt_id,
+            last_attempted_at=self.last_attempted_at,
+            last_attempt_ids=tuple(self._last_ids),
+            schema_version=self.config.schema_version,
+        )
+
+    @classmethod
+    def restore(
+        cls,
+        config: StateMachineConfig,
+        snapshot: EntityStateSnapshot | Mapping[str, Any],
+        *,
+        gate_name: str | None = None,
+        strict: bool = False,
+    ) -> EntityStateTracker:
+        if not isinstance(snapshot, EntityStateSnapshot):
+            snapshot = EntityStateSnapshot.from_dict(snapshot)
+        if snapshot.config_id != config.config_id:
+            raise ValueError(f"snapshot is for config {snapshot.config_id}, not {config.config_id}")
+        tracker = cls(config, gate_name=gate_name, strict=strict)
+        codes = tracker._codes
+        for entity_id, state in snapshot.states.items():
+            code = codes.get(state)
+            if code is None:
+                raise ValueError(f"snapshot state for {entity_id} not in config states: {state}")
+            tracker._states[entity_id] = code
+        tracker.applied_count = snapshot.applied_count
+        tracker.last_attempt_id = snapshot.last_attempt_id
+        tracker._last_attempted_at = snapshot.last_attempted_at
+        applied_ids = list(snapshot.last_attempt_ids)
+        if not applied_ids and snapshot.last_attempt_id is not None:
+            applied_ids = [snapshot.last_attempt_id]
+        tracker._last_ids = applied_ids
+        if snapshot.last_attempted_at is not None:
+            resume_at = snapshot.last_attempted_at
+            tracker._resume_from = (resume_at, datetime_to_str(resume_at), frozenset(applied_ids))
+        return tracker
+
+    def _already_applied(self, attempt_id: str, attempted_at: datetime | str) -> bool:
+        assert self._resume_from is not None
+        resume_at, resume_text, applied_ids = self._resume_from
+        if isinstance(attempted_at, str) and len(attempted_at) == len(resume_text) and attempted_at[-1:] == "Z":
+            # Canonical UTC strings of equal length order the same way as the instants.
+            at: datetime | str = attempted_at
+            reference: datetime | str = resume_text
+        else:
+            at = attempted_at if isinstance(attempted_at, datetime) else str_to_datetime(attempted_at)
+            reference = resume_at
+        if at < reference:
+            return True
+        if at == reference:
+            return attempt_id in applied_ids
+        self._resume_from = None
+        return False
+
+
+def _same_instant(a: datetime | str | None, b: datetime | str | None) -> bool:
+    if a is None or b is None:
+        return False
+    if type(a) is type(b):
+        return a == b
+    return (a if isinstance(a, datetime) else str_to_datetime(a)) == (b if isinstance(b, datetime) else str_to_datetime(b))
+
+
+_install_setstate(globals())
@@ -5,10 +5,10 @@ from datetime import datetime
 from typing import Any
 
 from metaspn_schemas.core import DEFAULT_SCHEMA_VERSION, EntityRef
-from metaspn_schemas.utils.serde import Serializable
+from metaspn_schemas.utils.serde import INTERNED, Serializable, _install_setstate
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Task(Serializable):
     task_id: str
     task_type: str
@@ -17,15 +17,18 @@ class Task(Serializable):
     entity_ref: EntityRef
     inputs: dict[str, Any] = field(default_factory=dict)
     context: dict[str, Any] = field(default_factory=dict)
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Result(Serializable):
     result_id: str
     task_id: str
-    status: str
+    status: str = field(metadata=INTERNED)
     completed_at: datetime
     outputs: dict[str, Any] = field(default_factory=dict)
     errors: tuple[str, ...] = field(default_factory=tuple)
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
+
+
+_install_setstate(globals())
@@ -4,48 +4,48 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 from metaspn_schemas.core import DEFAULT_SCHEMA_VERSION
-from metaspn_schemas.utils.serde import Serializable
+from metaspn_schemas.utils.serde import INTERNED, Serializable, _install_setstate
 from metaspn_schemas.utils.time import ensure_utc
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TokenSignalSeen(Serializable):
     token_signal_id: str
     token_id: str
     creator_id: str
     signal_type: str
     seen_at: datetime
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     metadata: dict[str, str] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "seen_at", ensure_utc(self.seen_at))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PromiseRegistered(Serializable):
     promise_id: str
     token_id: str
     creator_id: str
     registered_at: datetime
     promise_text: str
-    schema_version: str = DEFAULT_SCHEMA_VERSION
-    source: str | None = None
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
+    source: str | None = field(default=None, metadata=INTERNED)
     metadata: dict[str, str] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "registered_at", ensure_utc(self.registered_at))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PromiseEvaluated(Serializable):
     evaluation_id: str
     promise_id: str
     token_id: str
     evaluated_at: datetime
-    status: str
+    status: str = field(metadata=INTERNED)
     confidence: float
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     rationale: str | None = None
     metadata: dict[str, str] = field(default_factory=dict)
 
@@ -53,7 +53,7 @@ class PromiseEvaluated(Serializable):
         object.__setattr__(self, "evaluated_at", ensure_utc(self.evaluated_at))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TokenHealthScoreCard(Serializable):
     scorecard_id: str
     token_id: str
@@ -61,22 +61,22 @@ class TokenHealthScoreCard(Serializable):
     health_score: float
     risk_score: float
     momentum_score: float
-    schema_version: str = DEFAULT_SCHEMA_VERSION
-    scorer: str | None = None
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
+    scorer: str | None = field(default=None, metadata=INTERNED)
     metrics: dict[str, float] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "computed_at", ensure_utc(self.computed_at))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TokenOutcomeObserved(Serializable):
     outcome_observed_id: str
     token_id: str
     observed_at: datetime
     outcome_type: str
     success: bool
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     value: float | None = None
     metadata: dict[str, str] = field(default_factory=dict)
 
@@ -84,7 +84,7 @@ class TokenOutcomeObserved(Serializable):
         object.__setattr__(self, "observed_at", ensure_utc(self.observed_at))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TokenOutcomeWindow(Serializable):
     token_outcome_window_id: str
     token_id: str
@@ -92,7 +92,7 @@ class TokenOutcomeWindow(Serializable):
     window_end: datetime
     evaluated_at: datetime
     success_rate: float
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     outcomes: tuple[str, ...] = field(default_factory=tuple)
     metrics: dict[str, float] = field(default_factory=dict)
 
@@ -103,14 +103,14 @@ class TokenOutcomeWindow(Serializable):
         object.__setattr__(self, "outcomes", tuple(sorted(self.outcomes)))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PromisePredictiveAccuracy(Serializable):
     predictive_accuracy_id: str
     promise_id: str
     measured_at: datetime
     accuracy: float
     sample_size: int
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     calibration_error: float | None = None
     metadata: dict[str, str] = field(default_factory=dict)
 
@@ -118,7 +118,7 @@ class PromisePredictiveAccuracy(Serializable):
         object.__setattr__(self, "measured_at", ensure_utc(self.measured_at))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreatorBehaviorCorrelation(Serializable):
     creator_correlation_id: str
     creator_id: str
@@ -126,9 +126,12 @@ class CreatorBehaviorCorrelation(Serializable):
     behavior_signal: str
     outcome_signal: str
     correlation: float
-    schema_version: str = DEFAULT_SCHEMA_VERSION
+    schema_version: str = field(default=DEFAULT_SCHEMA_VERSION, metadata=INTERNED)
     p_value: float | None = None
     metadata: dict[str, str] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "computed_at", ensure_utc(self.computed_at))
+
+
+_install_setstate(globals())
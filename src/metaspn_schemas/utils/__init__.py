@@ -1,14 +1,56 @@
-from metaspn_schemas.utils.ids import generate_id
-from metaspn_schemas.utils.serde import Serializable, dataclass_from_dict, dataclass_to_dict
-from metaspn_schemas.utils.time import datetime_to_str, ensure_utc, str_to_datetime, utc_now
+from metaspn_schemas.utils.binary import decode_binary, encode_binary, schema_fingerprint
+from metaspn_schemas.utils.hashing import canonical_json, content_hash
+from metaspn_schemas.utils.ids import (
+    ParsedId,
+    generate_id,
+    generate_ids,
+    max_id_for_time,
+    min_id_for_time,
+    parse_id,
+)
+from metaspn_schemas.utils.json_codec import decode_json, encode_json, write_json_array
+from metaspn_schemas.utils.serde import (
+    Serializable,
+    dataclass_from_dict,
+    dataclass_from_dicts,
+    dataclass_to_dict,
+    dataclass_to_dicts,
+    set_trusted_check_rate,
+)
+from metaspn_schemas.utils.time import (
+    clear_timestamp_caches,
+    datetime_to_str,
+    ensure_utc,
+    set_timestamp_cache_size,
+    str_to_datetime,
+    utc_now,
+)
 
 __all__ = [
+    "ParsedId",
     "Serializable",
+    "canonical_json",
+    "clear_timestamp_caches",
+    "content_hash",
     "dataclass_from_dict",
+    "dataclass_from_dicts",
     "dataclass_to_dict",
+    "dataclass_to_dicts",
     "datetime_to_str",
+    "decode_binary",
+    "decode_json",
+    "encode_binary",
+    "encode_json",
     "ensure_utc",
     "generate_id",
+    "generate_ids",
+    "max_id_for_time",
+    "min_id_for_time",
+    "parse_id",
+    "schema_fingerprint",
+    "set_timestamp_cache_size",
+    "set_trusted_check_rate",
     "str_to_datetime",
     "utc_now",
+    "write_json_array",
 ]
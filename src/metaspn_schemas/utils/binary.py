@@ -0,0 +1,303 @@
+"""Canonical tagged binary encoding for ``Serializable`` schemas.
+
+Layout::
+
+    b"MSB" | version (1 byte) | fingerprint (8 bytes) | field count (varint) | fields...
+
+Top-level fields are written positionally in dataclass field order, so field
+names never hit the wire; a field dropped by ``privacy_mode`` is written as
+``ABSENT`` and decodes to its default. Every value is a tag byte followed by:
+
+=========  =====================================================================
+NONE       nothing
+FALSE      nothing
+TRUE       nothing
+INT        zigzag varint (arbitrary precision)
+FLOAT      8-byte big-endian IEEE 754 double
+STR        varint byte length + UTF-8
+LIST       varint item count + items (tuples and lists)
+DICT       varint item count + (varint key length + UTF-8 key, value) sorted by key
+DATETIME   zigzag varint microseconds since the Unix epoch, UTC
+ABSENT     nothing (top-level privacy-omitted field)
+=========  =====================================================================
+
+Nested dataclasses are written as ``DICT`` of their fields. Encoding is
+deterministic: objects holding the same values of the same types produce identical
+bytes, so the output can be hashed. Values are not normalized across types, so
+``1``, ``1.0`` and ``True`` (or ``0.0`` and ``-0.0``) in ``Any`` fields compare
+equal yet encode differently and decode back to their own type.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+from dataclasses import fields, is_dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, TypeVar
+
+from metaspn_schemas.utils.serde import Serializable, _codec_for
+from metaspn_schemas.utils.time import ensure_utc
+
+T = TypeVar("T")
+
+MAGIC = b"MSB"
+VERSION = 1
+HEADER_SIZE = len(MAGIC) + 1 + 8
+
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3
+TAG_FLOAT = 4
+TAG_STR = 5
+TAG_LIST = 6
+TAG_DICT = 7
+TAG_DATETIME = 8
+TAG_ABSENT = 9
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_FLOAT = struct.Struct(">d")
+_FINGERPRINTS: dict[type, bytes] = {}
+_CLASSES_BY_FINGERPRINT: dict[bytes, type] = {}
+
+
+def schema_fingerprint(cls: type) -> bytes:
+    """8-byte digest of a schema's qualified name and its field names and annotations."""
+    fingerprint = _FINGERPRINTS.get(cls)
+    if fingerprint is None:
+        if not is_dataclass(cls):
+            raise TypeError(f"{cls!r} is not a dataclass")
+        described = ";".join(
+            f"{f.name}:{f.type if isinstance(f.type, str) else repr(f.type)}" for f in fields(cls)
+        )
+        text = f"{cls.__module__}.{cls.__qualname__}|{described}"
+        fingerprint = hashlib.sha256(text.encode("utf-8")).digest()[:8]
+        _FINGERPRINTS[cls] = fingerprint
+    return fingerprint
+
+
+def encode_binary(obj: Any, *, privacy_mode: bool = False) -> bytes:
+    cls = type(obj)
+    if not is_dataclass(obj) or isinstance(obj, type):
+        raise TypeError("encode_binary expects a dataclass instance")
+    plan = _codec_for(cls).fields
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+    out += schema_fingerprint(cls)
+    _write_uvarint(out, len(plan))
+    for field_plan in plan:
+        if privacy_mode and field_plan.omit_in_privacy_mode:
+            out.append(TAG_ABSENT)
+        else:
+            _write(out, getattr(obj, field_plan.name), privacy_mode)
+    return bytes(out)
+
+
+def decode_binary(cls: type[T] | None, data: bytes | bytearray | memoryview) -> T:
+    """Decode ``data`` into ``cls``; with ``cls=None`` the class is found by fingerprint.
+
+    ``data`` is read through a ``memoryview`` without copying the buffer. Malformed
+    or truncated payloads, including out-of-range values, values of the wrong type
+    for their field and runaway nesting, raise ``ValueError``.
+    """
+    view = data if isinstance(data, memoryview) else memoryview(data)
+    if len(view) < HEADER_SIZE or view[:3] != MAGIC:
+        raise ValueError("not a metaspn binary payload")
+    if view[3] != VERSION:
+        raise ValueError(f"unsupported binary version: {view[3]}")
+    fingerprint = bytes(view[4:HEADER_SIZE])
+    if cls is None:
+        cls = _class_for_fingerprint(fingerprint)
+    elif fingerprint != schema_fingerprint(cls):
+        raise ValueError(f"binary payload fingerprint does not match {cls.__name__}")
+
+    codec = _codec_for(cls)
+    values: dict[str, Any] = {}
+    try:
+        count, pos = _read_uvarint(view, HEADER_SIZE)
+        if count != len(codec.fields):
+            raise ValueError(f"{cls.__name__} expects {len(codec.fields)} fields, payload has {count}")
+        for field_plan in codec.fields:
+            if view[pos] == TAG_ABSENT:
+                pos += 1
+                continue
+            values[field_plan.name], pos = _read(view, pos)
+        if pos != len(view):
+            raise ValueError(f"{len(view) - pos} trailing bytes after {cls.__name__} payload")
+        return codec.decode(values)
+    except IndexError:
+        # Single-byte reads (tags, varints) run past the end; slices are checked in _read.
+        raise ValueError(f"truncated {cls.__name__} binary payload ({len(view)} bytes)") from None
+    except (OverflowError, TypeError, RecursionError) as err:
+        # Huge DATETIME varints, tags that do not fit the field's type, or nesting past the recursion limit.
+        raise ValueError(f"malformed {cls.__name__} binary payload: {err}") from err
+
+
+def _write(out: bytearray, value: Any, privacy_mode: bool) -> None:
+    kind = type(value)
+    if kind is str:
+        encoded = value.encode("utf-8")
+        out.append(TAG_STR)
+        _write_uvarint(out, len(encoded))
+        out += encoded
+    elif value is None:
+        out.append(TAG_NONE)
+    elif kind is bool:
+        out.append(TAG_TRUE if value else TAG_FALSE)
+    elif kind is int:
+        out.append(TAG_INT)
+        _write_uvarint(out, value << 1 if value >= 0 else (-value << 1) - 1)
+    elif kind is float:
+        out.append(TAG_FLOAT)
+        out += _FLOAT.pack(value)
+    elif kind is tuple or kind is list:
+        out.append(TAG_LIST)
+        _write_uvarint(out, len(value))
+        for item in value:
+            _write(out, item, privacy_mode)
+    elif kind is dict:
+        out.append(TAG_DICT)
+        _write_uvarint(out, len(value))
+        for key in sorted(value):
+            _write_key(out, key)
+            _write(out, value[key], privacy_mode)
+    elif isinstance(value, datetime):
+        delta = ensure_utc(value) - _EPOCH
+        micros = (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+        out.append(TAG_DATETIME)
+        _write_uvarint(out, micros << 1 if micros >= 0 else (-micros << 1) - 1)
+    elif is_dataclass(value) and not isinstance(value, type):
+        plans = sorted(
+            (plan for plan in _codec_for(type(value)).fields if not (privacy_mode and plan.omit_in_privacy_mode)),
+            key=lambda plan: plan.name,
+        )
+        out.append(TAG_DICT)
+        _write_uvarint(out, len(plans))
+        for plan in plans:
+            _write_key(out, plan.name)
+            _write(out, getattr(value, plan.name), privacy_mode)
+    elif isinstance(value, bool):
+        out.append(TAG_TRUE if value else TAG_FALSE)
+    elif isinstance(value, int):
+        _write(out, int(value), privacy_mode)
+    elif isinstance(value, float):
+        _write(out, float(value), privacy_mode)
+    elif isinstance(value, str):
+        _write(out, str(value), privacy_mode)
+    elif isinstance(value, (tuple, list)):
+        _write(out, list(value), privacy_mode)
+    elif isinstance(value, dict):
+        _write(out, dict(value), privacy_mode)
+    else:
+        raise TypeError(f"Cannot binary-encode value of type {kind.__name__}")
+
+
+def _write_key(out: bytearray, key: Any) -> None:
+    if type(key) is not str:
+        raise TypeError(f"binary-encoded dict keys must be str, got {type(key).__name__}")
+    encoded = key.encode("utf-8")
+    _write_uvarint(out, len(encoded))
+    out += encoded
+
+
+def _write_uvarint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_uvarint(view: memoryview, pos: int) -> tuple[int, int]:
+    byte = view[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    result = byte & 0x7F
+    shift = 7
+    while True:
+        pos += 1
+        byte = view[pos]
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos + 1
+        shift += 7
+
+
+def _read(view: memoryview, pos: int) -> tuple[Any, int]:
+    # Lengths, counts and ints below 128 fit in one varint byte and are read inline.
+    tag = view[pos]
+    if tag == TAG_STR:
+        size = view[pos + 1]
+        if size < 0x80:
+            pos += 2
+        else:
+            size, pos = _read_uvarint(view, pos + 1)
+        end = pos + size
+        if end > len(view):
+            raise IndexError(end)
+        return str(view[pos:end], "utf-8"), end
+    if tag == TAG_DICT:
+        count = view[pos + 1]
+        if count < 0x80:
+            pos += 2
+        else:
+            count, pos = _read_uvarint(view, pos + 1)
+        mapping = {}
+        for _ in range(count):
+            size = view[pos]
+            if size < 0x80:
+                pos += 1
+            else:
+                size, pos = _read_uvarint(view, pos)
+            end = pos + size
+            if end > len(view):
+                raise IndexError(end)
+            mapping[str(view[pos:end], "utf-8")], pos = _read(view, end)
+        return mapping, pos
+    if tag == TAG_LIST:
+        count = view[pos + 1]
+        if count < 0x80:
+            pos += 2
+        else:
+            count, pos = _read_uvarint(view, pos + 1)
+        items = []
+        for _ in range(count):
+            item, pos = _read(view, pos)
+            items.append(item)
+        return items, pos
+    if tag == TAG_INT:
+        raw = view[pos + 1]
+        if raw < 0x80:
+            pos += 2
+        else:
+            raw, pos = _read_uvarint(view, pos + 1)
+        return (raw >> 1) ^ -(raw & 1), pos
+    if tag == TAG_NONE:
+        return None, pos + 1
+    if tag == TAG_TRUE:
+        return True, pos + 1
+    if tag == TAG_FALSE:
+        return False, pos + 1
+    if tag == TAG_FLOAT:
+        if pos + 9 > len(view):
+            raise IndexError(pos + 9)
+        return _FLOAT.unpack_from(view, pos + 1)[0], pos + 9
+    if tag == TAG_DATETIME:
+        raw, pos = _read_uvarint(view, pos + 1)
+        return _EPOCH + timedelta(microseconds=(raw >> 1) ^ -(raw & 1)), pos
+    raise ValueError(f"unknown binary tag {tag} at offset {pos}")
+
+
+def _class_for_fingerprint(fingerprint: bytes) -> type:
+    cls = _CLASSES_BY_FINGERPRINT.get(fingerprint)
+    if cls is None:
+        pending = list(Serializable.__subclasses__())
+        while pending:
+            candidate = pending.pop()
+            pending.extend(candidate.__subclasses__())
+            if is_dataclass(candidate):
+                _CLASSES_BY_FINGERPRINT.setdefault(schema_fingerprint(candidate), candidate)
+        cls = _CLASSES_BY_FINGERPRINT.get(fingerprint)
+        if cls is None:
+            raise ValueError(f"no schema registered for fingerprint {fingerprint.hex()}")
+    return cls
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
-import uuid
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
 
+from metaspn_schemas.utils.time import ensure_utc
 
 VALID_PREFIXES = {
     "signal": "s",
@@ -11,11 +17,183 @@ VALID_PREFIXES = {
     "entity": "ent",
 }
 
+_KINDS_BY_PREFIX = {prefix: kind for kind, prefix in VALID_PREFIXES.items()}
 
-def generate_id(prefix: str | None = None) -> str:
-    token = uuid.uuid4().hex
+# Random bytes are drawn from the OS in blocks of this size and handed out 16 per ID.
+ENTROPY_POOL_SIZE = 4096
+
+# UUID version/variant bits: version nibble at bits 76-79, variant "10" at bits 62-63.
+_VERSION_VARIANT_CLEAR = ~((0xF << 76) | (0x3 << 62)) & ((1 << 128) - 1)
+_UUID4_BITS = (0x4 << 76) | (0x2 << 62)
+_UUID7_BITS = (0x7 << 76) | (0x2 << 62)
+# Time-ordered IDs carry a 42-bit sequence (12 bits above the variant, 30 below) after
+# the 48-bit millisecond timestamp. Each new millisecond seeds it below 2**41 so a
+# burst has at least 2**41 increments of headroom before borrowing the next millisecond.
+_SEQUENCE_BITS = 42
+_SEQUENCE_SEED_BITS = 41
+_PREFIX_CACHE_SIZE = 1024
+
+_TOKEN = re.compile(r"[0-9a-f]{32}")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MAX_MS = (1 << 48) - 1
+
+_lock = threading.Lock()
+_pool = b""
+_pool_pos = 0
+_last_ms = 0
+_last_sequence = 0
+_prefix_strings: dict[str, str] = {}
+
+
+def generate_id(prefix: str | None = None, *, time_ordered: bool = False) -> str:
+    """A 32-hex-digit token, optionally as ``<prefix>_<token>``.
+
+    By default the token is a random UUIDv4. With ``time_ordered=True`` it is
+    UUIDv7-style: a millisecond timestamp followed by a per-process sequence, so
+    IDs sort by creation time and strictly increase within the process.
+    """
+    value = _time_ordered_values(1)[0] if time_ordered else _random_value()
     if prefix is None:
-        return token
-    normalized = prefix.strip().lower()
-    mapped = VALID_PREFIXES.get(normalized, normalized)
-    return f"{mapped}_{token}"
+        return f"{value:032x}"
+    return f"{_prefix_string(prefix)}{value:032x}"
+
+
+def generate_ids(prefix: str | None, n: int, *, time_ordered: bool = False) -> list[str]:
+    """``n`` IDs as from ``generate_id``, drawing entropy for the whole batch at once."""
+    if n < 0:
+        raise ValueError("n must be >= 0")
+    if not n:
+        return []
+    head = "" if prefix is None else _prefix_string(prefix)
+    values = _time_ordered_values(n) if time_ordered else _random_values(n)
+    return [f"{head}{value:032x}" for value in values]
+
+
+class ParsedId(NamedTuple):
+    prefix: str | None
+    kind: str | None
+    token: str
+    timestamp: datetime | None
+
+
+def parse_id(value: str) -> ParsedId:
+    """Split an ID into prefix, kind (``"signal"`` for ``s_``), token and embedded timestamp.
+
+    ``kind`` is ``None`` for prefixes outside ``VALID_PREFIXES``; ``timestamp`` is the
+    UTC millisecond of a time-ordered token and ``None`` for random ones.
+    """
+    prefix, _, token = value.rpartition("_")
+    if not _TOKEN.fullmatch(token):
+        raise ValueError(f"not a generated id: {value!r}")
+    timestamp = None
+    if token[12] == "7" and token[16] in "89ab":
+        timestamp = _EPOCH + timedelta(milliseconds=int(token[:12], 16))
+    if not prefix:
+        return ParsedId(None, None, token, timestamp)
+    return ParsedId(prefix, _KINDS_BY_PREFIX.get(prefix), token, timestamp)
+
+
+def min_id_for_time(prefix: str | None, at: datetime) -> str:
+    """Smallest time-ordered ID that ``generate_id(prefix, time_ordered=True)`` can produce in ``at``'s millisecond.
+
+    Every time-ordered ID created between ``start`` and ``end`` (inclusive, to the
+    millisecond) falls in ``min_id_for_time(p, start) <= id <= max_id_for_time(p, end)``.
+    """
+    head = "" if prefix is None else _prefix_string(prefix)
+    return f"{head}{(_millis(at) << 80) | _UUID7_BITS:032x}"
+
+
+def max_id_for_time(prefix: str | None, at: datetime) -> str:
+    """Largest time-ordered ID that can carry ``at``'s millisecond; see ``min_id_for_time``."""
+    head = "" if prefix is None else _prefix_string(prefix)
+    return f"{head}{(_millis(at) << 80) | (_VERSION_VARIANT_CLEAR & ((1 << 80) - 1)) | _UUID7_BITS:032x}"
+
+
+def _millis(at: datetime) -> int:
+    millis = (ensure_utc(at) - _EPOCH) // timedelta(milliseconds=1)
+    if not 0 <= millis <= _MAX_MS:
+        raise ValueError(f"timestamp outside the 48-bit millisecond range: {at.isoformat()}")
+    return millis
+
+
+def _prefix_string(prefix: str) -> str:
+    head = _prefix_strings.get(prefix)
+    if head is None:
+        normalized = prefix.strip().lower()
+        head = f"{VALID_PREFIXES.get(normalized, normalized)}_"
+        if len(_prefix_strings) < _PREFIX_CACHE_SIZE:
+            _prefix_strings[prefix] = head
+    return head
+
+
+def _entropy(size: int) -> bytes:
+    with _lock:
+        return _take_entropy(size)
+
+
+def _take_entropy(size: int) -> bytes:
+    # Callers hold _lock.
+    global _pool, _pool_pos
+    if size > ENTROPY_POOL_SIZE:
+        return os.urandom(size)
+    if _pool_pos + size > len(_pool):
+        _pool = os.urandom(ENTROPY_POOL_SIZE)
+        _pool_pos = 0
+    start = _pool_pos
+    _pool_pos += size
+    return _pool[start:_pool_pos]
+
+
+def _random_value() -> int:
+    with _lock:
+        entropy = _take_entropy(16)
+    return int.from_bytes(entropy, "big") & _VERSION_VARIANT_CLEAR | _UUID4_BITS
+
+
+def _random_values(n: int) -> list[int]:
+    entropy = _entropy(16 * n)
+    from_bytes = int.from_bytes
+    return [
+        from_bytes(entropy[offset : offset + 16], "big") & _VERSION_VARIANT_CLEAR | _UUID4_BITS
+        for offset in range(0, 16 * n, 16)
+    ]
+
+
+def _time_ordered_values(n: int) -> list[int]:
+    global _last_ms, _last_sequence
+    from_bytes = int.from_bytes
+    values = []
+    with _lock:
+        entropy = _take_entropy(4 * n + 6)
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms, sequence = now_ms, from_bytes(entropy[-6:], "big") >> (48 - _SEQUENCE_SEED_BITS)
+        else:
+            # Same millisecond, or the clock stepped back: keep counting from the last ID.
+            sequence = _last_sequence + 1
+        base = (_last_ms << 80) | _UUID7_BITS
+        for offset in range(0, 4 * n, 4):
+            if sequence >> _SEQUENCE_BITS:
+                _last_ms, sequence = _last_ms + 1, 0
+                base = (_last_ms << 80) | _UUID7_BITS
+            values.append(
+                base
+                | ((sequence >> 30) << 64)
+                | ((sequence & 0x3FFFFFFF) << 32)
+                | from_bytes(entropy[offset : offset + 4], "big")
+            )
+            sequence += 1
+        _last_sequence = sequence - 1
+    return values
+
+
+def _reset_after_fork() -> None:
+    # A forked child must not replay the parent's pooled entropy.
+    global _lock, _pool, _pool_pos
+    _lock = threading.Lock()
+    _pool = b""
+    _pool_pos = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,256 @@
+"""Canonical JSON written straight from dataclass fields.
+
+``encode_json(obj)`` produces exactly the text of
+``json.dumps(obj.to_dict(), sort_keys=True, separators=(",", ":"))`` without
+building the intermediate dict: each class gets a plan, compiled once per privacy
+mode, holding its fields in sorted order with pre-escaped ``"name":`` prefixes and
+a value encoder specialized from the field's type hint. Values the specialized
+encoders do not expect fall back to ``json.dumps`` of their ``to_dict`` form, so
+output never depends on the hint.
+"""
+
+from __future__ import annotations
+
+import json
+import types
+from dataclasses import dataclass, is_dataclass
+from datetime import datetime
+from json.encoder import encode_basestring_ascii
+from operator import attrgetter
+from typing import IO, Any, Callable, Iterable, TypeVar, Union, get_args, get_origin, get_type_hints
+
+from metaspn_schemas.utils.serde import _codec_for, _to_primitive
+from metaspn_schemas.utils.time import datetime_to_str
+
+T = TypeVar("T")
+
+JsonEncoder = Callable[[Any, bool], str]
+
+STREAM_BUFFER_SIZE = 1 << 16
+
+_dumps = json.JSONEncoder(sort_keys=True, separators=(",", ":")).encode
+_JSON_PLANS: dict[tuple[type, bool], _JsonPlan] = {}
+_JSON_ENCODERS: dict[Any, JsonEncoder] = {}
+
+
+@dataclass(frozen=True)
+class _JsonPlan:
+    """Sorted field prefixes (``"name":``, comma-led after the first) and encoders for one class."""
+
+    prefixes: tuple[str, ...]
+    encoders: tuple[JsonEncoder, ...]
+    getter: Callable[[Any], tuple[Any, ...]]
+
+    def encode(self, obj: Any, privacy_mode: bool) -> str:
+        if not self.prefixes:
+            return "{}"
+        return (
+            "{"
+            + "".join(
+                [
+                    prefix + encode(value, privacy_mode)
+                    for prefix, encode, value in zip(self.prefixes, self.encoders, self.getter(obj))
+                ]
+            )
+            + "}"
+        )
+
+
+def encode_json(obj: Any, *, privacy_mode: bool = False) -> str:
+    """Canonical JSON text of a dataclass instance, identical to ``json.dumps`` of its ``to_dict``."""
+    if not is_dataclass(obj) or isinstance(obj, type):
+        raise TypeError("encode_json expects a dataclass instance")
+    return _json_plan(type(obj), privacy_mode).encode(obj, privacy_mode)
+
+
+def decode_json(cls: type[T], text: str | bytes | bytearray) -> T:
+    return _codec_for(cls).decode(json.loads(text))
+
+
+def write_json_array(
+    fp: IO[str],
+    objs: Iterable[Any],
+    *,
+    privacy_mode: bool = False,
+    buffer_size: int = STREAM_BUFFER_SIZE,
+) -> int:
+    """Stream ``objs`` to ``fp`` as one canonical JSON array; returns the number written.
+
+    Text is flushed to ``fp`` whenever roughly ``buffer_size`` characters are
+    pending, so memory stays bounded for any batch size. The output equals
+    ``json.dumps([o.to_dict() for o in objs], sort_keys=True, separators=(",", ":"))``.
+    """
+    if buffer_size < 1:
+        raise ValueError("buffer_size must be >= 1")
+    pending: list[str] = ["["]
+    pending_size = 1
+    count = 0
+    plan: _JsonPlan | None = None
+    plan_type: type | None = None
+    for obj in objs:
+        cls = type(obj)
+        if cls is not plan_type:
+            if not is_dataclass(cls):
+                raise TypeError("write_json_array expects dataclass instances")
+            plan, plan_type = _json_plan(cls, privacy_mode), cls
+        text = plan.encode(obj, privacy_mode)  # type: ignore[union-attr]
+        if count:
+            text = "," + text
+        pending.append(text)
+        pending_size += len(text)
+        count += 1
+        if pending_size >= buffer_size:
+            fp.write("".join(pending))
+            pending.clear()
+            pending_size = 0
+    pending.append("]")
+    fp.write("".join(pending))
+    return count
+
+
+def _json_plan(cls: type, privacy_mode: bool) -> _JsonPlan:
+    plan = _JSON_PLANS.get((cls, privacy_mode))
+    if plan is None:
+        hints = get_type_hints(cls)
+        names = sorted(
+            field_plan.name
+            for field_plan in _codec_for(cls).fields
+            if not (privacy_mode and field_plan.omit_in_privacy_mode)
+        )
+        if len(names) == 1:
+            name = names[0]
+            getter: Callable[[Any], tuple[Any, ...]] = lambda obj: (getattr(obj, name),)
+        elif names:
+            getter = attrgetter(*names)
+        else:
+            getter = lambda obj: ()
+        plan = _JsonPlan(
+            prefixes=tuple(
+                ("," if index else "") + encode_basestring_ascii(name) + ":" for index, name in enumerate(names)
+            ),
+            encoders=tuple(_json_encoder_for(hints.get(name, Any)) for name in names),
+            getter=getter,
+        )
+        _JSON_PLANS[(cls, privacy_mode)] = plan
+    return plan
+
+
+def _json_float(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value == float("inf"):
+        return "Infinity"
+    if value == -float("inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _json_any(value: Any, privacy_mode: bool) -> str:
+    kind = type(value)
+    if kind is str:
+        return encode_basestring_ascii(value)
+    if value is None:
+        return "null"
+    if kind is bool:
+        return "true" if value else "false"
+    if kind is int:
+        return int.__repr__(value)
+    if kind is float:
+        return _json_float(value)
+    if kind is datetime:
+        return '"' + datetime_to_str(value) + '"'
+    if kind is list or kind is tuple:
+        if not value:
+            return "[]"
+        return "[" + ",".join([_json_any(item, privacy_mode) for item in value]) + "]"
+    if kind is dict:
+        if not value:
+            return "{}"
+        return _json_mapping(value, _json_any, privacy_mode)
+    if is_dataclass(value) and not isinstance(value, type):
+        return _json_plan(kind, privacy_mode).encode(value, privacy_mode)
+    return _dumps(_to_primitive(value, privacy_mode=privacy_mode))
+
+
+def _json_mapping(value: dict[Any, Any], encode_value: JsonEncoder, privacy_mode: bool) -> str:
+    parts = []
+    for key in sorted(value):
+        if type(key) is not str:
+            # json.dumps coerces non-str keys; leave those (rare) mappings to it.
+            return _dumps(_to_primitive(value, privacy_mode=privacy_mode))
+        parts.append(encode_basestring_ascii(key) + ":" + encode_value(value[key], privacy_mode))
+    return "{" + ",".join(parts) + "}"
+
+
+def _json_encoder_for(hint: Any) -> JsonEncoder:
+    encoder = _JSON_ENCODERS.get(hint)
+    if encoder is None:
+        encoder = _compile_json_encoder(hint)
+        _JSON_ENCODERS[hint] = encoder
+    return encoder
+
+
+def _compile_json_encoder(hint: Any) -> JsonEncoder:
+    """Encoder specialized for ``hint``; any other runtime type goes through ``_json_any``."""
+    origin = get_origin(hint)
+    args = get_args(hint)
+
+    if hint is str:
+
+        def encode_str(value: Any, privacy_mode: bool) -> str:
+            if type(value) is str:
+                return encode_basestring_ascii(value)
+            return _json_any(value, privacy_mode)
+
+        return encode_str
+
+    if hint is datetime:
+
+        def encode_datetime(value: Any, privacy_mode: bool) -> str:
+            if type(value) is datetime:
+                return '"' + datetime_to_str(value) + '"'
+            return _json_any(value, privacy_mode)
+
+        return encode_datetime
+
+    if origin in (Union, types.UnionType):
+        options = [option for option in args if option is not type(None)]
+        if len(options) == 1:
+            return _json_encoder_for(options[0])
+        return _json_any
+
+    if origin in (tuple, list):
+        item_encoder = _json_encoder_for(args[0] if args else Any)
+        sequence_type = origin
+
+        def encode_sequence(value: Any, privacy_mode: bool) -> str:
+            if type(value) is sequence_type:
+                if not value:
+                    return "[]"
+                return "[" + ",".join([item_encoder(item, privacy_mode) for item in value]) + "]"
+            return _json_any(value, privacy_mode)
+
+        return encode_sequence
+
+    if origin is dict:
+        value_encoder = _json_encoder_for(args[1] if len(args) > 1 else Any)
+
+        def encode_mapping(value: Any, privacy_mode: bool) -> str:
+            if type(value) is dict:
+                if not value:
+                    return "{}"
+                return _json_mapping(value, value_encoder, privacy_mode)
+            return _json_any(value, privacy_mode)
+
+        return encode_mapping
+
+    if isinstance(hint, type) and is_dataclass(hint):
+
+        def encode_dataclass(value: Any, privacy_mode: bool) -> str:
+            if type(value) is hint:
+                return _json_plan(hint, privacy_mode).encode(value, privacy_mode)
+            return _json_any(value, privacy_mode)
+
+        return encode_dataclass
+
+    return _json_any
@@ -1,38 +1,580 @@
 from __future__ import annotations
 
 import types
-from dataclasses import MISSING, fields, is_dataclass
+from dataclasses import MISSING, FrozenInstanceError, dataclass, field, fields, is_dataclass
 from datetime import datetime
-from typing import Any, TypeVar, Union, get_args, get_origin, get_type_hints
+from itertools import islice, starmap
+from operator import attrgetter
+from random import random
+from sys import intern
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Iterable,
+    Iterator,
+    Mapping,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 from metaspn_schemas.utils.time import datetime_to_str, str_to_datetime
 
 T = TypeVar("T")
 
+Decoder = Callable[[Any], Any]
+Encoder = Callable[[Any, bool], Any]
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Field metadata for low-cardinality string fields (sources, types, versions, statuses):
+# ``from_dict`` and the other decoders intern their values, so a million decoded
+# objects share one ``str`` per distinct value.
+INTERNED: Mapping[str, Any] = types.MappingProxyType({"intern": True})
+_STR_HINTS = (str, Union[str, None], Any)
+
+# Fraction of trusted decodes re-checked against the validating path; see set_trusted_check_rate.
+_trusted_check_rate = 0.0
+
 
 class Serializable:
+    # Empty slots keep slotted schema subclasses free of a per-instance __dict__.
+    __slots__ = ()
+
     def to_dict(self, *, privacy_mode: bool = False) -> dict[str, Any]:
         return dataclass_to_dict(self, privacy_mode=privacy_mode)
 
     @classmethod
-    def from_dict(cls: type[T], data: dict[str, Any]) -> T:
-        return dataclass_from_dict(cls, data)
+    def from_dict(cls: type[T], data: dict[str, Any], *, trusted: bool = False) -> T:
+        return dataclass_from_dict(cls, data, trusted=trusted)
+
+    @classmethod
+    def to_dicts(
+        cls,
+        objs: Iterable[Any],
+        *,
+        privacy_mode: bool = False,
+        as_tuples: bool = False,
+    ) -> list[dict[str, Any]] | tuple[tuple[str, ...], list[tuple[Any, ...]]]:
+        return dataclass_to_dicts(objs, privacy_mode=privacy_mode, as_tuples=as_tuples, cls=cls)
+
+    @classmethod
+    def from_dicts(
+        cls: type[T],
+        rows: Iterable[Mapping[str, Any]],
+        *,
+        lazy: bool = False,
+        chunk_size: int = 1024,
+        trusted: bool = False,
+    ) -> list[T] | Iterator[T]:
+        return dataclass_from_dicts(cls, rows, lazy=lazy, chunk_size=chunk_size, trusted=trusted)
+
+    def to_binary(self, *, privacy_mode: bool = False) -> bytes:
+        from metaspn_schemas.utils.binary import encode_binary
+
+        return encode_binary(self, privacy_mode=privacy_mode)
+
+    @classmethod
+    def from_binary(cls: type[T], data: bytes | bytearray | memoryview) -> T:
+        from metaspn_schemas.utils.binary import decode_binary
+
+        return decode_binary(cls, data)
+
+    def to_json(self, *, privacy_mode: bool = False) -> str:
+        from metaspn_schemas.utils.json_codec import encode_json
+
+        return encode_json(self, privacy_mode=privacy_mode)
+
+    @classmethod
+    def from_json(cls: type[T], text: str | bytes | bytearray) -> T:
+        from metaspn_schemas.utils.json_codec import decode_json
+
+        return decode_json(cls, text)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # On 3.11+ dataclass(slots=True) keeps a __setstate__ defined in the original class body.
+        # 3.10 always overwrites it with a positional one; _install_setstate repairs that.
+        if "__setstate__" not in cls.__dict__:
+            cls.__setstate__ = Serializable.__setstate__  # type: ignore[method-assign]
+
+    def __setstate__(self, state: Any) -> None:
+        _restore_state(self, state)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # (_reconstruct, (cls, *field values)), dropping trailing fields still at their plain default.
+        names, getter, defaults = _pickle_plan(type(self))
+        values = getter(self)
+        size = len(values)
+        while size and values[size - 1] is defaults[size - 1]:
+            size -= 1
+        return (_reconstruct, (type(self), *values[:size]))
+
+
+class LazyDecoded:
+    """Read-only view of a serialized dataclass that decodes fields on first access.
+
+    Subclasses set ``schema`` to the dataclass type and list the fields decoded
+    up front in ``__slots__`` (read back as plain slot attributes), plus
+    ``normalizers`` mirroring the schema's ``__post_init__``. Reading any other
+    field decodes and caches just that field; ``materialize()`` builds the real
+    schema instance. The source mapping must not be mutated while the view is alive.
+    """
+
+    __slots__ = ("_data", "_values", "_instance")
+
+    schema: ClassVar[type]
+    normalizers: ClassVar[Mapping[str, Callable[[Any], Any]]] = {}
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        required, eager = _lazy_plan(type(self))
+        for name in required:
+            if name not in data:
+                raise ValueError(f"Missing required field: {name}")
+        set_attr = object.__setattr__
+        set_attr(self, "_data", data)
+        set_attr(self, "_values", {})
+        set_attr(self, "_instance", None)
+        for name, decode_from, normalize in eager:
+            value = decode_from(data)
+            if normalize is not None and value is not None:
+                value = normalize(value)
+            set_attr(self, name, value)
+
+    @classmethod
+    def from_dict(cls: type[T], data: Mapping[str, Any]) -> T:
+        return cls(data)
+
+    def __getattr__(self, name: str) -> Any:
+        values = object.__getattribute__(self, "_values")
+        if name in values:
+            return values[name]
+        if name.startswith("_") or _codec_for(self.schema).field_plan(name) is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        return self._decode_field(name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyDecoded):
+            other = other.materialize()
+        if type(other) is not self.schema:
+            return NotImplemented
+        return self.materialize() == other
+
+    def __hash__(self) -> int:
+        return hash(self.materialize())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.materialize()!r})"
+
+    def _decode_field(self, name: str) -> Any:
+        value = _codec_for(self.schema).field_plan(name).decode_from(self._data)  # type: ignore[union-attr]
+        normalize = self.normalizers.get(name)
+        if normalize is not None and value is not None:
+            value = normalize(value)
+        self._values[name] = value
+        return value
+
+    def materialize(self) -> Any:
+        """Decode the remaining fields and return the equivalent schema instance (cached)."""
+        if self._instance is None:
+            kwargs = {plan.name: getattr(self, plan.name) for plan in _codec_for(self.schema).fields}
+            object.__setattr__(self, "_instance", self.schema(**kwargs))
+        return self._instance
+
+    def to_dict(self, *, privacy_mode: bool = False) -> dict[str, Any]:
+        return dataclass_to_dict(self.materialize(), privacy_mode=privacy_mode)
+
+
+_LAZY_PLANS: dict[type, tuple[tuple[str, ...], tuple[tuple[str, Decoder, Any], ...]]] = {}
+
+
+def _lazy_plan(view_cls: type[LazyDecoded]) -> tuple[tuple[str, ...], tuple[tuple[str, Decoder, Any], ...]]:
+    plan = _LAZY_PLANS.get(view_cls)
+    if plan is None:
+        codec = _codec_for(view_cls.schema)
+        eager_names = [
+            name
+            for klass in reversed(view_cls.__mro__)
+            for name in getattr(klass, "__slots__", ())
+            if not name.startswith("_")
+        ]
+        unknown = [name for name in eager_names if codec.field_plan(name) is None]
+        if unknown:
+            raise TypeError(f"{view_cls.__name__} slots are not {view_cls.schema.__name__} fields: {unknown}")
+        required = tuple(f.name for f in codec.fields if f.required)
+        eager = tuple(
+            (name, codec.field_plan(name).decode_from, view_cls.normalizers.get(name))  # type: ignore[union-attr]
+            for name in eager_names
+        )
+        plan = (required, eager)
+        _LAZY_PLANS[view_cls] = plan
+    return plan
+
+
+@dataclass(frozen=True)
+class _FieldPlan:
+    name: str
+    decode: Decoder
+    trusted_decode: Decoder
+    encode: Encoder
+    default: Any
+    default_factory: Any
+    omit_in_privacy_mode: bool
+
+    @property
+    def required(self) -> bool:
+        return self.default is MISSING and self.default_factory is MISSING
+
+    def decode_from(self, data: Mapping[str, Any]) -> Any:
+        if self.name in data:
+            return self.decode(data[self.name])
+        if self.default is not MISSING:
+            return self.default
+        if self.default_factory is not MISSING:
+            return self.default_factory()
+        raise ValueError(f"Missing required field: {self.name}")
+
+
+@dataclass(frozen=True)
+class _EncodePlan:
+    """Field order, privacy mask and encoders for one class in one privacy mode."""
+
+    header: tuple[str, ...]
+    encoders: tuple[Encoder, ...]
+    getter: Callable[[Any], tuple[Any, ...]]
+
+    @classmethod
+    def build(cls, plans: Iterable[_FieldPlan]) -> _EncodePlan:
+        plans = tuple(plans)
+        header = tuple(plan.name for plan in plans)
+        if len(header) == 1:
+            name = header[0]
+            getter: Callable[[Any], tuple[Any, ...]] = lambda obj: (getattr(obj, name),)
+        elif header:
+            getter = attrgetter(*header)
+        else:
+            getter = lambda obj: ()
+        return cls(header=header, encoders=tuple(plan.encode for plan in plans), getter=getter)
+
+    def encode_values(self, obj: Any, privacy_mode: bool) -> list[Any]:
+        return [encode(value, privacy_mode) for encode, value in zip(self.encoders, self.getter(obj))]
+
+
+@dataclass(frozen=True)
+class _ClassCodec:
+    """Encode/decode plan for one dataclass type, compiled once from its fields and type hints."""
+
+    cls: type
+    fields: tuple[_FieldPlan, ...]
+    positional: bool
+    _decode_steps: tuple[tuple[str, Decoder, Any, Any], ...] = field(init=False, repr=False)
+    _trusted_steps: tuple[tuple[str, Decoder, Any, Any], ...] = field(init=False, repr=False)
+    _plans_by_name: dict[str, _FieldPlan] = field(init=False, repr=False)
+    _full_plan: _EncodePlan = field(init=False, repr=False)
+    _private_plan: _EncodePlan = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_decode_steps",
+            tuple((f.name, f.decode, f.default, f.default_factory) for f in self.fields),
+        )
+        object.__setattr__(
+            self,
+            "_trusted_steps",
+            tuple((f.name, f.trusted_decode, f.default, f.default_factory) for f in self.fields),
+        )
+        object.__setattr__(self, "_plans_by_name", {f.name: f for f in self.fields})
+        object.__setattr__(self, "_full_plan", _EncodePlan.build(self.fields))
+        object.__setattr__(
+            self,
+            "_private_plan",
+            _EncodePlan.build(f for f in self.fields if not f.omit_in_privacy_mode),
+        )
+
+    def field_plan(self, name: str) -> _FieldPlan | None:
+        return self._plans_by_name.get(name)
+
+    def encode_plan(self, privacy_mode: bool) -> _EncodePlan:
+        return self._private_plan if privacy_mode else self._full_plan
+
+    def encode(self, obj: Any, privacy_mode: bool) -> dict[str, Any]:
+        plan = self._private_plan if privacy_mode else self._full_plan
+        return dict(zip(plan.header, plan.encode_values(obj, privacy_mode)))
+
+    def decode(self, data: dict[str, Any]) -> Any:
+        kwargs: dict[str, Any] = {}
+        for name, decode, default, default_factory in self._decode_steps:
+            if name in data:
+                kwargs[name] = decode(data[name])
+            elif default is not MISSING:
+                kwargs[name] = default
+            elif default_factory is not MISSING:
+                kwargs[name] = default_factory()
+            else:
+                raise ValueError(f"Missing required field: {name}")
+        return self.cls(**kwargs)
+
+    def decode_many(self, rows: list[Mapping[str, Any]]) -> list[Any]:
+        """Decode ``rows`` column by column, running each field decoder once over the batch.
+
+        Unlike a loop over ``decode``, a bad batch raises for the first failing
+        field rather than the first failing row.
+        """
+        if not rows:
+            return []
+        columns = [self._decode_column(rows, *step) for step in self._decode_steps]
+        if self.positional:
+            return list(starmap(self.cls, zip(*columns)))
+        names = [step[0] for step in self._decode_steps]
+        return [self.cls(**dict(zip(names, values))) for values in zip(*columns)]
+
+    def decode_trusted(self, data: Mapping[str, Any]) -> Any:
+        """Build an instance straight from already-normalized ``data``, bypassing ``__init__``.
+
+        Only what JSON cannot carry is rebuilt (datetimes, tuples, nested
+        dataclasses); scalar casts and ``__post_init__`` normalization are skipped.
+        """
+        obj = object.__new__(self.cls)
+        set_attr = object.__setattr__
+        for name, decode, default, default_factory in self._trusted_steps:
+            if name in data:
+                set_attr(obj, name, decode(data[name]))
+            elif default is not MISSING:
+                set_attr(obj, name, default)
+            elif default_factory is not MISSING:
+                set_attr(obj, name, default_factory())
+            else:
+                raise ValueError(f"Missing required field: {name}")
+        return obj
+
+    def decode_many_trusted(self, rows: list[Mapping[str, Any]]) -> list[Any]:
+        """Column-wise ``decode_trusted`` over a batch."""
+        if not rows:
+            return []
+        columns = [self._decode_column(rows, *step) for step in self._trusted_steps]
+        names = [step[0] for step in self._trusted_steps]
+        new = object.__new__
+        set_attr = object.__setattr__
+        cls = self.cls
+        decoded = []
+        for values in zip(*columns):
+            obj = new(cls)
+            for name, value in zip(names, values):
+                set_attr(obj, name, value)
+            decoded.append(obj)
+        return decoded
+
+    @staticmethod
+    def _decode_column(
+        rows: list[Mapping[str, Any]],
+        name: str,
+        decode: Decoder,
+        default: Any,
+        default_factory: Any,
+    ) -> list[Any]:
+        try:
+            raw = [row[name] for row in rows]
+        except KeyError:
+            pass
+        else:
+            return raw if decode is _identity else list(map(decode, raw))
+
+        column = []
+        for row in rows:
+            if name in row:
+                column.append(decode(row[name]))
+            elif default is not MISSING:
+                column.append(default)
+            elif default_factory is not MISSING:
+                column.append(default_factory())
+            else:
+                raise ValueError(f"Missing required field: {name}")
+        return column
+
+
+_CODECS: dict[type, _ClassCodec] = {}
+_DECODERS: dict[Any, Decoder] = {}
+_TRUSTED_DECODERS: dict[Any, Decoder] = {}
+_UNION_ROUTE_CACHE_SIZE = 64
+_ENCODERS: dict[Any, Encoder] = {}
+
+
+def _codec_for(cls: type) -> _ClassCodec:
+    codec = _CODECS.get(cls)
+    if codec is None:
+        codec = _compile_codec(cls)
+        _CODECS[cls] = codec
+    return codec
+
+
+def _compile_codec(cls: type) -> _ClassCodec:
+    hints = get_type_hints(cls)
+    plans = []
+    positional = True
+    for f in fields(cls):
+        positional = positional and f.init and not f.kw_only
+        hint = hints.get(f.name, Any)
+        decode = _decoder_for(hint)
+        trusted_decode = _trusted_decoder_for(hint)
+        if f.metadata.get("intern"):
+            decode = _interning(decode, hint)
+            trusted_decode = _interning(trusted_decode, hint)
+        plans.append(
+            _FieldPlan(
+                name=f.name,
+                decode=decode,
+                trusted_decode=trusted_decode,
+                encode=_encoder_for(hint),
+                default=f.default,
+                default_factory=f.default_factory,  # type: ignore[misc]
+                omit_in_privacy_mode=bool(f.metadata.get("omit_in_privacy_mode")),
+            )
+        )
+    return _ClassCodec(cls=cls, fields=tuple(plans), positional=positional)
+
+
+_PICKLE_PLANS: dict[type, tuple[tuple[str, ...], Callable[[Any], tuple[Any, ...]], tuple[Any, ...]]] = {}
+
+
+def _pickle_plan(cls: type) -> tuple[tuple[str, ...], Callable[[Any], tuple[Any, ...]], tuple[Any, ...]]:
+    plan = _PICKLE_PLANS.get(cls)
+    if plan is None:
+        codec = _codec_for(cls)
+        full = codec.encode_plan(False)
+        plan = (full.header, full.getter, tuple(f.default for f in codec.fields))
+        _PICKLE_PLANS[cls] = plan
+    return plan
+
+
+def _reconstruct(cls: type[T], *values: Any) -> T:
+    """Unpickle a ``Serializable`` from ``__reduce__`` values without running ``__init__``.
+
+    The values were already normalized by ``__post_init__`` when the object was
+    built, so they are set directly; omitted trailing fields get their defaults.
+    """
+    names, _, defaults = _pickle_plan(cls)
+    if len(values) > len(names):
+        raise TypeError(f"{cls.__name__} takes {len(names)} pickled fields, got {len(values)}")
+    obj = object.__new__(cls)
+    set_attr = object.__setattr__
+    for name, value in zip(names, values + defaults[len(values) :]):
+        set_attr(obj, name, value)
+    return obj
+
+
+def _restore_state(obj: Any, state: Any) -> None:
+    """``__setstate__`` for pickles not written by ``__reduce__``.
+
+    0.9.0 schemas were plain (non-slotted) dataclasses, pickled with their
+    ``__dict__`` as state: fields are set by name, with defaults for fields added
+    since. The slotted dataclass default state is a list of values in field order.
+    """
+    codec = _codec_for(type(obj))
+    set_attr = object.__setattr__
+    if isinstance(state, dict):
+        for plan in codec.fields:
+            if plan.name in state:
+                set_attr(obj, plan.name, state[plan.name])
+            elif plan.default is not MISSING:
+                set_attr(obj, plan.name, plan.default)
+            elif plan.default_factory is not MISSING:
+                set_attr(obj, plan.name, plan.default_factory())
+            else:
+                raise TypeError(f"cannot unpickle {type(obj).__name__}: state has no field {plan.name!r}")
+        return
+    if not isinstance(state, (list, tuple)) or len(state) != len(codec.fields):
+        raise TypeError(f"cannot unpickle {type(obj).__name__} from state of type {type(state).__name__}")
+    for plan, value in zip(codec.fields, state):
+        set_attr(obj, plan.name, value)
+
+
+def _install_setstate(namespace: Mapping[str, Any]) -> None:
+    """Point every Serializable dataclass defined in *namespace* at ``Serializable.__setstate__``.
+
+    Called at the end of each schema module: on Python 3.10 ``dataclass(slots=True)``
+    replaces the one ``__init_subclass__`` set with its own positional ``__setstate__``.
+    Classes that define their own ``__setstate__`` are left alone.
+    """
+    module = namespace["__name__"]
+    for value in list(namespace.values()):
+        if not (isinstance(value, type) and issubclass(value, Serializable) and value.__module__ == module):
+            continue
+        current = value.__dict__.get("__setstate__")
+        if current is None or getattr(current, "__name__", "") == "_dataclass_setstate":
+            value.__setstate__ = Serializable.__setstate__  # type: ignore[method-assign]
+
+
+def _interning(decode: Decoder, hint: Any) -> Decoder:
+    if hint in _STR_HINTS:
+        # These decoders return str input unchanged, so it can be interned directly.
+        def decode_interned_str(value: Any) -> Any:
+            if type(value) is str:
+                return intern(value)
+            value = decode(value)
+            return intern(value) if type(value) is str else value
+
+        return decode_interned_str
+
+    def decode_interned(value: Any) -> Any:
+        value = decode(value)
+        return intern(value) if type(value) is str else value
+
+    return decode_interned
 
 
 def dataclass_to_dict(obj: Any, *, privacy_mode: bool = False) -> dict[str, Any]:
-    if not is_dataclass(obj):
+    if not is_dataclass(obj) or isinstance(obj, type):
         raise TypeError("dataclass_to_dict expects a dataclass instance")
+    return _codec_for(type(obj)).encode(obj, privacy_mode)
 
-    output: dict[str, Any] = {}
-    for f in fields(obj):
-        if privacy_mode and f.metadata.get("omit_in_privacy_mode"):
-            continue
-        value = getattr(obj, f.name)
-        output[f.name] = _to_primitive(value, privacy_mode=privacy_mode)
-    return output
+
+def dataclass_to_dicts(
+    objs: Iterable[Any],
+    *,
+    privacy_mode: bool = False,
+    as_tuples: bool = False,
+    cls: type | None = None,
+) -> list[dict[str, Any]] | tuple[tuple[str, ...], list[tuple[Any, ...]]]:
+    """Encode a batch of instances of one dataclass type.
+
+    The field order and privacy mask are resolved once for the batch. With
+    ``as_tuples=True`` returns ``(header, rows)`` where each row is a tuple of
+    encoded values in ``header`` order, instead of one dict per object.
+    ``cls`` defaults to the type of the first object; every object must be
+    exactly that type.
+    """
+    objs = objs if isinstance(objs, list) else list(objs)
+    if cls is None:
+        if not objs:
+            raise TypeError("dataclass_to_dicts needs cls to encode an empty batch")
+        cls = type(objs[0])
+    if not is_dataclass(cls):
+        raise TypeError("dataclass_to_dicts expects dataclass instances")
+
+    plan = _codec_for(cls).encode_plan(privacy_mode)
+    for obj in objs:
+        if type(obj) is not cls:
+            raise TypeError(f"dataclass_to_dicts expects {cls.__name__} instances, got {type(obj).__name__}")
+
+    if as_tuples:
+        return (plan.header, [tuple(plan.encode_values(obj, privacy_mode)) for obj in objs])
+    header = plan.header
+    return [dict(zip(header, plan.encode_values(obj, privacy_mode))) for obj in objs]
 
 
 def _to_primitive(value: Any, *, privacy_mode: bool) -> Any:
+    if type(value) in _SCALAR_TYPES:
+        return value
     if is_dataclass(value):
         return dataclass_to_dict(value, privacy_mode=privacy_mode)
     if isinstance(value, datetime):
@@ -46,85 +588,393 @@ def _to_primitive(value: Any, *, privacy_mode: bool) -> Any:
     return value
 
 
-def dataclass_from_dict(cls: type[T], data: dict[str, Any]) -> T:
-    if not is_dataclass(cls):
-        raise TypeError("dataclass_from_dict expects a dataclass type")
+def _encode_any(value: Any, privacy_mode: bool) -> Any:
+    if type(value) in _SCALAR_TYPES:
+        return value
+    return _to_primitive(value, privacy_mode=privacy_mode)
 
-    hints = get_type_hints(cls)
-    kwargs: dict[str, Any] = {}
 
-    for f in fields(cls):
-        hint = hints.get(f.name, Any)
-        if f.name in data:
-            kwargs[f.name] = _coerce_value(hint, data[f.name])
-            continue
+def _encoder_for(hint: Any) -> Encoder:
+    encoder = _ENCODERS.get(hint)
+    if encoder is None:
+        encoder = _compile_encoder(hint)
+        _ENCODERS[hint] = encoder
+    return encoder
 
-        if f.default is not MISSING:
-            kwargs[f.name] = f.default
-            continue
 
-        if f.default_factory is not MISSING:  # type: ignore[attr-defined]
-            kwargs[f.name] = f.default_factory()  # type: ignore[misc]
-            continue
+def _compile_encoder(hint: Any) -> Encoder:
+    """Build an encoder specialized for ``hint``.
+
+    Every specialized encoder checks the exact runtime type it expects and
+    otherwise defers to ``_to_primitive``, so output never depends on the hint.
+    """
+    origin = get_origin(hint)
+    args = get_args(hint)
+
+    if hint is datetime:
+
+        def encode_datetime(value: Any, privacy_mode: bool) -> Any:
+            if type(value) is datetime:
+                return datetime_to_str(value)
+            return _encode_any(value, privacy_mode)
+
+        return encode_datetime
+
+    if origin in (Union, types.UnionType):
+        options = [option for option in args if option is not type(None)]
+        if len(options) == 1:
+            return _encoder_for(options[0])
+        return _encode_any
+
+    if origin in (tuple, list):
+        item_encoder = _encoder_for(args[0] if args else Any)
+        sequence_type = origin
+
+        def encode_sequence(value: Any, privacy_mode: bool) -> Any:
+            if type(value) is sequence_type:
+                return [item_encoder(item, privacy_mode) for item in value]
+            return _encode_any(value, privacy_mode)
+
+        return encode_sequence
+
+    if origin is dict:
+        value_encoder = _encoder_for(args[1] if len(args) > 1 else Any)
+
+        def encode_mapping(value: Any, privacy_mode: bool) -> Any:
+            if type(value) is dict:
+                if not value:
+                    return {}
+                return {k: value_encoder(v, privacy_mode) for k, v in sorted(value.items())}
+            return _encode_any(value, privacy_mode)
+
+        return encode_mapping
+
+    if isinstance(hint, type) and is_dataclass(hint):
 
-        raise ValueError(f"Missing required field: {f.name}")
+        def encode_dataclass(value: Any, privacy_mode: bool) -> Any:
+            if type(value) is hint:
+                return _codec_for(hint).encode(value, privacy_mode)
+            return _encode_any(value, privacy_mode)
 
-    return cls(**kwargs)
+        return encode_dataclass
+
+    return _encode_any
+
+
+def dataclass_from_dict(cls: type[T], data: dict[str, Any], *, trusted: bool = False) -> T:
+    """Decode ``data`` into ``cls``, coercing and normalizing every field.
+
+    ``trusted=True`` is for payloads that were already validated and normalized
+    upstream (e.g. produced by ``to_dict``): the instance is built directly,
+    without ``__init__``, ``__post_init__`` or scalar casts. Data that is not in
+    canonical form yields an instance that may differ from the validated decode.
+    """
+    codec = _CODECS.get(cls)
+    if codec is None:
+        if not is_dataclass(cls):
+            raise TypeError("dataclass_from_dict expects a dataclass type")
+        codec = _codec_for(cls)
+    if not trusted:
+        return codec.decode(data)
+    obj = codec.decode_trusted(data)
+    if _trusted_check_rate and random() < _trusted_check_rate:
+        _check_trusted(codec, data, obj)
+    return obj
+
+
+def dataclass_from_dicts(
+    cls: type[T],
+    rows: Iterable[Mapping[str, Any]],
+    *,
+    lazy: bool = False,
+    chunk_size: int = 1024,
+    trusted: bool = False,
+) -> list[T] | Iterator[T]:
+    """Decode many rows of ``cls`` with one field plan.
+
+    Returns a list by default. With ``lazy=True`` returns a generator that
+    decodes ``chunk_size`` rows at a time, so ``rows`` may be an unbounded stream.
+    ``trusted`` is as for ``dataclass_from_dict``.
+    """
+    codec = _CODECS.get(cls)
+    if codec is None:
+        if not is_dataclass(cls):
+            raise TypeError("dataclass_from_dicts expects a dataclass type")
+        codec = _codec_for(cls)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    if lazy:
+        return _iter_decode_chunks(codec, iter(rows), chunk_size, trusted)
+    return _decode_batch(codec, rows if isinstance(rows, list) else list(rows), trusted)
+
+
+def _iter_decode_chunks(
+    codec: _ClassCodec,
+    rows: Iterator[Mapping[str, Any]],
+    chunk_size: int,
+    trusted: bool = False,
+) -> Iterator[Any]:
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield from _decode_batch(codec, chunk, trusted)
+
+
+def _decode_batch(codec: _ClassCodec, rows: list[Mapping[str, Any]], trusted: bool) -> list[Any]:
+    if not trusted:
+        return codec.decode_many(rows)
+    decoded = codec.decode_many_trusted(rows)
+    rate = _trusted_check_rate
+    if rate:
+        for row, obj in zip(rows, decoded):
+            if random() < rate:
+                _check_trusted(codec, row, obj)
+    return decoded
+
+
+def set_trusted_check_rate(rate: float) -> None:
+    """Re-decode this fraction of ``trusted=True`` decodes on the validating path and compare.
+
+    A debugging aid for services that opt into trusted decoding: a sampled
+    payload whose trusted result differs from (or fails) the validated decode
+    raises ``AssertionError``. ``0`` (the default) disables checking.
+    """
+    global _trusted_check_rate
+    if not 0 <= rate <= 1:
+        raise ValueError("rate must be between 0 and 1")
+    _trusted_check_rate = float(rate)
+
+
+def _check_trusted(codec: _ClassCodec, data: Mapping[str, Any], obj: Any) -> None:
+    name = codec.cls.__name__
+    try:
+        expected = codec.decode(data)  # type: ignore[arg-type]
+    except Exception as err:  # noqa: BLE001
+        raise AssertionError(f"trusted {name} payload fails validated decode: {err}") from err
+    if expected != obj:
+        raise AssertionError(f"trusted decode of {name} differs from validated decode: {obj!r} != {expected!r}")
 
 
 def _coerce_value(hint: Any, value: Any) -> Any:
+    return _decoder_for(hint)(value)
+
+
+def _decoder_for(hint: Any) -> Decoder:
+    decoder = _DECODERS.get(hint)
+    if decoder is None:
+        decoder = _compile_decoder(hint)
+        _DECODERS[hint] = decoder
+    return decoder
+
+
+def _trusted_decoder_for(hint: Any) -> Decoder:
+    decoder = _TRUSTED_DECODERS.get(hint)
+    if decoder is None:
+        decoder = _compile_trusted_decoder(hint)
+        _TRUSTED_DECODERS[hint] = decoder
+    return decoder
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _decode_datetime(value: Any) -> Any:
     if value is None:
         return None
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        return str_to_datetime(value)
+    raise TypeError(f"Cannot parse datetime from {type(value)!r}")
+
+
+def _decode_first_option(option_decoders: tuple[Decoder, ...], value: Any) -> Any:
+    last_error: Exception | None = None
+    for decode in option_decoders:
+        try:
+            return decode(value)
+        except Exception as err:  # noqa: BLE001
+            last_error = err
+    if last_error is not None:
+        raise last_error
+    return value
+
+
+def _union_route(
+    options: tuple[Any, ...],
+    option_decoders: tuple[Decoder, ...],
+    kind: type,
+) -> tuple[tuple[Decoder, ...], bool]:
+    candidates = []
+    for option, decode in zip(options, option_decoders):
+        accepts = _option_accepts(option, decode, kind)
+        if accepts is False:
+            continue
+        candidates.append(decode)
+        if accepts:
+            return tuple(candidates), True
+    return tuple(candidates), False
+
+
+def _option_accepts(option: Any, decode: Decoder, kind: type) -> bool | None:
+    """Whether ``decode`` (compiled for ``option``) succeeds on any ``kind`` value: True, False, or None for "depends"."""
+    if decode is _identity:
+        return True
+    if option is datetime:
+        if issubclass(kind, datetime):
+            return True
+        return None if issubclass(kind, str) else False
+    if isinstance(option, type) and is_dataclass(option):
+        # Non-dict values pass through unchanged; only dicts are decoded (and can fail).
+        return None if issubclass(kind, dict) and not issubclass(kind, option) else True
+    if option in (str, int, float, bool):
+        if kind is option:
+            return True
+        if option in (int, float) and kind in (dict, list, tuple):
+            return False
+        return None
+    origin = get_origin(option)
+    if origin in (tuple, list):
+        return False if kind in (int, float, bool) else None
+    if origin is dict:
+        return False if kind in (str, int, float, bool, list, tuple) else None
+    return None
 
-    origin = get_origin(hint)
-    args = get_args(hint)
 
+def _compile_decoder(hint: Any) -> Decoder:
     if hint is Any:
-        return value
+        return _identity
 
     if hint is datetime:
-        if isinstance(value, datetime):
-            return value
-        if isinstance(value, str):
-            return str_to_datetime(value)
-        raise TypeError(f"Cannot parse datetime from {type(value)!r}")
+        return _decode_datetime
+
+    origin = get_origin(hint)
+    args = get_args(hint)
 
     if origin in (Union, types.UnionType):
-        last_error: Exception | None = None
-        for option in args:
-            if option is type(None):
-                continue
-            try:
-                return _coerce_value(option, value)
-            except Exception as err:  # noqa: BLE001
-                last_error = err
-        if last_error is not None:
-            raise last_error
-        return value
+        options = tuple(option for option in args if option is not type(None))
+        option_decoders = tuple(_decoder_for(option) for option in options)
+        if len(option_decoders) == 1:
+            decode = option_decoders[0]
+
+            def decode_optional(value: Any) -> Any:
+                return None if value is None else decode(value)
+
+            return decode_optional
+
+        # Per runtime type: the options that could accept such a value, in order,
+        # up to the first that surely does. Options that always fail are skipped.
+        routes: dict[type, tuple[tuple[Decoder, ...], bool]] = {}
+
+        def decode_union(value: Any) -> Any:
+            if value is None:
+                return None
+            kind = type(value)
+            route = routes.get(kind)
+            if route is None:
+                route = _union_route(options, option_decoders, kind)
+                if len(routes) < _UNION_ROUTE_CACHE_SIZE:
+                    routes[kind] = route
+            candidates, certain = route
+            if certain and len(candidates) == 1:
+                return candidates[0](value)
+            for decode in candidates:
+                try:
+                    return decode(value)
+                except Exception:  # noqa: BLE001
+                    pass
+            # Nothing accepts the value: replay every option for the usual error.
+            return _decode_first_option(option_decoders, value)
+
+        return decode_union
 
     if origin is tuple:
-        item_type = args[0] if args else Any
-        return tuple(_coerce_value(item_type, item) for item in value)
+        item_decoder = _decoder_for(args[0] if args else Any)
+        if item_decoder is _identity:
+            return lambda value: None if value is None else tuple(value)
+        return lambda value: None if value is None else tuple([item_decoder(item) for item in value])
 
     if origin is list:
-        item_type = args[0] if args else Any
-        return [_coerce_value(item_type, item) for item in value]
+        item_decoder = _decoder_for(args[0] if args else Any)
+        return lambda value: None if value is None else [item_decoder(item) for item in value]
 
     if origin is dict:
-        key_type = args[0] if len(args) > 0 else Any
-        value_type = args[1] if len(args) > 1 else Any
-        return {
-            _coerce_value(key_type, k): _coerce_value(value_type, v)
-            for k, v in value.items()
-        }
-
-    if is_dataclass(hint):
-        if isinstance(value, hint):
+        key_decoder = _decoder_for(args[0] if len(args) > 0 else Any)
+        value_decoder = _decoder_for(args[1] if len(args) > 1 else Any)
+
+        def decode_mapping(value: Any) -> Any:
+            if value is None:
+                return None
+            return {key_decoder(k): value_decoder(v) for k, v in value.items()}
+
+        return decode_mapping
+
+    if isinstance(hint, type) and is_dataclass(hint):
+
+        def decode_dataclass(value: Any) -> Any:
+            if value is None or isinstance(value, hint):
+                return value
+            if isinstance(value, dict):
+                return _codec_for(hint).decode(value)
             return value
-        if isinstance(value, dict):
-            return dataclass_from_dict(hint, value)
+
+        return decode_dataclass
 
     if hint in (str, int, float, bool):
-        return hint(value)
+        cast = hint
 
-    return value
+        def decode_scalar(value: Any) -> Any:
+            if value is None or type(value) is cast:
+                return value
+            return cast(value)
+
+        return decode_scalar
+
+    return _identity
+
+
+def _compile_trusted_decoder(hint: Any) -> Decoder:
+    """Decoder for canonical ``to_dict`` output: rebuilds only what JSON cannot carry."""
+    if hint is datetime:
+        return _decode_datetime
+
+    origin = get_origin(hint)
+    args = get_args(hint)
+
+    if origin in (Union, types.UnionType):
+        options = [option for option in args if option is not type(None)]
+        if len(options) != 1:
+            # Which option a value belongs to needs the validating decoder.
+            return _decoder_for(hint)
+        return _trusted_decoder_for(options[0])
+
+    if origin is tuple:
+        item_decoder = _trusted_decoder_for(args[0] if args else Any)
+        if item_decoder is _identity:
+            return lambda value: None if value is None else tuple(value)
+        return lambda value: None if value is None else tuple([item_decoder(item) for item in value])
+
+    if origin is list:
+        item_decoder = _trusted_decoder_for(args[0] if args else Any)
+        if item_decoder is _identity:
+            return _identity
+        return lambda value: None if value is None else [item_decoder(item) for item in value]
+
+    if origin is dict:
+        value_decoder = _trusted_decoder_for(args[1] if len(args) > 1 else Any)
+        if value_decoder is _identity:
+            return _identity
+        return lambda value: None if value is None else {k: value_decoder(v) for k, v in value.items()}
+
+    if isinstance(hint, type) and is_dataclass(hint):
+
+        def decode_dataclass(value: Any) -> Any:
+            if type(value) is dict:
+                return _codec_for(hint).decode_trusted(value)
+            return value
+
+        return decode_dataclass
+
+    return _identity
@@ -1,6 +1,14 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Callable
+
+UTC = timezone.utc
+
+# Repeated timestamps (shared window_start/window_end, replayed batches) are
+# parsed/formatted once per process while they stay in these LRU caches.
+TIMESTAMP_CACHE_SIZE = 4096
 
 
 def utc_now() -> datetime:
@@ -14,11 +22,54 @@ def ensure_utc(value: datetime) -> datetime:
 
 
 def datetime_to_str(value: datetime) -> str:
+    if type(value) is datetime and value.tzinfo is UTC:
+        return _format_utc(value)
+    return _format_general(value)
+
+
+def str_to_datetime(value: str) -> datetime:
+    return _parse(value)
+
+
+def set_timestamp_cache_size(maxsize: int) -> None:
+    """Resize the timestamp parse/format caches; ``0`` disables caching."""
+    global _format_utc, _parse
+    if maxsize < 0:
+        raise ValueError("maxsize must be >= 0")
+    if maxsize:
+        _format_utc = lru_cache(maxsize=maxsize)(_format_utc_uncached)
+        _parse = lru_cache(maxsize=maxsize, typed=True)(_parse_uncached)
+    else:
+        _format_utc = _format_utc_uncached
+        _parse = _parse_uncached
+
+
+def clear_timestamp_caches() -> None:
+    for cached in (_format_utc, _parse):
+        cache_clear = getattr(cached, "cache_clear", None)
+        if cache_clear is not None:
+            cache_clear()
+
+
+def _format_general(value: datetime) -> str:
     utc_value = ensure_utc(value)
     return utc_value.isoformat().replace("+00:00", "Z")
 
 
-def str_to_datetime(value: str) -> datetime:
-    text = value[:-1] + "+00:00" if value.endswith("Z") else value
-    parsed = datetime.fromisoformat(text)
-    return ensure_utc(parsed)
+def _format_utc_uncached(value: datetime) -> str:
+    # isoformat() of a datetime whose tzinfo is timezone.utc always ends in "+00:00".
+    return value.isoformat()[:-6] + "Z"
+
+
+def _parse_uncached(value: str) -> datetime:
+    if value[-1:] == "Z":
+        # Canonical "YYYY-MM-DDTHH:MM:SS[.ffffff]Z": the offset we append is the
+        # only one the string can carry, so the result is already UTC and the
+        # astimezone() round trip in ensure_utc is skipped.
+        return datetime.fromisoformat(value[:-1] + "+00:00")
+    return ensure_utc(datetime.fromisoformat(value))
+
+
+_format_utc: Callable[[datetime], str] = _format_utc_uncached
+_parse: Callable[[str], datetime] = _parse_uncached
+set_timestamp_cache_size(TIMESTAMP_CACHE_SIZE)
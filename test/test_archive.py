@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from metaspn_schemas import EntityRef, SignalArchive, SignalEnvelope
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _signal(index: int, minutes: int | None = None) -> SignalEnvelope:
+    return SignalEnvelope(
+        signal_id=f"s_{index}",
+        timestamp=NOW + timedelta(minutes=index if minutes is None else minutes),
+        source="ingest",
+        payload_type="Custom",
+        payload={"index": index},
+        entity_refs=(EntityRef(ref_type="entity_id", value=f"ent_{index}"),),
+    )
+
+
+def test_archive_lookup_and_range_scan(tmp_path: Path) -> None:
+    path = tmp_path / "signals.arc"
+    signals = [_signal(index) for index in range(20)]
+    with SignalArchive(path, writable=True) as archive:
+        assert archive.extend(signals[:10]) == 10
+        # Reads see appends made through the same handle.
+        assert archive["s_3"] == signals[3]
+        archive.extend(signals[10:])
+        assert archive.get("s_15") == signals[15]
+
+    with SignalArchive(path) as archive:
+        assert len(archive) == 20
+        assert "s_7" in archive and "s_99" not in archive
+        assert archive.get("s_99") is None
+        with pytest.raises(KeyError):
+            archive["s_99"]
+        assert list(archive) == signals
+        window = list(archive.scan(NOW + timedelta(minutes=5), NOW + timedelta(minutes=8)))
+        assert window == signals[5:8]
+        assert archive.ids_between(start=NOW + timedelta(minutes=18)) == ["s_18", "s_19"]
+        with pytest.raises(ValueError, match="read-only"):
+            archive.append(_signal(99))
+
+
+def test_archive_range_scan_with_out_of_order_appends(tmp_path: Path) -> None:
+    path = tmp_path / "signals.arc"
+    signals = [_signal(0, 30), _signal(1, 10), _signal(2, 20), _signal(3, 10)]
+    with SignalArchive(path, writable=True) as archive:
+        archive.extend(signals)
+        with pytest.raises(ValueError, match="already archived"):
+            archive.append(signals[0])
+
+        assert archive.ids_between() == ["s_1", "s_3", "s_2", "s_0"]
+        assert archive.ids_between(NOW + timedelta(minutes=10), NOW + timedelta(minutes=30)) == ["s_1", "s_3", "s_2"]
+
+
+def test_archive_recovers_from_lagging_index_and_torn_record(tmp_path: Path) -> None:
+    path = tmp_path / "signals.arc"
+    with SignalArchive(path, writable=True) as archive:
+        archive.extend(_signal(index) for index in range(5))
+    index_path = Path(archive.index_path)
+    full_index = index_path.read_bytes()
+
+    # Lose the last two index entries and half of a sixth data record.
+    entry_sizes = [len(_signal(index).signal_id) + 18 for index in range(5)]
+    index_path.write_bytes(full_index[: len(full_index) - sum(entry_sizes[3:])])
+    with path.open("ab") as fp:
+        fp.write(b"\x40\x00\x00\x00partial")
+
+    with SignalArchive(path) as archive:
+        assert [signal.signal_id for signal in archive] == [f"s_{index}" for index in range(5)]
+
+    with SignalArchive(path, writable=True) as archive:
+        assert len(archive) == 5
+        archive.append(_signal(5))
+    assert index_path.read_bytes()[: len(full_index)] == full_index
+    with SignalArchive(path) as archive:
+        assert archive["s_5"] == _signal(5)
+
+
+def test_archive_recovers_from_index_ahead_of_data(tmp_path: Path) -> None:
+    path = tmp_path / "signals.arc"
+    with SignalArchive(path, writable=True) as archive:
+        archive.extend(_signal(index) for index in range(5))
+    data = path.read_bytes()
+
+    # The index reached disk but the data of the last record was only partly written.
+    record_size = len(_signal(4).to_binary()) + 4
+    path.write_bytes(data[: len(data) - record_size // 2])
+
+    with SignalArchive(path) as archive:
+        assert [signal.signal_id for signal in archive] == [f"s_{index}" for index in range(4)]
+        assert archive.get("s_4") is None
+
+    with SignalArchive(path, writable=True) as archive:
+        assert len(archive) == 4
+        archive.append(_signal(4))
+    assert path.read_bytes() == data
+    with SignalArchive(path) as archive:
+        assert archive["s_4"] == _signal(4)
+
+
+def test_archive_rejects_foreign_files(tmp_path: Path) -> None:
+    path = tmp_path / "not_an_archive"
+    path.write_bytes(b"hello world")
+    with pytest.raises(ValueError, match="not a signal archive"):
+        SignalArchive(path)
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from metaspn_schemas import (
+    AttentionScoreUpdate,
+    CalibrationRecord,
+    CreatorBehaviorCorrelation,
+    EmissionEnvelope,
+    EntityRef,
+    FailureTaxonomyRecord,
+    FounderStakeView,
+    GameAccountView,
+    GateTransitionAttempt,
+    OutcomeWindowEvaluation,
+    PlayerAccountView,
+    PromiseEvaluated,
+    PromisePredictiveAccuracy,
+    PromiseRegistered,
+    RewardClaim,
+    RewardProjection,
+    SeasonAccountView,
+    SignalEnvelope,
+    StakeAccountView,
+    StateMachineConfig,
+    StateTransitionRule,
+    TokenHealthScoreCard,
+    TokenOutcomeObserved,
+    TokenOutcomeWindow,
+    TokenSignalSeen,
+)
+from metaspn_schemas.utils.serde import dataclass_from_dicts, dataclass_to_dicts
+
+NOW = datetime(2026, 2, 7, 16, 0, tzinfo=timezone.utc)
+
+INSTANCES = [
+    StateTransitionRule("seen", "queued", "route", guard="has_email"),
+    StateMachineConfig(
+        "cfg_1",
+        "default",
+        "seen",
+        ("queued", "seen"),
+        (StateTransitionRule("seen", "queued", "route"),),
+        terminal_states=("queued",),
+        metadata={"owner": "growth"},
+    ),
+    GateTransitionAttempt("att_1", "gate", "ent_1", "seen", "queued", NOW, True, caused_by=("s_1",)),
+    OutcomeWindowEvaluation("ow_1", "ent_1", NOW, NOW, NOW, "reply", True, metrics={"lift": 0.1}),
+    CalibrationRecord("cal_1", "gate-calib-v1", NOW, 1000, 0.63, precision=0.8),
+    FailureTaxonomyRecord("fail_1", "delivery", "EMAIL_BOUNCE", NOW, "high", tags=("smtp", "retry")),
+    SeasonAccountView(1, "auth_1", "mint_1", True, NOW, ended_at=NOW, reward_pool_total=10),
+    GameAccountView(1, 101, 7200),
+    StakeAccountView("player_1", 1, 101, 200, True),
+    PlayerAccountView("player_1", 1, 800, 200, 0, False),
+    FounderStakeView("founder_1", 1, 100, True),
+    AttentionScoreUpdate(1, 101, 7300, NOW, updated_by="admin_1"),
+    RewardProjection("rp_1", "player_1", 1, NOW, 200, 500, 1_000, 900, 400),
+    RewardClaim("rc_1", "player_1", 1, NOW, 360, "claimed", transaction_signature="sig"),
+    TokenSignalSeen("ts_1", "tok_1", "cr_1", "mention", NOW),
+    PromiseRegistered("pr_1", "tok_1", "cr_1", NOW, "Ship by Friday", source="x"),
+    PromiseEvaluated("pe_1", "pr_1", "tok_1", NOW, "kept", 0.89),
+    TokenHealthScoreCard("th_1", "tok_1", NOW, 0.8, 0.2, 0.7, metrics={"vol": 1.5}),
+    TokenOutcomeObserved("to_1", "tok_1", NOW, "reply", True, value=1.0),
+    TokenOutcomeWindow("tw_1", "tok_1", NOW, NOW, NOW, 0.65, outcomes=("reply", "no_reply")),
+    PromisePredictiveAccuracy("ppa_1", "pr_1", NOW, 0.77, 42, calibration_error=0.1),
+    CreatorBehaviorCorrelation("cbc_1", "cr_1", NOW, "posting_frequency", "promise_kept", 0.31),
+]
+
+
+@pytest.mark.parametrize("instance", INSTANCES, ids=lambda obj: type(obj).__name__)
+def test_from_dicts_matches_from_dict(instance: object) -> None:
+    cls = type(instance)
+    rows = [instance.to_dict() for _ in range(3)]
+    rows[1] = {k: v for k, v in rows[1].items() if k != "schema_version"}
+
+    decoded = cls.from_dicts(rows)
+
+    assert decoded == [cls.from_dict(row) for row in rows]
+    assert decoded[0] == instance
+
+
+def test_from_dicts_lazy_generator_decodes_in_chunks() -> None:
+    def rows():
+        for minute in range(10):
+            yield {
+                "attempt_id": f"att_{minute}",
+                "gate_name": "gate",
+                "entity_id": "ent_1",
+                "from_state": "seen",
+                "to_state": "queued",
+                "attempted_at": (NOW + timedelta(minutes=minute)).isoformat(),
+                "allowed": 1,
+            }
+
+    decoded = GateTransitionAttempt.from_dicts(rows(), lazy=True, chunk_size=3)
+
+    assert not isinstance(decoded, list)
+    attempts = list(decoded)
+    assert [a.attempt_id for a in attempts] == [f"att_{i}" for i in range(10)]
+    assert attempts[-1].attempted_at == NOW + timedelta(minutes=9)
+    assert attempts[0].allowed is True
+
+
+def test_from_dicts_defaults_are_not_shared_between_rows() -> None:
+    rows = [{"owner": "a", "season_id": 1, "game_id": 2, "amount": 3, "active": True}] * 2
+
+    first, second = dataclass_from_dicts(StakeAccountView, rows)
+
+    assert first.metadata == {}
+    assert first.metadata is not second.metadata
+
+
+def test_from_dicts_reports_missing_required_field() -> None:
+    rows = [{"owner": "a", "season_id": 1, "game_id": 2, "amount": 3, "active": True}, {"owner": "b"}]
+
+    with pytest.raises(ValueError, match="Missing required field: season_id"):
+        StakeAccountView.from_dicts(rows)
+    assert StakeAccountView.from_dicts([]) == []
+
+
+def test_to_dicts_matches_to_dict_and_honors_privacy_mode() -> None:
+    signals = [
+        SignalEnvelope(
+            signal_id=f"s_{i}",
+            timestamp=NOW,
+            source="test",
+            payload_type="x",
+            payload={"z": i, "a": [NOW]},
+            entity_refs=(EntityRef(ref_type="email", value=f"{i}@example.com"),),
+            raw={"body": "sensitive"},
+        )
+        for i in range(3)
+    ]
+
+    assert SignalEnvelope.to_dicts(signals) == [s.to_dict() for s in signals]
+    private = dataclass_to_dicts(signals, privacy_mode=True)
+    assert private == [s.to_dict(privacy_mode=True) for s in signals]
+    assert all("raw" not in row for row in private)
+
+
+def test_to_dicts_as_tuples_emits_header_once() -> None:
+    emissions = [
+        EmissionEnvelope(
+            emission_id=f"e_{i}",
+            timestamp=NOW,
+            emission_type="ScoresComputed",
+            payload={"score": 0.5},
+            caused_by="s_1",
+        )
+        for i in range(2)
+    ]
+
+    header, rows = EmissionEnvelope.to_dicts(emissions, as_tuples=True)
+
+    assert header == tuple(emissions[0].to_dict())
+    assert [dict(zip(header, row)) for row in rows] == [e.to_dict() for e in emissions]
+    assert all(isinstance(row, tuple) for row in rows)
+
+
+def test_to_dicts_rejects_mixed_types() -> None:
+    with pytest.raises(TypeError):
+        dataclass_to_dicts([GameAccountView(1, 2, 3), StakeAccountView("a", 1, 2, 3, True)])
+    assert StakeAccountView.to_dicts([]) == []
+    assert StakeAccountView.to_dicts([], as_tuples=True)[1] == []
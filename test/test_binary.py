@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from metaspn_schemas import EntityRef, SignalEnvelope, StateMachineConfig, StateTransitionRule, TraceContext
+from metaspn_schemas.utils.binary import HEADER_SIZE, decode_binary, schema_fingerprint
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _signal(payload: dict[str, object] | None = None) -> SignalEnvelope:
+    return SignalEnvelope(
+        signal_id="s_1",
+        timestamp=NOW,
+        source="scorer",
+        payload_type="Custom",
+        payload=payload
+        if payload is not None
+        else {"z": -7, "a": [1.5, None, True], "big": 2**70, "text": "héllo ✓", "nested": {"b": 1, "a": 2}},
+        entity_refs=(EntityRef(ref_type="entity_id", value="ent_1"),),
+        trace=TraceContext(trace_id="tr_1", caused_by=("s_0",)),
+        raw={"body": "sensitive"},
+    )
+
+
+def test_binary_round_trip_through_memoryview() -> None:
+    signal = _signal()
+    encoded = signal.to_binary()
+
+    buffer = bytearray(b"prefix") + encoded + b"suffix"
+    window = memoryview(buffer)[6 : 6 + len(encoded)]
+
+    assert SignalEnvelope.from_binary(window) == signal
+    assert decode_binary(None, encoded) == signal
+    assert encoded[:3] == b"MSB"
+    assert encoded[4:HEADER_SIZE] == schema_fingerprint(SignalEnvelope)
+
+
+def test_binary_round_trip_nested_schema_objects() -> None:
+    config = StateMachineConfig(
+        config_id="cfg_1",
+        machine_type="default",
+        initial_state="seen",
+        states=("seen", "sent"),
+        transitions=(StateTransitionRule("seen", "sent", "dispatch", guard="ok"),),
+        metadata={"owner": "ops"},
+    )
+
+    assert StateMachineConfig.from_binary(config.to_binary()) == config
+
+
+def test_binary_is_canonical() -> None:
+    first = _signal({"b": 1, "a": {"y": 2, "x": 1}})
+    second = _signal({"a": {"x": 1, "y": 2}, "b": 1})
+
+    assert first.to_binary() == second.to_binary()
+    local = datetime(2026, 1, 1, 4, 0, tzinfo=timezone(timedelta(hours=-8)))
+    assert _signal({"at": local}).to_binary() == _signal({"at": NOW}).to_binary()
+
+
+def test_binary_privacy_mode_drops_fields() -> None:
+    decoded = SignalEnvelope.from_binary(_signal().to_binary(privacy_mode=True))
+
+    assert decoded.raw is None
+    assert len(_signal().to_binary(privacy_mode=True)) < len(_signal().to_binary())
+
+
+def test_binary_rejects_mismatched_schema() -> None:
+    encoded = _signal().to_binary()
+
+    with pytest.raises(ValueError, match="fingerprint does not match"):
+        EntityRef.from_binary(encoded)
+    with pytest.raises(ValueError, match="trailing bytes"):
+        SignalEnvelope.from_binary(encoded + b"\x00")
+    with pytest.raises(TypeError, match="dict keys must be str"):
+        _signal({1: "x"}).to_binary()
+
+
+def test_binary_rejects_truncated_payloads() -> None:
+    encoded = _signal().to_binary()
+
+    # Every proper prefix is rejected with ValueError, never IndexError or struct.error.
+    for end in range(len(encoded)):
+        with pytest.raises(ValueError):
+            SignalEnvelope.from_binary(encoded[:end])
+    with pytest.raises(ValueError, match="truncated SignalEnvelope"):
+        SignalEnvelope.from_binary(encoded[:-1])
+
+
+def test_binary_rejects_out_of_range_and_mistyped_values() -> None:
+    encoded = _signal().to_binary()
+    # Header, field count, then signal_id "s_1" as STR; the timestamp DATETIME follows.
+    start = HEADER_SIZE + 1 + len(b"\x05\x03s_1")
+    assert encoded[start] == 8
+    end = start + 1
+    while encoded[end] & 0x80:
+        end += 1
+    before, after = encoded[:start], encoded[end + 1 :]
+
+    with pytest.raises(ValueError, match="malformed SignalEnvelope"):
+        SignalEnvelope.from_binary(before + b"\x08" + b"\xff" * 20 + b"\x01" + after)
+    with pytest.raises(ValueError, match="malformed SignalEnvelope"):
+        SignalEnvelope.from_binary(before + b"\x03\x0a" + after)
+    with pytest.raises(ValueError, match="malformed SignalEnvelope"):
+        SignalEnvelope.from_binary(before + b"\x06\x01" * 5000 + b"\x00" + after)
+
+
+def test_binary_keeps_the_type_of_equal_numbers() -> None:
+    encodings = {_signal({"n": value}).to_binary() for value in (1, 1.0, True)}
+    assert len(encodings) == 3
+    assert _signal({"n": 0.0}).to_binary() != _signal({"n": -0.0}).to_binary()
+    assert type(SignalEnvelope.from_binary(_signal({"n": 1.0}).to_binary()).payload["n"]) is float
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from metaspn_schemas.utils.ids import generate_id
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from metaspn_schemas.utils.ids import generate_id, generate_ids, max_id_for_time, min_id_for_time, parse_id
 
 
 def test_generate_id_default() -> None:
@@ -18,3 +24,60 @@ def test_generate_id_with_known_prefix() -> None:
 def test_generate_id_with_custom_prefix() -> None:
     value = generate_id("custom")
     assert value.startswith("custom_")
+
+
+def test_time_ordered_ids_keep_format_and_increase_within_process() -> None:
+    singles = [generate_id("signal", time_ordered=True) for _ in range(500)]
+    batch = generate_ids("signal", 500, time_ordered=True)
+    values = singles + batch + [generate_id("signal", time_ordered=True)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+    for value in values:
+        prefix, token = value.split("_", 1)
+        assert prefix == "s"
+        assert len(token) == 32
+        assert uuid.UUID(token).version == 7
+
+    before_ms = time.time_ns() // 1_000_000
+    token = generate_id(time_ordered=True)
+    assert "_" not in token and len(token) == 32
+    assert int(token[:12], 16) >= before_ms
+
+
+def test_generate_ids_batches_random_ids() -> None:
+    values = generate_ids("entity", 100)
+    assert len(set(values)) == 100
+    assert all(value.startswith("ent_") and uuid.UUID(value[4:]).version == 4 for value in values)
+    assert generate_ids(None, 3)[0].isalnum()
+    assert generate_ids("task", 0) == []
+    with pytest.raises(ValueError):
+        generate_ids("task", -1)
+
+
+def test_parse_id_extracts_prefix_kind_and_timestamp() -> None:
+    before = datetime.now(timezone.utc).replace(microsecond=0)
+    ordered = parse_id(generate_id("signal", time_ordered=True))
+    assert (ordered.prefix, ordered.kind) == ("s", "signal")
+    assert ordered.timestamp is not None
+    assert before <= ordered.timestamp <= datetime.now(timezone.utc)
+
+    random_id = parse_id(generate_id("custom"))
+    assert (random_id.prefix, random_id.kind, random_id.timestamp) == ("custom", None, None)
+    assert parse_id(generate_id()).prefix is None
+    for bad in ("s_xyz", "s_" + "A" * 32, ""):
+        with pytest.raises(ValueError):
+            parse_id(bad)
+
+
+def test_min_max_id_bound_time_window() -> None:
+    start = datetime.now(timezone.utc)
+    values = generate_ids("signal", 50, time_ordered=True)
+    end = datetime.now(timezone.utc)
+
+    low, high = min_id_for_time("signal", start), max_id_for_time("s", end)
+    assert all(low <= value <= high for value in values)
+    assert parse_id(low).timestamp == start.replace(microsecond=start.microsecond // 1000 * 1000)
+    assert parse_id(high).timestamp == end.replace(microsecond=end.microsecond // 1000 * 1000)
+    assert max_id_for_time("signal", start - timedelta(milliseconds=1)) < low
+    assert values[0] < min_id_for_time("signal", end + timedelta(milliseconds=1))
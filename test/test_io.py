@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import io
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from metaspn_schemas import EmissionEnvelope, IngestionParseErrorEvent, SignalEnvelope
+from metaspn_schemas.io import NdjsonWriter, iter_ndjson_lines, read_ndjson, write_ndjson
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _signal(index: int) -> SignalEnvelope:
+    return SignalEnvelope(
+        signal_id=f"s_{index}",
+        timestamp=NOW,
+        source="ingest",
+        payload_type="Custom",
+        payload={"index": index, "text": "héllo"},
+        raw={"secret": index},
+    )
+
+
+def test_write_then_read_ndjson_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "signals.ndjson"
+    signals = [_signal(index) for index in range(100)]
+
+    assert write_ndjson(path, signals[:60], buffer_size=64) == 60
+    assert write_ndjson(path, iter(signals[60:]), append=True) == 40
+
+    lines = path.read_text(encoding="ascii").splitlines()
+    assert lines == [signal.to_json() for signal in signals]
+    assert list(read_ndjson(path, SignalEnvelope, buffer_size=7, chunk_size=16)) == signals
+
+
+def test_read_ndjson_from_text_file_with_blank_and_crlf_lines() -> None:
+    signals = [_signal(1), _signal(2)]
+    text = f"{signals[0].to_json()}\r\n\n{signals[1].to_json()}"
+
+    assert list(read_ndjson(io.StringIO(text), SignalEnvelope, buffer_size=5)) == signals
+    assert [number for number, _ in iter_ndjson_lines(io.StringIO(text), buffer_size=3)] == [1, 3]
+
+
+def test_read_ndjson_reports_malformed_lines() -> None:
+    good = _signal(1).to_json()
+    lines = [good, "{not json", "[1, 2]", json.dumps({"signal_id": "s_x"}), good]
+    data = io.BytesIO("\n".join(lines).encode("utf-8"))
+
+    with pytest.raises(ValueError, match="archive:2"):
+        list(read_ndjson(data, SignalEnvelope, error_source="archive"))
+
+    errors: list[IngestionParseErrorEvent] = []
+    data.seek(0)
+    decoded = list(
+        read_ndjson(
+            data,
+            SignalEnvelope,
+            chunk_size=2,
+            skip_malformed=True,
+            on_error=errors.append,
+            error_source="archive",
+        )
+    )
+
+    assert decoded == [_signal(1), _signal(1)]
+    assert [error.raw_payload["line_number"] for error in errors] == [2, 3, 4]
+    assert [error.error_type for error in errors] == ["JSONDecodeError", "ValueError", "ValueError"]
+    assert errors[0].source == "archive"
+    assert errors[0].raw_payload["line"] == "{not json"
+    assert "Missing required field" in errors[2].message
+
+
+def test_ndjson_writer_privacy_mode_and_text_files() -> None:
+    out = io.StringIO()
+    emission = EmissionEnvelope(
+        emission_id="e_1",
+        timestamp=NOW,
+        emission_type="Score",
+        payload={"score": 1},
+        caused_by="s_1",
+    )
+    with NdjsonWriter(out, privacy_mode=True) as writer:
+        writer.write(_signal(1))
+        writer.write_many([emission])
+
+    assert writer.count == 2
+    first, second = out.getvalue().splitlines()
+    assert "secret" not in first
+    assert EmissionEnvelope.from_json(second) == emission
+    with pytest.raises(TypeError):
+        read_ndjson(io.StringIO(""), dict)  # type: ignore[arg-type]
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from metaspn_schemas import EntityRef, SignalEnvelope, StateMachineConfig, StateTransitionRule, TraceContext
+from metaspn_schemas.utils.json_codec import encode_json, write_json_array
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _canonical(value: object) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def _signal(signal_id: str = "s_1", payload: dict[str, object] | None = None) -> SignalEnvelope:
+    return SignalEnvelope(
+        signal_id=signal_id,
+        timestamp=NOW,
+        source="scorer",
+        payload_type="Custom",
+        payload=payload
+        if payload is not None
+        else {
+            "z": -7,
+            "a": [1.5, None, True, ("x", "y")],
+            "big": 2**70,
+            "text": 'héllo ✓ "quoted"\n',
+            "nested": {"b": 1, "a": {"d": 2.0, "c": []}},
+            "at": datetime(2026, 1, 1, 13, 0, tzinfo=timezone(timedelta(hours=1))),
+            "ref": EntityRef(ref_type="entity_id", value="ent_1"),
+        },
+        entity_refs=(EntityRef(ref_type="entity_id", value="ent_1"),),
+        trace=TraceContext(trace_id="tr_1", caused_by=("s_0",)),
+        raw={"body": "sensitive"},
+    )
+
+
+@pytest.mark.parametrize("privacy_mode", [False, True])
+def test_to_json_matches_json_dumps_of_to_dict(privacy_mode: bool) -> None:
+    signal = _signal()
+
+    text = signal.to_json(privacy_mode=privacy_mode)
+
+    assert text == _canonical(signal.to_dict(privacy_mode=privacy_mode))
+    assert ("sensitive" in text) is not privacy_mode
+    assert SignalEnvelope.from_json(text) == SignalEnvelope.from_dict(json.loads(text))
+
+
+def test_to_json_edge_values_match_json_dumps() -> None:
+    payload = {
+        1: "int key",
+        2: {"nan": float("nan"), "inf": float("inf"), "neg": -float("inf")},
+    }
+    signal = _signal(payload=payload)  # type: ignore[arg-type]
+
+    assert signal.to_json() == _canonical(signal.to_dict())
+
+    config = StateMachineConfig(
+        config_id="cfg_1",
+        machine_type="default",
+        initial_state="seen",
+        states=("seen", "sent"),
+        transitions=(StateTransitionRule("seen", "sent", "dispatch", guard="ok"),),
+        metadata={"owner": "ops"},
+    )
+    assert config.to_json() == _canonical(config.to_dict())
+
+
+def test_write_json_array_streams_canonical_array() -> None:
+    signals = [_signal(f"s_{index}") for index in range(50)]
+    out = io.StringIO()
+
+    count = write_json_array(out, signals, privacy_mode=True, buffer_size=256)
+
+    assert count == 50
+    assert out.getvalue() == _canonical([signal.to_dict(privacy_mode=True) for signal in signals])
+
+    empty = io.StringIO()
+    assert write_json_array(empty, []) == 0
+    assert empty.getvalue() == "[]"
+
+
+def test_encode_json_rejects_non_dataclasses() -> None:
+    with pytest.raises(TypeError):
+        encode_json({"a": 1})
+    with pytest.raises(ValueError):
+        write_json_array(io.StringIO(), [], buffer_size=0)
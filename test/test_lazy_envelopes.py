@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timezone
+
+import pytest
+
+from metaspn_schemas import (
+    EmissionEnvelope,
+    EntityRef,
+    LazyEmissionEnvelope,
+    LazySignalEnvelope,
+    ScoresComputed,
+    SignalEnvelope,
+    TraceContext,
+)
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _signal() -> SignalEnvelope:
+    return SignalEnvelope(
+        signal_id="s_1",
+        timestamp=NOW,
+        source="scorer",
+        payload_type="ScoresComputed",
+        payload=ScoresComputed("ent_1", NOW, {"fit": 0.9}, "v1").to_dict(),
+        entity_refs=(EntityRef(ref_type="entity_id", value="ent_1"),),
+        trace=TraceContext(trace_id="tr_1", caused_by=("s_0",)),
+        raw={"body": "sensitive"},
+    )
+
+
+def test_lazy_signal_decodes_headers_only_until_accessed() -> None:
+    data = _signal().to_dict()
+    data["timestamp"] = "2026-01-01T04:00:00-08:00"
+
+    lazy = LazySignalEnvelope.from_dict(data)
+
+    assert lazy._values == {}
+    assert lazy.timestamp == NOW
+    assert lazy.timestamp.tzinfo == timezone.utc
+    assert lazy.trace == TraceContext(trace_id="tr_1", caused_by=("s_0",))
+    assert "entity_refs" not in lazy._values
+    assert "trace" in lazy._values
+
+
+def test_lazy_signal_equality_and_serialization_match_eager_decode() -> None:
+    signal = _signal()
+    lazy = LazySignalEnvelope.from_dict(signal.to_dict())
+
+    assert lazy == signal
+    assert signal == lazy
+    assert lazy == LazySignalEnvelope.from_dict(signal.to_dict())
+    assert lazy.materialize() == signal
+    assert lazy.materialize() is lazy.materialize()
+    assert lazy.to_dict() == signal.to_dict()
+    assert lazy.to_dict(privacy_mode=True) == signal.to_dict(privacy_mode=True)
+
+
+def test_lazy_envelope_is_frozen_and_rejects_unknown_fields() -> None:
+    lazy = LazySignalEnvelope.from_dict(_signal().to_dict())
+
+    with pytest.raises(FrozenInstanceError):
+        lazy.source = "other"  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        lazy.emission_id  # noqa: B018
+    with pytest.raises(ValueError, match="Missing required field: payload"):
+        LazySignalEnvelope.from_dict({"signal_id": "s", "timestamp": NOW, "source": "x", "payload_type": "x"})
+
+
+def test_lazy_envelopes_can_decode_typed_payloads() -> None:
+    signal = _signal()
+    emission = EmissionEnvelope("e_1", NOW, "ScoresComputed", signal.payload, caused_by="s_1")
+
+    lazy_signal = LazySignalEnvelope.from_dict(signal.to_dict(), typed_payload=True)
+    lazy_emission = LazyEmissionEnvelope.from_dict(emission.to_dict(), typed_payload=True)
+
+    assert "payload" not in lazy_signal._values
+    assert lazy_signal.payload == ScoresComputed("ent_1", NOW, {"fit": 0.9}, "v1")
+    assert lazy_emission.payload == lazy_signal.payload
+    assert lazy_emission.to_dict() == emission.to_dict()
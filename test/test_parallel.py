@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import pytest
+
+from metaspn_schemas import SignalEnvelope
+from metaspn_schemas.parallel import decode_parallel, read_ndjson_parallel
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _signals(count: int) -> list[SignalEnvelope]:
+    return [
+        SignalEnvelope(
+            signal_id=f"s_{index}",
+            timestamp=NOW,
+            source="ingest",
+            payload_type="Custom",
+            payload={"index": index},
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_decode_parallel_preserves_order(max_workers: int) -> None:
+    signals = _signals(50)
+    lines = [signal.to_json().encode("ascii") for signal in signals]
+
+    decoded = list(decode_parallel(SignalEnvelope, lines, max_workers=max_workers, chunk_size=7, prefetch=1))
+
+    assert decoded == signals
+
+
+def test_read_ndjson_parallel_with_caller_executor() -> None:
+    signals = _signals(20)
+    data = io.BytesIO(("\n".join(signal.to_json() for signal in signals) + "\n\n").encode("ascii"))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        decoded = list(read_ndjson_parallel(data, SignalEnvelope, chunk_size=3, buffer_size=64, executor=executor))
+
+    assert decoded == signals
+
+
+def test_decode_parallel_reports_failing_line() -> None:
+    lines = [signal.to_json() for signal in _signals(5)]
+    lines[3] = '{"signal_id": "s_bad"}'
+
+    with pytest.raises(ValueError, match="line 4: Missing required field"):
+        list(decode_parallel(SignalEnvelope, lines, max_workers=1, chunk_size=2))
+    with pytest.raises(ValueError, match="chunk_size"):
+        decode_parallel(SignalEnvelope, lines, chunk_size=0)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from metaspn_schemas import (
+    EmissionEnvelope,
+    ScoresComputed,
+    SeasonAccountView,
+    SignalEnvelope,
+    SocialPostSeen,
+    StateMachineConfig,
+    decode_payload,
+    decode_typed_envelope,
+    register_payload_type,
+    with_typed_payload,
+)
+from metaspn_schemas.payloads import PAYLOAD_DECODERS
+from metaspn_schemas.season1 import SEASON1_PAYLOAD_PARSERS
+from metaspn_schemas.utils.serde import Serializable
+
+NOW = datetime(2026, 2, 7, 16, 0, tzinfo=timezone.utc)
+
+
+def test_decode_payload_dispatches_on_payload_type() -> None:
+    post = SocialPostSeen("p1", "linkedin", "@a", "hello", NOW, topics=("b", "a"))
+
+    decoded = decode_payload("SocialPostSeen", post.to_dict())
+
+    assert decoded == post
+    assert decode_payload("SocialPostSeen", post) is post
+    assert decode_payload("Unregistered", {"x": 1}) == {"x": 1}
+    with pytest.raises(ValueError, match="Unknown payload_type: Unregistered"):
+        decode_payload("Unregistered", {"x": 1}, strict=True)
+
+
+def test_registry_reuses_season1_and_state_machine_parsers() -> None:
+    for payload_type, parser in SEASON1_PAYLOAD_PARSERS.items():
+        assert PAYLOAD_DECODERS[payload_type] is parser
+
+    season = decode_payload(
+        "SeasonAccountView",
+        {"seasonId": 1, "authorityPubkey": "auth_1", "towelMint": "mint_1", "active": True, "startTs": 1762502400},
+    )
+    config = decode_payload(
+        "StateMachineConfig",
+        {
+            "machine_id": "cfg_old",
+            "machine_name": "default",
+            "start_state": "seen",
+            "state_nodes": ["seen", "queued"],
+            "transitions": [{"from": "seen", "to": "queued", "event_name": "route"}],
+        },
+    )
+
+    assert isinstance(season, SeasonAccountView)
+    assert isinstance(config, StateMachineConfig)
+    assert config.config_id == "cfg_old"
+
+
+def test_typed_envelopes_keep_serialized_form() -> None:
+    scores = ScoresComputed("ent_1", NOW, {"fit": 0.9}, "v1")
+    signal = SignalEnvelope("s_1", NOW, "scorer", "ScoresComputed", scores.to_dict())
+    emission = EmissionEnvelope("e_1", NOW, "ScoresComputed", scores.to_dict(), caused_by="s_1")
+
+    typed_signal = decode_typed_envelope(SignalEnvelope, signal.to_dict())
+    typed_emission = with_typed_payload(emission)
+
+    assert typed_signal.payload == scores
+    assert typed_emission.payload == scores
+    assert typed_signal.to_dict() == signal.to_dict()
+    assert typed_emission.to_dict() == emission.to_dict()
+    assert with_typed_payload(typed_signal) is typed_signal
+
+
+def test_register_payload_type() -> None:
+    from dataclasses import dataclass
+
+    @dataclass(frozen=True)
+    class CustomPayload(Serializable):
+        value: int
+
+    register_payload_type("test.CustomPayload", CustomPayload)
+    try:
+        assert decode_payload("test.CustomPayload", {"value": "3"}) == CustomPayload(3)
+        with pytest.raises(ValueError, match="already registered"):
+            register_payload_type("test.CustomPayload", CustomPayload)
+        register_payload_type("test.CustomPayload", lambda data: data["value"], replace_existing=True)
+        assert decode_payload("test.CustomPayload", {"value": 5}) == 5
+    finally:
+        del PAYLOAD_DECODERS["test.CustomPayload"]
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from metaspn_schemas import (
+    RewardClaim,
+    StakeAccountView,
+    validate_season1_batch,
+    validate_season1_payload,
+)
+
+NOW = datetime(2026, 2, 7, 16, 0, tzinfo=timezone.utc)
+
+ROWS = {
+    "SeasonAccountView": [
+        {"seasonId": 1, "authorityPubkey": "auth_1", "towelMint": "mint_1", "active": True, "startTs": 1762502400},
+        {"season_id": 0, "authority": "", "towel_mint": "m", "active": True, "started_at": "2026-02-07T16:00:00Z",
+         "reward_pool_total": -1},
+        {"season_id": 1, "authority": "a", "active": True},
+    ],
+    "GameAccountView": [
+        {"seasonId": 1, "gameId": 7, "attentionScoreBps": 10_000},
+        {"season_id": 1, "game_id": 0, "attention_score_bps": 10_001},
+        {"season_id": "x", "game_id": 1, "attention_score_bps": 1},
+    ],
+    "StakeAccountView": [
+        {"owner": "p1", "seasonId": 1, "gameId": 2, "amount": 5, "active": True},
+        StakeAccountView(owner="", season_id=1, game_id=2, amount=-5, active=True),
+        {"owner": "p2", "seasonId": 1, "gameId": 2, "amount": 0, "active": False},
+    ],
+    "PlayerAccountView": [
+        {"owner": "p1", "seasonId": 1, "issuedTowelBalance": 1, "stakedTowel": 0, "claimedRewards": 0,
+         "hasClaimed": False},
+        {"owner": "p1", "season_id": -1, "issued_towel_balance": -1, "staked_towel": -1, "claimed_rewards": -1,
+         "has_claimed": True},
+    ],
+    "FounderStakeView": [
+        {"owner": "f1", "seasonId": 1, "amount": 1, "active": True},
+        {"owner": "", "season_id": 1, "amount": -1, "active": True},
+    ],
+    "AttentionScoreUpdate": [
+        {"seasonId": 1, "gameId": 44, "attentionScoreBps": 5400, "updatedAt": "2026-02-07T16:00:00Z",
+         "updatedBy": "admin_1"},
+        {"season_id": 1, "game_id": 44, "attention_score_bps": -1, "updated_at": "2026-02-07T16:00:00Z",
+         "updated_by": ""},
+        {"season_id": 1, "game_id": 44, "attention_score_bps": 1},
+    ],
+    "RewardProjection": [
+        {"projectionId": "rp_1", "owner": "p", "seasonId": 1, "computedAt": "2026-02-07T16:00:00Z",
+         "stakedAmount": 1, "totalStaked": 1, "rewardPoolTotal": 10, "rewardPoolRemaining": 11,
+         "projectedPayout": 1},
+        {"projectionId": "rp_2", "owner": "p", "seasonId": 1, "computedAt": "2026-02-07T16:00:00Z",
+         "stakedAmount": 1, "totalStaked": 1, "rewardPoolTotal": 10, "rewardPoolRemaining": 10,
+         "projectedPayout": 1},
+    ],
+    "RewardClaim": [
+        RewardClaim(claim_id="rc_1", owner="p", season_id=1, claimed_at=NOW, amount=1, status="claimed"),
+        {"claimId": "", "owner": "", "seasonId": 0, "claimedAt": "2026-02-07T16:00:00Z", "amount": -1,
+         "status": "unknown"},
+        "not a payload",
+    ],
+}
+
+
+@pytest.mark.parametrize("payload_type", sorted(ROWS))
+def test_batch_verdicts_match_per_row_validators(payload_type: str) -> None:
+    rows = ROWS[payload_type]
+    result = validate_season1_batch(payload_type, rows)
+
+    expected = [validate_season1_payload(payload_type, row) for row in rows]
+    assert [result.verdict(index) for index in range(len(rows))] == expected
+    assert set(result.errors) == {index for index, (ok, _) in enumerate(expected) if not ok}
+    assert result.valid_count == sum(ok for ok, _ in expected)
+
+
+def test_batch_result_is_compact_bitmask() -> None:
+    rows = [{"owner": "p", "season_id": 1, "game_id": 1, "amount": 1, "active": True}] * 10
+    rows[9] = {**rows[9], "amount": -1}
+
+    result = validate_season1_batch("StakeAccountView", rows)
+
+    assert result.valid_mask == bytes([0xFF, 0x01])
+    assert result.errors == {9: ("amount must be >= 0",)}
+    assert not result.all_valid
+    assert result.invalid_rows() == [9]
+
+
+def test_batch_unknown_payload_type_fails_every_row() -> None:
+    result = validate_season1_batch("Nope", [{}, {}])
+
+    assert result.verdict(1) == validate_season1_payload("Nope", {})
+    assert result.valid_mask == b"\x00"
+
+
+def test_parse_error_reports_first_bad_alias_in_table_order() -> None:
+    base = {"seasonId": 1, "authorityPubkey": "a", "towelMint": "m", "active": True}
+    expected = (False, ("parse_error: invalid literal for int() with base 10: 'bad'",))
+
+    assert validate_season1_payload("SeasonAccountView", {**base, "startTs": "bad", "endTs": "worse"}) == expected
+    assert validate_season1_payload("SeasonAccountView", {**base, "endTs": "worse", "startTs": "bad"}) == expected
+    result = validate_season1_batch("SeasonAccountView", [{**base, "endTs": "worse", "start_ts": "bad"}])
+    assert result.errors == {0: expected[1]}
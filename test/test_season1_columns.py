@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from array import array
+
+import pytest
+
+from metaspn_schemas import PlayerAccountColumns, PlayerAccountView, StakeAccountColumns, StakeAccountView
+
+STAKES = [
+    StakeAccountView(owner="player_1", season_id=1, game_id=101, amount=200, active=True),
+    StakeAccountView(owner="player_2", season_id=1, game_id=101, amount=50, active=True),
+    StakeAccountView(owner="player_1", season_id=1, game_id=102, amount=75, active=False),
+    StakeAccountView(owner="player_1", season_id=1, game_id=102, amount=25, active=True, metadata={"src": "rpc"}),
+]
+
+PLAYERS = [
+    PlayerAccountView("player_1", 1, issued_towel_balance=800, staked_towel=200, claimed_rewards=0, has_claimed=False),
+    PlayerAccountView("player_2", 1, issued_towel_balance=300, staked_towel=50, claimed_rewards=40, has_claimed=True),
+    PlayerAccountView("player_1", 2, issued_towel_balance=100, staked_towel=10, claimed_rewards=5, has_claimed=True),
+]
+
+
+def test_stake_columns_round_trip_views() -> None:
+    columns = StakeAccountColumns.from_views(STAKES)
+
+    assert len(columns) == 4
+    assert isinstance(columns.amount, array) and columns.amount.typecode == "q"
+    assert columns.active.typecode == "b"
+    assert columns.metadata == {3: {"src": "rpc"}}
+    assert columns.to_views() == STAKES
+    assert columns.row(-1) == STAKES[-1]
+    assert columns.owner[0] is columns.owner[2]
+
+
+def test_stake_columns_aggregates_match_loops() -> None:
+    columns = StakeAccountColumns.from_views(STAKES)
+
+    assert columns.total_staked() == 275
+    assert columns.total_staked(active_only=False) == 350
+    assert columns.total_staked_by_game() == {101: 250, 102: 25}
+    assert columns.total_staked_by_game(active_only=False) == {101: 250, 102: 100}
+    assert columns.total_staked_by_owner() == {"player_1": 225, "player_2": 50}
+
+
+def test_player_columns_sum_by_owner() -> None:
+    columns = PlayerAccountColumns.from_views(PLAYERS)
+
+    assert columns.to_views() == PLAYERS
+    assert columns.sum_by_owner("claimed_rewards") == {"player_1": 5, "player_2": 40}
+    assert columns.sum_by("season_id", "staked_towel") == {1: 250, 2: 10}
+    assert columns.total("issued_towel_balance", where="has_claimed") == 400
+
+
+def test_columns_hold_u64_amounts_above_the_signed_range() -> None:
+    big = 2**64 - 1
+    stakes = [*STAKES, StakeAccountView(owner="whale", season_id=1, game_id=101, amount=big, active=True)]
+    columns = StakeAccountColumns.from_views(stakes)
+
+    assert columns.amount.typecode == "Q"
+    assert columns.season_id.typecode == "q"
+    assert columns.to_views() == stakes
+    assert columns.total_staked() == 275 + big
+    assert columns.total_staked_by_owner()["whale"] == big
+    assert columns.total_staked_by_game() == {101: 250 + big, 102: 25}
+
+    # A column mixing negatives with u64 values fits no array type and stays a list.
+    mixed = [*stakes, StakeAccountView(owner="debt", season_id=1, game_id=102, amount=-5, active=True)]
+    columns = StakeAccountColumns.from_views(mixed)
+    assert columns.amount == [view.amount for view in mixed]
+    assert columns.total_staked_by_game() == {101: 250 + big, 102: 20}
+    assert columns.to_views() == mixed
+
+
+def test_columns_reject_bad_input() -> None:
+    with pytest.raises(TypeError):
+        StakeAccountColumns.from_views(PLAYERS)
+    with pytest.raises(ValueError):
+        StakeAccountColumns(
+            owner=["a"],
+            season_id=array("q", [1]),
+            game_id=array("q"),
+            amount=array("q", [1]),
+            active=array("b", [1]),
+            schema_version=["0.9"],
+        )
+    with pytest.raises(ValueError):
+        StakeAccountColumns.from_views(STAKES).sum_by("owner", "active")
@@ -13,6 +13,7 @@ from metaspn_schemas import (
     StakeAccountView,
     parse_attention_score_update,
     parse_reward_projection,
+    parse_season_account_view,
     parse_season1_payload,
     validate_reward_claim,
     validate_season1_payload,
@@ -185,3 +186,36 @@ def test_season1_parse_and_validate_helpers() -> None:
     )
     assert not invalid
     assert claim_errors
+
+
+def test_season1_alias_precedence() -> None:
+    season = parse_season_account_view(
+        {
+            "seasonId": 1,
+            "season_id": 2,
+            "authority_pubkey": "auth_snake",
+            "authorityPubkey": "auth_camel",
+            "towelMint": "mint_1",
+            "active": True,
+            "start_ts": 1762502400,
+            "startTs": 1,
+            "endTs": "1762588800",
+        }
+    )
+    assert season.season_id == 2
+    assert season.authority == "auth_snake"
+    assert season.started_at == datetime(2025, 11, 7, 8, 0, tzinfo=timezone.utc)
+    assert season.ended_at == datetime(2025, 11, 8, 8, 0, tzinfo=timezone.utc)
+
+    # The first alias present wins even when it is None; later aliases are not consulted.
+    update = parse_attention_score_update(
+        {
+            "seasonId": 1,
+            "gameId": 44,
+            "attentionScoreBps": 5400,
+            "updatedAt": "2026-02-07T16:00:00Z",
+            "updatedBy": None,
+            "authority": "admin_1",
+        }
+    )
+    assert update.updated_by is None
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
+import pytest
+
 from metaspn_schemas.core import (
     DEFAULT_SCHEMA_VERSION,
     EmissionEnvelope,
@@ -238,3 +240,329 @@ def test_new_contract_schema_versions_default_to_current() -> None:
     assert eval_record.schema_version == DEFAULT_SCHEMA_VERSION
     assert calibration.schema_version == DEFAULT_SCHEMA_VERSION
     assert failure.schema_version == DEFAULT_SCHEMA_VERSION
+
+
+def test_codec_is_compiled_once_per_class() -> None:
+    from metaspn_schemas.utils.serde import _codec_for
+
+    assert _codec_for(SignalEnvelope) is _codec_for(SignalEnvelope)
+    assert [plan.name for plan in _codec_for(EntityRef).fields] == [
+        "ref_type",
+        "value",
+        "platform",
+        "label",
+        "schema_version",
+    ]
+
+
+def test_untyped_payload_values_are_converted_by_runtime_type() -> None:
+    signal = SignalEnvelope(
+        signal_id="s_any",
+        timestamp=NOW,
+        source="test",
+        payload_type="x",
+        payload={"ref": EntityRef(ref_type="email", value="x@example.com"), "at": NOW, "ids": ("b", "a")},
+    )
+
+    payload = signal.to_dict()["payload"]
+    assert payload == {
+        "at": "2026-01-01T12:00:00Z",
+        "ids": ["b", "a"],
+        "ref": {
+            "label": None,
+            "platform": None,
+            "ref_type": "email",
+            "schema_version": DEFAULT_SCHEMA_VERSION,
+            "value": "x@example.com",
+        },
+    }
+    assert list(payload["ref"].keys()) == ["ref_type", "value", "platform", "label", "schema_version"]
+
+
+def test_from_dict_reports_missing_required_field() -> None:
+    with pytest.raises(ValueError, match="Missing required field: value"):
+        EntityRef.from_dict({"ref_type": "email"})
+
+
+def test_public_schemas_have_no_instance_dict() -> None:
+    import metaspn_schemas
+    from metaspn_schemas.utils.serde import Serializable
+
+    schema_classes = [
+        obj
+        for obj in (getattr(metaspn_schemas, name) for name in metaspn_schemas.__all__)
+        if isinstance(obj, type) and issubclass(obj, Serializable)
+    ]
+
+    assert schema_classes
+    for cls in schema_classes:
+        assert cls.__dictoffset__ == 0, cls.__name__
+    local = SignalEnvelope("s_slots", datetime(2026, 1, 1, 4, 0), "test", "x", {})
+    assert local.timestamp == datetime(2026, 1, 1, 4, 0, tzinfo=timezone.utc)
+
+
+def test_public_schemas_restore_state_by_field_name() -> None:
+    import metaspn_schemas
+    from metaspn_schemas.utils.serde import Serializable
+
+    schema_classes = [
+        obj
+        for obj in (getattr(metaspn_schemas, name) for name in metaspn_schemas.__all__)
+        if isinstance(obj, type) and issubclass(obj, Serializable)
+    ]
+
+    assert schema_classes
+    for cls in schema_classes:
+        assert cls.__setstate__ is Serializable.__setstate__, cls.__name__
+
+
+# Written by metaspn-schemas 0.9.0, when schemas were non-slotted dataclasses pickled with
+# their ``__dict__`` as state.
+LEGACY_ENTITY_REF_PICKLES = (
+    b"\x80\x02cmetaspn_schemas.core\nEntityRef\nq\x00)\x81q\x01}q\x02(X\x08\x00\x00\x00ref_typeq\x03X\x05"
+    b"\x00\x00\x00emailq\x04X\x05\x00\x00\x00valueq\x05X\r\x00\x00\x00x@example.comq\x06X\x08\x00\x00\x00"
+    b"platformq\x07NX\x05\x00\x00\x00labelq\x08NX\x0e\x00\x00\x00schema_versionq\tX\x03\x00\x00\x000.9q\nub.",
+    b"\x80\x05\x95\x85\x00\x00\x00\x00\x00\x00\x00\x8c\x14metaspn_schemas.core\x94\x8c\tEntityRef\x94\x93\x94)"
+    b"\x81\x94}\x94(\x8c\x08ref_type\x94\x8c\x05email\x94\x8c\x05value\x94\x8c\rx@example.com\x94\x8c\x08"
+    b"platform\x94N\x8c\x05label\x94N\x8c\x0eschema_version\x94\x8c\x030.9\x94ub.",
+)
+LEGACY_SIGNAL_PICKLE = (
+    b"\x80\x04\x95\xfd\x01\x00\x00\x00\x00\x00\x00\x8c\x14metaspn_schemas.core\x94\x8c\x0eSignalEnvelope\x94"
+    b"\x93\x94)\x81\x94}\x94(\x8c\tsignal_id\x94\x8c\x08s_legacy\x94\x8c\ttimestamp\x94\x8c\x08datetime\x94"
+    b"\x8c\x08datetime\x94\x93\x94C\n\x07\xea\x01\x01\x0c\x00\x00\x00\x00\x00\x94h\x08\x8c\x08timezone\x94"
+    b"\x93\x94h\x08\x8c\ttimedelta\x94\x93\x94K\x00K\x00K\x00\x87\x94R\x94\x85\x94R\x94\x86\x94R\x94\x8c\x06"
+    b"source\x94\x8c\x04test\x94\x8c\x0cpayload_type\x94\x8c\x06Custom\x94\x8c\x07payload\x94}\x94\x8c\x01n"
+    b"\x94]\x94(K\x01K\x02es\x8c\x0eschema_version\x94\x8c\x030.9\x94\x8c\x0bentity_refs\x94h\x00\x8c\t"
+    b"EntityRef\x94\x93\x94)\x81\x94}\x94(\x8c\x08ref_type\x94\x8c\x05email\x94\x8c\x05value\x94\x8c\r"
+    b"x@example.com\x94\x8c\x08platform\x94N\x8c\x05label\x94Nh\x1eh\x1fub\x85\x94\x8c\x05trace\x94h\x00\x8c"
+    b"\x0cTraceContext\x94\x93\x94)\x81\x94}\x94(\x8c\x08trace_id\x94\x8c\x04tr_1\x94\x8c\tcaused_by\x94\x8c"
+    b"\x03s_0\x94\x85\x94\x8c\nprovenance\x94N\x8c\nredactions\x94)\x8c\x08metadata\x94}\x94\x8c\x0c"
+    b"privacy_mode\x94\x89h\x1eh\x1fub\x8c\x03raw\x94Nub."
+)
+
+
+def test_pickles_from_0_9_0_load_by_field_name() -> None:
+    import pickle
+
+    ref = EntityRef(ref_type="email", value="x@example.com", schema_version="0.9")
+    for blob in LEGACY_ENTITY_REF_PICKLES:
+        assert pickle.loads(blob) == ref
+    signal = pickle.loads(LEGACY_SIGNAL_PICKLE)
+    assert signal == SignalEnvelope(
+        signal_id="s_legacy",
+        timestamp=NOW,
+        source="test",
+        payload_type="Custom",
+        payload={"n": [1, 2]},
+        schema_version="0.9",
+        entity_refs=(ref,),
+        trace=TraceContext(trace_id="tr_1", caused_by=("s_0",), schema_version="0.9"),
+    )
+
+    # Fields missing from an old state fall back to their defaults; required ones fail loudly.
+    partial = object.__new__(EntityRef)
+    partial.__setstate__({"ref_type": "email", "value": "x@example.com"})
+    assert partial == EntityRef(ref_type="email", value="x@example.com")
+    with pytest.raises(TypeError, match="cannot unpickle EntityRef: state has no field 'value'"):
+        object.__new__(EntityRef).__setstate__({"ref_type": "email"})
+
+
+def test_legacy_pickles_repickle_through_reconstruct() -> None:
+    import pickle
+
+    from metaspn_schemas.utils.serde import _reconstruct
+
+    legacy = pickle.loads(LEGACY_SIGNAL_PICKLE)
+    assert (legacy.signal_id, legacy.payload_type, legacy.payload) == ("s_legacy", "Custom", {"n": [1, 2]})
+    assert legacy.trace.caused_by == ("s_0",)
+    factory, args = legacy.__reduce__()
+    assert factory is _reconstruct
+    assert args[0] is SignalEnvelope
+    restored = pickle.loads(pickle.dumps(legacy, protocol=pickle.HIGHEST_PROTOCOL))
+    assert restored == legacy
+    assert restored.entity_refs[0] == pickle.loads(LEGACY_ENTITY_REF_PICKLES[0])
+    assert restored.timestamp.tzinfo is timezone.utc
+
+
+def test_pickle_round_trip_uses_compact_positional_reduce() -> None:
+    import copy
+    import copyreg
+    import pickle
+
+    from metaspn_schemas.utils.serde import _reconstruct
+
+    signal = SignalEnvelope(
+        signal_id="s_pickle",
+        timestamp=NOW,
+        source="test",
+        payload_type="Custom",
+        payload={"nested": [1, 2]},
+        entity_refs=(EntityRef(ref_type="entity_id", value="ent_1"),),
+        trace=TraceContext(trace_id="tr_1", caused_by=("s_0",)),
+    )
+    ref = EntityRef(ref_type="email", value="x@example.com")
+
+    # Trailing fields still at their default are left out of the pickle.
+    assert ref.__reduce__() == (_reconstruct, (EntityRef, "email", "x@example.com"))
+    for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+        restored = pickle.loads(pickle.dumps([signal, ref], protocol=protocol))
+        assert restored == [signal, ref]
+        assert restored[0].timestamp.tzinfo is timezone.utc
+    assert copy.deepcopy(signal) == signal
+
+    # Pickles written with the dataclass default state still load.
+    legacy = pickle.dumps((copyreg.__newobj__, (EntityRef,), ref.__getstate__()))  # type: ignore[attr-defined]
+    factory, args, state = pickle.loads(legacy)
+    rebuilt = factory(*args)
+    rebuilt.__setstate__(state)
+    assert rebuilt == ref
+
+
+def test_low_cardinality_fields_are_interned_on_decode() -> None:
+    row = SignalEnvelope(
+        signal_id="s_intern",
+        timestamp=NOW,
+        source="crawler",
+        payload_type="Custom",
+        payload={},
+    ).to_dict()
+    # Equal but distinct string objects, as separate json.loads calls produce.
+    first = {**row, "source": "".join(["craw", "ler"]), "signal_id": "".join(["s_", "intern"])}
+    second = {**row, "source": "".join(["crawl", "er"]), "signal_id": "".join(["s_i", "ntern"])}
+    assert first["source"] is not second["source"]
+
+    for a, b in (
+        (SignalEnvelope.from_dict(first), SignalEnvelope.from_dict(second)),
+        tuple(SignalEnvelope.from_dicts([first, second])),
+    ):
+        assert a == b
+        assert a.source is b.source
+        assert a.payload_type is b.payload_type
+        # High-cardinality fields are left alone.
+        assert a.signal_id is not b.signal_id
+
+    emission = EmissionEnvelope(
+        emission_id="e_intern", timestamp=NOW, emission_type="ScoreEmitted", payload={}, caused_by="s_1"
+    ).to_dict()
+    first_emission = EmissionEnvelope.from_dict({**emission, "emission_type": "".join(["Score", "Emitted"])})
+    second_emission = EmissionEnvelope.from_dict({**emission, "emission_type": "".join(["ScoreEm", "itted"])})
+    assert first_emission.emission_type is second_emission.emission_type
+
+
+def test_trusted_decode_matches_validated_decode() -> None:
+    signal = SignalEnvelope(
+        signal_id="s_trusted",
+        timestamp=NOW,
+        source="test",
+        payload_type="Custom",
+        payload={"nested": [1, 2]},
+        entity_refs=(EntityRef(ref_type="entity_id", value="ent_1"),),
+        trace=TraceContext(trace_id="tr_1", caused_by=("s_0",)),
+    )
+    task = Task(
+        task_id="t_1",
+        task_type="enrich",
+        created_at=NOW,
+        priority=3,
+        entity_ref=EntityRef(ref_type="entity_id", value="ent_1"),
+        context={"a": 1},
+    )
+    for instance in (signal, task):
+        data = instance.to_dict()
+        rebuilt = type(instance).from_dict(data, trusted=True)
+        assert rebuilt == instance
+        assert type(rebuilt) is type(instance)
+        assert rebuilt.to_dict() == data
+
+    rebuilt = SignalEnvelope.from_dicts([signal.to_dict()] * 3, trusted=True)
+    assert rebuilt == [signal] * 3
+    assert isinstance(rebuilt[0].entity_refs, tuple)
+    assert rebuilt[0].timestamp.tzinfo is timezone.utc
+    assert list(SignalEnvelope.from_dicts([signal.to_dict()], lazy=True, trusted=True)) == [signal]
+
+    with pytest.raises(ValueError, match="Missing required field: signal_id"):
+        SignalEnvelope.from_dict({"timestamp": "2026-01-01T12:00:00Z"}, trusted=True)
+
+
+def test_trusted_check_rate_samples_against_validated_decode() -> None:
+    from metaspn_schemas.utils import set_trusted_check_rate
+
+    ref = EntityRef(ref_type="entity_id", value="ent_1")
+    data = Task(task_id="t_1", task_type="enrich", created_at=NOW, priority=3, entity_ref=ref).to_dict()
+    # Not canonical: the validating path casts priority to int, the trusted path keeps the str.
+    data["priority"] = "3"
+    assert Task.from_dict(data, trusted=True).priority == "3"
+
+    with pytest.raises(ValueError):
+        set_trusted_check_rate(1.5)
+    set_trusted_check_rate(1.0)
+    try:
+        with pytest.raises(AssertionError, match="trusted decode of Task differs"):
+            Task.from_dict(data, trusted=True)
+        with pytest.raises(AssertionError, match="trusted decode of Task differs"):
+            Task.from_dicts([data], trusted=True)
+        assert Task.from_dict({**data, "priority": 3}, trusted=True).priority == 3
+    finally:
+        set_trusted_check_rate(0)
+
+
+def test_union_decoding_matches_trying_each_option() -> None:
+    from typing import Any, Optional, Union, get_args
+
+    from metaspn_schemas.utils.serde import _coerce_value, _decoder_for
+
+    def try_each_option(hint: Any, value: Any) -> Any:
+        if value is None:
+            return None
+        last_error: Exception | None = None
+        for option in get_args(hint):
+            if option is type(None):
+                continue
+            try:
+                return _decoder_for(option)(value)
+            except Exception as err:  # noqa: BLE001
+                last_error = err
+        assert last_error is not None
+        raise last_error
+
+    def outcome(decode: Any, hint: Any, value: Any) -> Any:
+        try:
+            result = decode(hint, value)
+        except Exception as err:  # noqa: BLE001
+            return ("error", type(err), str(err))
+        return ("ok", type(result), result)
+
+    hints = [
+        Optional[float],
+        Optional[datetime],
+        Optional[TraceContext],
+        Union[datetime, str],
+        Union[datetime, int],
+        Union[int, str],
+        Union[float, datetime, None],
+        Union[TraceContext, dict[str, int]],
+        Union[tuple[int, ...], str],
+        Union[dict[str, int], list[int]],
+    ]
+    values = [
+        None,
+        0,
+        True,
+        1.5,
+        "7",
+        "abc",
+        "2026-01-01T12:00:00Z",
+        NOW,
+        [1, "2"],
+        ("x",),
+        {"trace_id": "tr_1"},
+        {"a": "1"},
+        {"caused_by": []},
+        TraceContext(trace_id="tr_2"),
+    ]
+    for hint in hints:
+        for value in values:
+            expected = outcome(try_each_option, hint, value)
+            assert outcome(_coerce_value, hint, value) == expected, (hint, value)
+            # The second call goes through the cached per-type route.
+            assert outcome(_coerce_value, hint, value) == expected, (hint, value)
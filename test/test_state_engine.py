@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from metaspn_schemas import GateTransitionAttempt, compile_state_machine
+from metaspn_schemas.state_engine import CompiledStateMachine
+from metaspn_schemas.state_machine import StateMachineConfig, StateTransitionRule
+
+NOW = datetime(2026, 2, 6, 0, 0, tzinfo=timezone.utc)
+
+CONFIG = StateMachineConfig(
+    config_id="cfg_1",
+    machine_type="default",
+    initial_state="seen",
+    states=("seen", "queued", "sent", "held"),
+    terminal_states=("sent",),
+    transitions=(
+        StateTransitionRule("seen", "queued", "route"),
+        StateTransitionRule("queued", "sent", "dispatch", guard="has_budget"),
+        StateTransitionRule("queued", "held", "dispatch", guard="is_vip"),
+        StateTransitionRule("held", "queued", "release"),
+    ),
+)
+
+GUARDS = {
+    "has_budget": lambda context: context.get("budget", 0) > 0,
+    "is_vip": lambda context: bool(context.get("vip")),
+}
+
+
+def test_step_follows_rules_and_guards() -> None:
+    engine = compile_state_machine(CONFIG, GUARDS)
+
+    assert engine.step("seen", "route") == "queued"
+    assert engine.step("queued", "dispatch", {"budget": 1}) == "sent"
+    assert engine.step("queued", "dispatch", {"vip": True}) == "held"
+    assert engine.step("queued", "dispatch") is None
+    assert engine.step("seen", "dispatch") is None
+    assert engine.step("nowhere", "route") is None
+
+
+def test_step_code_matches_step() -> None:
+    engine = compile_state_machine(CONFIG, GUARDS)
+
+    for state in engine.states:
+        for event in engine.events:
+            expected = engine.step(state, event, {"budget": 1})
+            code = engine.step_code(engine.state_codes[state], engine.event_codes[event], {"budget": 1})
+            assert (engine.states[code] if code >= 0 else None) == expected
+
+
+def test_step_code_rejects_out_of_range_codes() -> None:
+    engine = compile_state_machine(CONFIG, GUARDS)
+    route = engine.event_codes["route"]
+    seen = engine.state_codes["seen"]
+
+    # An event code one past the end would otherwise read the next state's row.
+    for event_code in (len(engine.events), -1):
+        with pytest.raises(ValueError, match="event code out of range"):
+            engine.step_code(seen, event_code)
+    for state_code in (len(engine.states), -1):
+        with pytest.raises(ValueError, match="state code out of range"):
+            engine.step_code(state_code, route)
+
+    # compile_state_machine rejects such configs, but the engine can be built directly.
+    no_events = CompiledStateMachine(
+        StateMachineConfig(
+            config_id="cfg_idle",
+            machine_type="default",
+            initial_state="seen",
+            states=("seen", "sent"),
+            terminal_states=("sent",),
+            transitions=(),
+        ),
+        {},
+    )
+    assert no_events.events == ()
+    with pytest.raises(ValueError, match="event code out of range for 0 events"):
+        no_events.step_code(0, 0)
+
+
+def test_step_many_reports_rejections() -> None:
+    engine = compile_state_machine(CONFIG, GUARDS)
+
+    states, rejected = engine.step_many(
+        ["e1", "e2", "e3", "e4"],
+        ["seen", "queued", "queued", "sent"],
+        ["route", "dispatch", "dispatch", "route"],
+        contexts=[None, {"budget": 0}, {"budget": 5}, None],
+        gate_name="outreach",
+        attempted_at=NOW,
+    )
+
+    assert states == ["queued", "queued", "sent", "sent"]
+    assert [attempt.entity_id for attempt in rejected] == ["e2", "e4"]
+    assert all(isinstance(attempt, GateTransitionAttempt) and not attempt.allowed for attempt in rejected)
+    assert [attempt.reason_code for attempt in rejected] == ["guard_rejected", "no_transition"]
+    assert rejected[0].to_state == "held"
+    assert rejected[0].context == {"event": "dispatch", "guard": "is_vip", "budget": "0"}
+    assert rejected[1].gate_name == "outreach"
+    assert rejected[1].attempted_at == NOW
+
+
+def test_compile_rejects_invalid_configs_and_unknown_guards() -> None:
+    with pytest.raises(ValueError, match="unregistered guards: has_budget,is_vip"):
+        compile_state_machine(CONFIG)
+    with pytest.raises(ValueError, match="initial_state must exist"):
+        compile_state_machine(
+            {
+                "config_id": "cfg_bad",
+                "machine_type": "default",
+                "initial_state": "missing",
+                "states": ["seen"],
+                "transitions": [{"from_state": "seen", "to_state": "seen", "event": "noop"}],
+            }
+        )
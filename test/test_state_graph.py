@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+from metaspn_schemas import analyze_state_machine, shortest_event_path
+from metaspn_schemas.state_machine import StateMachineConfig, StateTransitionRule
+from metaspn_schemas.utils.hashing import content_hash
+
+CONFIG = StateMachineConfig(
+    config_id="cfg_graph",
+    machine_type="default",
+    initial_state="seen",
+    states=("seen", "queued", "sent", "held", "orphan", "stuck"),
+    terminal_states=("sent",),
+    transitions=(
+        StateTransitionRule("seen", "queued", "route"),
+        StateTransitionRule("queued", "held", "hold"),
+        StateTransitionRule("held", "queued", "release"),
+        StateTransitionRule("queued", "sent", "dispatch"),
+        StateTransitionRule("queued", "queued", "retry"),
+        StateTransitionRule("orphan", "seen", "adopt"),
+        StateTransitionRule("seen", "stuck", "jam"),
+    ),
+)
+
+
+def test_analysis_reports_reachability_dead_ends_and_cycles() -> None:
+    analysis = analyze_state_machine(CONFIG)
+
+    assert analysis.reachable_states == ("held", "queued", "seen", "sent", "stuck")
+    assert analysis.unreachable_states == ("orphan",)
+    assert analysis.dead_end_states == ("stuck",)
+    assert analysis.cycles == (("held", "queued"),)
+    assert analysis.content_hash == content_hash(CONFIG)
+
+
+def test_analysis_is_cached_per_config_id_and_content() -> None:
+    first = analyze_state_machine(CONFIG)
+    assert analyze_state_machine(CONFIG.to_dict()) is first
+
+    changed = replace(CONFIG, transitions=CONFIG.transitions[:-1])
+    assert analyze_state_machine(changed) is not first
+    assert analyze_state_machine(changed).dead_end_states == ("stuck",)
+
+
+def test_self_loop_only_counts_as_cycle() -> None:
+    config = replace(CONFIG, transitions=(StateTransitionRule("seen", "seen", "retry"),))
+
+    assert analyze_state_machine(config).cycles == (("seen",),)
+
+
+def test_shortest_event_path() -> None:
+    assert shortest_event_path(CONFIG, "seen", "sent") == ("route", "dispatch")
+    assert shortest_event_path(CONFIG, "held", "sent") == ("release", "dispatch")
+    assert shortest_event_path(CONFIG, "seen", "seen") == ()
+    assert shortest_event_path(CONFIG, "sent", "seen") is None
+
+
+def test_graph_cache_is_safe_under_concurrent_eviction(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    from concurrent.futures import ThreadPoolExecutor
+
+    from metaspn_schemas import state_graph
+
+    monkeypatch.setattr(state_graph, "STATE_GRAPH_CACHE_SIZE", 2)
+    configs = [replace(CONFIG, config_id=f"cfg_{index}") for index in range(16)]
+
+    def analyze(offset: int) -> list[str]:
+        return [analyze_state_machine(configs[(offset + step) % 16]).config_id for step in range(200)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(analyze, range(8)))
+    for offset, ids in enumerate(results):
+        assert ids == [f"cfg_{(offset + step) % 16}" for step in range(200)]
+    assert len(state_graph._GRAPHS) <= 2
+    state_graph.clear_state_graph_cache()
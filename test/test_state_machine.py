@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
+import pytest
+
 from metaspn_schemas.state_machine import (
     StateMachineConfig,
     StateTransitionRule,
@@ -61,3 +63,70 @@ def test_validate_state_machine_config_failure() -> None:
     assert ok is False
     assert "initial_state must exist in states" in errors
     assert "transition to_state not in states: done" in errors
+
+
+def test_parse_state_machine_config_is_cached_by_content() -> None:
+    from metaspn_schemas import (
+        clear_state_machine_config_cache,
+        set_state_machine_config_cache_size,
+        state_machine_config_cache_info,
+    )
+
+    payload = {
+        "machine_id": "cfg_cache",
+        "machine_name": "default",
+        "start_state": "seen",
+        "state_nodes": ["seen", "sent"],
+        "transitions": [{"from": "seen", "to": "sent", "event_name": "dispatch"}],
+    }
+    clear_state_machine_config_cache()
+
+    first = parse_state_machine_config(payload)
+    reordered = parse_state_machine_config(dict(reversed(list(payload.items()))))
+    assert reordered is first
+    assert validate_state_machine_config(payload) is validate_state_machine_config(first)
+    info = state_machine_config_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+    set_state_machine_config_cache_size(0)
+    try:
+        assert parse_state_machine_config(payload) is not first
+        assert parse_state_machine_config(payload) == first
+        assert state_machine_config_cache_info().currsize == 0
+    finally:
+        set_state_machine_config_cache_size(128)
+
+
+def test_cached_config_metadata_cannot_leak_between_callers() -> None:
+    import copy
+    import json
+    import pickle
+
+    from metaspn_schemas import clear_state_machine_config_cache
+
+    payload = {
+        "config_id": "cfg_meta",
+        "machine_type": "default",
+        "initial_state": "seen",
+        "states": ["seen", "sent"],
+        "transitions": [{"from_state": "seen", "to_state": "sent", "event": "dispatch"}],
+        "metadata": {"owner": "ops"},
+    }
+    clear_state_machine_config_cache()
+
+    first = parse_state_machine_config(payload)
+    with pytest.raises(TypeError, match="read-only"):
+        first.metadata["owner"] = "someone else"
+    with pytest.raises(TypeError, match="read-only"):
+        first.metadata.update(extra="1")
+    assert parse_state_machine_config(payload).metadata == {"owner": "ops"}
+
+    # Read-only metadata still serializes and copies like a plain dict.
+    assert first.to_dict()["metadata"] == {"owner": "ops"}
+    assert json.loads(first.to_json())["metadata"] == {"owner": "ops"}
+    assert type(first).from_binary(first.to_binary()) == first
+    assert pickle.loads(pickle.dumps(first)) == first
+    assert copy.deepcopy(first) == first
+    editable = dict(first.metadata)
+    editable["owner"] = "someone else"
+    assert parse_state_machine_config(payload).metadata == {"owner": "ops"}
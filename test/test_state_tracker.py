@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from metaspn_schemas import EntityStateSnapshot, EntityStateTracker, GateTransitionAttempt
+from metaspn_schemas.state_machine import StateMachineConfig, StateTransitionRule
+
+NOW = datetime(2026, 2, 6, 0, 0, tzinfo=timezone.utc)
+
+CONFIG = StateMachineConfig(
+    config_id="cfg_1",
+    machine_type="default",
+    initial_state="seen",
+    states=("seen", "queued", "sent"),
+    terminal_states=("sent",),
+    transitions=(
+        StateTransitionRule("seen", "queued", "route"),
+        StateTransitionRule("queued", "sent", "dispatch"),
+    ),
+)
+
+
+def attempt(index: int, entity_id: str, from_state: str, to_state: str, allowed: bool = True) -> GateTransitionAttempt:
+    return GateTransitionAttempt(
+        attempt_id=f"att_{index}",
+        gate_name="outreach",
+        entity_id=entity_id,
+        from_state=from_state,
+        to_state=to_state,
+        attempted_at=NOW + timedelta(seconds=index // 2),
+        allowed=allowed,
+    )
+
+
+STREAM = [
+    attempt(0, "e1", "seen", "queued"),
+    attempt(1, "e2", "seen", "queued"),
+    attempt(2, "e1", "queued", "sent", allowed=False),
+    attempt(3, "e1", "queued", "sent"),
+    attempt(4, "e2", "queued", "sent"),
+    attempt(5, "e3", "seen", "queued"),
+]
+
+
+def test_tracker_folds_objects_and_dicts_identically() -> None:
+    from_objects = EntityStateTracker(CONFIG)
+    from_dicts = EntityStateTracker(CONFIG)
+
+    assert from_objects.consume(STREAM) == 5
+    assert from_dicts.consume(item.to_dict() for item in STREAM) == 5
+    assert dict(from_objects.items()) == dict(from_dicts.items()) == {"e1": "sent", "e2": "sent", "e3": "queued"}
+    assert from_objects.counts() == {"queued": 1, "sent": 2}
+    assert from_dicts.last_attempt_id == "att_5"
+    assert from_dicts.last_attempted_at == NOW + timedelta(seconds=2)
+    assert from_objects.state_of("unknown") == "seen"
+
+
+def test_snapshot_restore_resumes_after_last_attempt() -> None:
+    tracker = EntityStateTracker(CONFIG)
+    tracker.consume(STREAM[:3])
+    snapshot = EntityStateSnapshot.from_dict(tracker.snapshot(taken_at=NOW).to_dict())
+
+    restored = EntityStateTracker.restore(CONFIG, snapshot)
+    # Replaying the whole stream only applies what came after att_2 (same timestamp as att_3).
+    assert restored.consume(item.to_dict() for item in STREAM) == 3
+
+    full = EntityStateTracker(CONFIG)
+    full.consume(STREAM)
+    assert dict(restored.items()) == dict(full.items())
+    assert restored.applied_count == full.applied_count
+
+
+def test_restore_resumes_from_the_new_tail_only() -> None:
+    tracker = EntityStateTracker(CONFIG)
+    tracker.consume(STREAM[:3])
+    snapshot = EntityStateSnapshot.from_dict(tracker.snapshot(taken_at=NOW).to_dict())
+    # att_2 is the only consumed attempt at the last timestamp.
+    assert snapshot.last_attempt_ids == ("att_2",)
+
+    restored = EntityStateTracker.restore(CONFIG, snapshot)
+    # att_3 shares att_2's attempted_at but was never applied.
+    assert restored.consume(item.to_dict() for item in STREAM[3:]) == 3
+
+    full = EntityStateTracker(CONFIG)
+    full.consume(STREAM)
+    assert dict(restored.items()) == dict(full.items())
+    assert restored.applied_count == full.applied_count
+
+    # A snapshot taken mid-instant records every attempt applied at it.
+    partial = EntityStateTracker(CONFIG)
+    partial.consume(STREAM[:4])
+    assert partial.snapshot(taken_at=NOW).last_attempt_ids == ("att_2", "att_3")
+    resumed = EntityStateTracker.restore(CONFIG, partial.snapshot(taken_at=NOW))
+    assert resumed.consume(STREAM) == 2
+    assert dict(resumed.items()) == dict(full.items())
+
+
+def test_tracker_rejects_inconsistent_records() -> None:
+    with pytest.raises(ValueError, match="unknown state"):
+        EntityStateTracker(CONFIG).apply(attempt(0, "e1", "seen", "nowhere"))
+    with pytest.raises(ValueError, match="expects e1 in queued"):
+        EntityStateTracker(CONFIG, strict=True).apply(attempt(0, "e1", "queued", "sent"))
+    with pytest.raises(ValueError, match="snapshot is for config"):
+        EntityStateTracker.restore(CONFIG, EntityStateSnapshot(config_id="other", taken_at=NOW, states={}))
+
+
+def test_error_mid_batch_keeps_applied_changes_counted() -> None:
+    tracker = EntityStateTracker(CONFIG)
+    with pytest.raises(ValueError, match="unknown state"):
+        tracker.consume([*STREAM[:2], attempt(2, "e1", "queued", "nowhere"), *STREAM[3:]])
+
+    assert dict(tracker.items()) == {"e1": "queued", "e2": "queued"}
+    assert tracker.applied_count == 2
+    # The rejected record is not marked consumed, so resuming after fixing the input skips nothing.
+    assert tracker.last_attempt_id == "att_1"
+    resumed = EntityStateTracker.restore(CONFIG, tracker.snapshot(taken_at=NOW))
+    assert resumed.consume(STREAM) == 3
+
+    full = EntityStateTracker(CONFIG)
+    full.consume(STREAM)
+    assert dict(resumed.items()) == dict(full.items())
+    assert resumed.applied_count == full.applied_count
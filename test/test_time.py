@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from metaspn_schemas.utils.time import (
+    clear_timestamp_caches,
+    datetime_to_str,
+    set_timestamp_cache_size,
+    str_to_datetime,
+)
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(params=[4096, 0], ids=["cached", "uncached"])
+def cache_size(request: pytest.FixtureRequest):
+    set_timestamp_cache_size(request.param)
+    yield request.param
+    set_timestamp_cache_size(4096)
+
+
+@pytest.mark.usefixtures("cache_size")
+def test_canonical_timestamps_round_trip() -> None:
+    precise = NOW.replace(microsecond=123456)
+
+    assert datetime_to_str(NOW) == "2026-01-01T12:00:00Z"
+    assert datetime_to_str(precise) == "2026-01-01T12:00:00.123456Z"
+    assert str_to_datetime("2026-01-01T12:00:00Z") == NOW
+    assert str_to_datetime("2026-01-01T12:00:00.123456Z") == precise
+    assert str_to_datetime("2026-01-01T12:00:00Z").tzinfo is timezone.utc
+
+
+@pytest.mark.usefixtures("cache_size")
+def test_non_canonical_timestamps_use_general_path() -> None:
+    local = datetime(2026, 1, 1, 4, 0, tzinfo=timezone(timedelta(hours=-8)))
+
+    assert datetime_to_str(local) == "2026-01-01T12:00:00Z"
+    assert datetime_to_str(datetime(2026, 1, 1, 12, 0)) == "2026-01-01T12:00:00Z"
+    assert str_to_datetime("2026-01-01T04:00:00-08:00") == NOW
+    assert str_to_datetime("2026-01-01T04:00:00-08:00").tzinfo == timezone.utc
+    assert str_to_datetime("2026-01-01T12:00:00") == NOW
+    with pytest.raises(ValueError):
+        str_to_datetime("not-a-timestampZ")
+
+
+def test_timestamp_cache_reuses_parsed_values() -> None:
+    clear_timestamp_caches()
+
+    first = str_to_datetime("2026-02-07T16:00:00Z")
+    second = str_to_datetime("2026-02-07T16:00:00Z")
+
+    assert first is second
+    with pytest.raises(ValueError):
+        set_timestamp_cache_size(-1)